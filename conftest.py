@@ -0,0 +1 @@
+pytest_plugins = ["zamzar.testing.pytest_plugin"]
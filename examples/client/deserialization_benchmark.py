@@ -0,0 +1,106 @@
+"""
+Compares the time taken to list a page of jobs (or files) with the default ZamzarClient, with fast deserialization
+(see ZamzarClient.fast_deserialization), with fast deserialization and lazy timestamps (see
+ZamzarClient.lazy_timestamps), and with lean records (see ZamzarClient.lean_models). Every request is answered with the
+same page by a transport that makes no HTTP requests, so that only the client's own work is measured:
+
+    python examples/client/deserialization_benchmark.py --payload files --items 100 --iterations 500
+"""
+import argparse
+import io
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+import urllib3
+
+from zamzar import ZamzarClient
+from zamzar.facade.transport import Transport
+
+
+class PageTransport(Transport):
+    """Answers every request with the same (JSON) page, without making any HTTP requests."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def send(self, method, url, body, headers, timeout, preload_content) -> urllib3.BaseHTTPResponse:
+        return urllib3.HTTPResponse(
+            body=io.BytesIO(self.body),
+            status=200,
+            headers={"Content-Type": "application/json"},
+            preload_content=preload_content,
+        )
+
+
+def file(file_id: int, name: str = "example.docx", format_name: str = "docx") -> Dict[str, Any]:
+    return {"id": file_id, "name": name, "size": 1024, "format": format_name, "created_at": "2022-01-01T14:15:22Z"}
+
+
+def job(job_id: int) -> Dict[str, Any]:
+    return {
+        "id": job_id,
+        "key": "apikey",
+        "status": "successful",
+        "sandbox": False,
+        "created_at": "2022-01-01T14:15:22Z",
+        "finished_at": "2022-01-01T14:15:42Z",
+        "source_file": file(job_id * 10, "example.docx", "docx"),
+        "target_files": [file(job_id * 10 + 1, "example.pdf", "pdf")],
+        "target_format": "pdf",
+        "credit_cost": 1,
+        "exports": [],
+    }
+
+
+PAYLOADS: Dict[str, Callable[[int], Dict[str, Any]]] = {"jobs": job, "files": file}
+
+
+def page(payload: str, items: int) -> bytes:
+    paging = {"total_count": items, "first": 1, "last": items, "limit": items}
+    return json.dumps({"data": [PAYLOADS[payload](i) for i in range(1, items + 1)], "paging": paging}).encode("utf-8")
+
+
+def client(body: bytes, **options: bool) -> ZamzarClient:
+    zamzar = ZamzarClient("api-key", host="http://localhost/v1", transport=PageTransport(body))
+    for option, enabled in options.items():
+        setattr(zamzar, option, enabled)
+    return zamzar
+
+
+def benchmark(zamzar: ZamzarClient, payload: str, items: int, iterations: int) -> List[float]:
+    list_page: Callable[..., Any] = zamzar.jobs.list if payload == "jobs" else zamzar.files.list
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        list_page(limit=items)
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payload", choices=PAYLOADS.keys(), default="jobs")
+    parser.add_argument("--items", type=int, default=100, help="the number of jobs (or files) in the page")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    body = page(args.payload, args.items)
+    clients: Dict[str, ZamzarClient] = {
+        "default": client(body),
+        "fast": client(body, fast_deserialization=True),
+        "fast+lazy": client(body, fast_deserialization=True, lazy_timestamps=True),
+        "lean": client(body, lean_models=True),
+    }
+
+    print(f"{args.iterations} x list a page of {args.items} {args.payload} ({len(body)} bytes):")
+    for name, zamzar in clients.items():
+        benchmark(zamzar, args.payload, args.items, 10)  # warm up (e.g., compile the types)
+        durations = benchmark(zamzar, args.payload, args.items, args.iterations)
+        print(f"{name:<10} mean (ms)={statistics.mean(durations) * 1000:9.3f}  "
+              f"p50 (ms)={statistics.median(durations) * 1000:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
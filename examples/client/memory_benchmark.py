@@ -0,0 +1,115 @@
+"""
+Compares the memory (as measured by tracemalloc) held per job when listing pages of jobs, and the transient memory used
+(beyond the jobs themselves) whilst listing each page, with the default ZamzarClient, with fast deserialization (see
+ZamzarClient.fast_deserialization), and with lean records (see ZamzarClient.lean_models). Every request is answered with
+the same page by a transport that makes no HTTP requests:
+
+    python examples/client/memory_benchmark.py --items 100 --pages 100
+"""
+import argparse
+import io
+import json
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+import urllib3
+
+from zamzar import ZamzarClient
+from zamzar.facade.transport import Transport
+
+
+class PageTransport(Transport):
+    """Answers every request with the same (JSON) page, without making any HTTP requests."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def send(self, method, url, body, headers, timeout, preload_content) -> urllib3.BaseHTTPResponse:
+        return urllib3.HTTPResponse(
+            body=io.BytesIO(self.body),
+            status=200,
+            headers={"Content-Type": "application/json"},
+            preload_content=preload_content,
+        )
+
+
+def file(file_id: int, name: str, format_name: str) -> Dict[str, Any]:
+    return {"id": file_id, "name": name, "size": 1024, "format": format_name, "created_at": "2022-01-01T14:15:22Z"}
+
+
+def job(job_id: int) -> Dict[str, Any]:
+    return {
+        "id": job_id,
+        "key": "apikey",
+        "status": "successful",
+        "sandbox": False,
+        "created_at": "2022-01-01T14:15:22Z",
+        "finished_at": "2022-01-01T14:15:42Z",
+        "source_file": file(job_id * 10, "example.docx", "docx"),
+        "target_files": [file(job_id * 10 + 1, "example.pdf", "pdf")],
+        "target_format": "pdf",
+        "credit_cost": 1,
+        "exports": [],
+    }
+
+
+def page(items: int) -> bytes:
+    paging = {"total_count": items, "first": 1, "last": items, "limit": items}
+    return json.dumps({"data": [job(i) for i in range(1, items + 1)], "paging": paging}).encode("utf-8")
+
+
+def client(body: bytes, **options: bool) -> ZamzarClient:
+    zamzar = ZamzarClient("api-key", host="http://localhost/v1", transport=PageTransport(body))
+    for option, enabled in options.items():
+        setattr(zamzar, option, enabled)
+    return zamzar
+
+
+def benchmark(zamzar: ZamzarClient, items: int, pages: int) -> Dict[str, float]:
+    """Lists the given number of pages, keeping the jobs (only) of each, as when listing many jobs."""
+    jobs: List[object] = []
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    for _ in range(pages):
+        jobs.extend(zamzar.jobs.list(limit=items).items)
+    elapsed = time.perf_counter() - started
+    held, _ = tracemalloc.get_traced_memory()
+    held_per_job = held / len(jobs)
+
+    # Measure the memory used (and then released) whilst listing one more page
+    tracemalloc.reset_peak()
+    jobs.extend(zamzar.jobs.list(limit=items).items)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "bytes/job": held_per_job,
+        "transient (KiB)/page": (peak - after) / 1024,
+        "ms/page": elapsed * 1000 / pages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100, help="the number of jobs in each page")
+    parser.add_argument("--pages", type=int, default=100)
+    args = parser.parse_args()
+
+    body = page(args.items)
+    clients: Dict[str, ZamzarClient] = {
+        "default": client(body),
+        "fast": client(body, fast_deserialization=True),
+        "lean": client(body, lean_models=True),
+    }
+
+    print(f"{args.pages} pages of {args.items} jobs ({len(body)} bytes per page):")
+    for name, zamzar in clients.items():
+        benchmark(zamzar, args.items, 1)  # warm up (e.g., compile the types)
+        results = benchmark(zamzar, args.items, args.pages)
+        print(f"{name:<10} " + "  ".join(f"{key}={value:9.1f}" for key, value in results.items()))
+
+
+if __name__ == "__main__":
+    main()
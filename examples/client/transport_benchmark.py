@@ -0,0 +1,98 @@
+"""
+Compares the throughput and latency of the available transports when polling a job from many threads at once.
+
+By default, runs against an in-process mock of the Zamzar API (see zamzar.testing); pass --host to run against another
+mock (e.g., `python -m zamzar.testing.mock_server --port 8080` in a separate process):
+
+    python examples/client/transport_benchmark.py --host http://localhost:8080/v1 --requests 2000 --concurrency 64
+
+Note that the mock speaks only HTTP/1.1, and that httpx negotiates HTTP/2 only over https:// (via TLS ALPN), so against
+the mock (or any http:// host) both transports use HTTP/1.1, and the comparison is of the clients alone, not of HTTP/2
+multiplexing; pass the https:// URL of a server that supports HTTP/2 (e.g., the real API) to measure that. The
+protocol that each transport actually used is reported alongside its results.
+"""
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from zamzar import ZamzarClient
+from zamzar.facade import ZamzarClientFactory
+from zamzar.facade.transport import HttpxTransport
+from zamzar.testing import MockZamzarServer
+
+
+def benchmark(zamzar: ZamzarClient, job_id: int, requests: int, concurrency: int) -> Dict[str, float]:
+    def poll(_) -> float:
+        started = time.perf_counter()
+        zamzar.jobs.find(job_id)
+        return time.perf_counter() - started
+
+    poll(None)  # warm up (e.g., establish a connection)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        durations = sorted(executor.map(poll, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests/s": requests / elapsed,
+        "p50 (ms)": statistics.median(durations) * 1000,
+        "p99 (ms)": durations[int(len(durations) * 0.99) - 1] * 1000,
+    }
+
+
+def protocol(zamzar: ZamzarClient, host: str, api_key: str, job_id: int) -> str:
+    """Returns the version of HTTP with which the given client's transport sends requests to the given host."""
+    headers = {"Authorization": f"Bearer {api_key}"}
+    response = zamzar.pool_manager.request("GET", f"{host}/jobs/{job_id}", headers=headers)
+    return "HTTP/2" if response.version == 20 else "HTTP/1.1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=os.environ.get("API_URL"))
+    parser.add_argument("--api-key", default=os.environ.get("API_KEY", "GiVUYsF4A8ssq93FR48H"))
+    parser.add_argument("--job-id", type=int, default=1)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--maxsize", type=int, default=10, help="the maximum number of connections per transport")
+    args = parser.parse_args()
+
+    server = MockZamzarServer().start() if args.host is None else None
+    if server is not None:
+        args.host = server.url
+
+    transports: Dict[str, Callable[[], ZamzarClient]] = {
+        "urllib3": lambda: ZamzarClientFactory(host=args.host, maxsize=args.maxsize, block=True).create(args.api_key),
+        "httpx": lambda: ZamzarClient(
+            args.api_key,
+            host=args.host,
+            transport=HttpxTransport(max_connections=args.maxsize),
+        ),
+    }
+
+    rows: List[str] = []
+    for name, create in transports.items():
+        try:
+            zamzar = create()
+        except ImportError as e:
+            rows.append(f"{name:<10} skipped ({e})")
+            continue
+        results = benchmark(zamzar, args.job_id, args.requests, args.concurrency)
+        rows.append(f"{name:<10} {protocol(zamzar, args.host, args.api_key, args.job_id):<9} "
+                    + "  ".join(f"{key}={value:9.1f}" for key, value in results.items()))
+        zamzar.pool_manager.clear()
+
+    if server is not None:
+        server.stop()
+
+    print(f"{args.requests} x GET /jobs/{args.job_id} with {args.concurrency} threads:")
+    print("\n".join(rows))
+    if not args.host.startswith("https://"):
+        print("Note: httpx negotiates HTTP/2 only over https://, so these results are for HTTP/1.1 (see --help)")
+
+
+if __name__ == "__main__":
+    main()
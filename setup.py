@@ -34,6 +34,10 @@ REQUIRES = [
     "pydantic >= 2.5.3",
     "typing-extensions >= 4.7.1",
 ]
+EXTRAS_REQUIRE = {
+    # For zamzar.facade.transport.HttpxTransport
+    "httpx": ["httpx[http2] >= 0.27.0"],
+}
 
 setup(
     name=NAME,
@@ -45,6 +49,7 @@ setup(
     url="https://github.com/zamzar/zamzar-python",
     keywords=["Zamzar", "Zamzar API", "File Conversion", "File Utilities", "Convert"],
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     packages=find_packages(exclude=["test", "tests"]),
     include_package_data=True,
     license="MIT",
@@ -1,4 +1,5 @@
 import json
+import os
 from http.client import HTTPMessage
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
@@ -7,12 +8,13 @@ import pytest
 import urllib3
 
 from test.facade.tracking_pool_manager import TrackingPoolManager
-from zamzar import ZamzarClient
+from zamzar import AsyncZamzarClient, ZamzarClient
 
 
 @pytest.fixture()
-def test_host() -> str:
-    return "http://mock:8080/v1"
+def test_host(request) -> str:
+    # Test against the zamzar-mock container if configured (see docker-compose.yml), else against an in-process mock
+    return os.environ.get("API_URL") or request.getfixturevalue("zamzar_mock_server").url
 
 
 @pytest.fixture()
@@ -25,6 +27,11 @@ def zamzar(api_key, test_host) -> ZamzarClient:
     return ZamzarClient(api_key=api_key, host=test_host)
 
 
+@pytest.fixture
+def zamzar_async(api_key, test_host) -> AsyncZamzarClient:
+    return AsyncZamzarClient(api_key=api_key, host=test_host)
+
+
 @pytest.fixture
 def zamzar_tracked(zamzar) -> ZamzarClient:
     zamzar.pool_manager = TrackingPoolManager(zamzar.pool_manager)
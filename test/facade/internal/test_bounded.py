@@ -0,0 +1,34 @@
+import itertools
+import threading
+import time
+
+from zamzar.facade._internal import map_bounded
+
+
+class TestBounded:
+    def test_maps_every_item(self):
+        """Test that every item is mapped, whatever the order in which they complete."""
+        assert list(range(0, 20, 2)) == sorted(map_bounded(lambda i: 2 * i, range(10), max_in_flight=3))
+
+    def test_bounds_items_in_flight(self):
+        """Test that no more than max_in_flight items are being mapped at once."""
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def track(_):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+        list(map_bounded(track, range(20), max_in_flight=4))
+        assert 4 == peak[0]
+
+    def test_consumes_items_lazily(self):
+        """Test that items are only taken from the iterable as workers become free."""
+        results = map_bounded(lambda i: i, itertools.count(), max_in_flight=2)
+        assert next(results) in (0, 1)
+        results.close()
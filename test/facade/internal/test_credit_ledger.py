@@ -0,0 +1,57 @@
+import threading
+from datetime import timedelta
+from typing import List, Optional
+
+from zamzar.facade._internal import CreditLedger, CreditReading
+
+
+def credits(reading: Optional[CreditReading]) -> Optional[int]:
+    return reading.credits if reading is not None else None
+
+
+class TestCreditLedger:
+    def test_ignores_missing_and_invalid_values(self):
+        """Test that responses without a (numeric) header are ignored."""
+        ledger = CreditLedger("Credits")
+        ledger.record(None)
+        ledger.record("lots")
+        ledger.record("--5")
+        ledger.record("\u00b2")
+        assert ledger.latest is None
+        assert ledger.latest_on_this_thread is None
+
+    def test_keeps_lowest_recent_value(self):
+        """Test that an out-of-order (higher) value does not replace a recent lower value."""
+        ledger = CreditLedger("Credits")
+        ledger.record("10")
+        ledger.record("8")
+        ledger.record("9")
+        assert 8 == credits(ledger.latest)
+        assert 9 == credits(ledger.latest_on_this_thread)
+
+    def test_replaces_stale_value(self):
+        """Test that a higher value replaces the lowest value once it is stale (e.g., after a top up)."""
+        ledger = CreditLedger("Credits", stale_after=timedelta(0))
+        ledger.record("8")
+        ledger.record("100")
+        assert 100 == credits(ledger.latest)
+
+    def test_has_per_thread_views(self):
+        """Test that each thread sees the value reported to it."""
+        ledger = CreditLedger("Credits")
+        ledger.record("10")
+
+        seen: List[Optional[int]] = []
+
+        def record():
+            assert ledger.latest_on_this_thread is None
+            ledger.record("5")
+            seen.append(credits(ledger.latest_on_this_thread))
+
+        thread = threading.Thread(target=record)
+        thread.start()
+        thread.join()
+
+        assert [5] == seen
+        assert 10 == credits(ledger.latest_on_this_thread)
+        assert 5 == credits(ledger.latest)
@@ -0,0 +1,80 @@
+import io
+
+from urllib3.filepost import encode_multipart_formdata
+
+from zamzar.facade._internal import MultipartEncoder
+
+
+class TestMultipartEncoder:
+    def test_matches_urllib3_encoding(self):
+        """Test that the streamed body is identical to the body that urllib3 would encode in memory."""
+        content = b"Hello, world!" * 1000
+        encoder = MultipartEncoder([("name", "renamed.txt")], "content", "source.txt", io.BytesIO(content), "b0undary")
+
+        expected, content_type = encode_multipart_formdata(
+            [("name", "renamed.txt"), ("content", ("source.txt", content, "text/plain"))],
+            boundary="b0undary",
+        )
+
+        assert encoder.read() == expected
+        assert encoder.content_type == content_type
+        assert len(encoder) == len(expected)
+
+    def test_reads_in_chunks(self):
+        """Test that the body can be read in fixed-size chunks."""
+        content = bytes(range(256)) * 100
+        encoder = MultipartEncoder([], "content", "source.bin", io.BytesIO(content), "b0undary")
+
+        chunks = []
+        while chunk := encoder.read(1000):
+            assert len(chunk) <= 1000
+            chunks.append(chunk)
+
+        expected, _ = encode_multipart_formdata([("content", ("source.bin", content))], boundary="b0undary")
+        assert b"".join(chunks) == expected
+        assert encoder.tell() == len(expected)
+
+    def test_can_be_rewound(self):
+        """Test that the body can be rewound (e.g., so that urllib3 can retry a request)."""
+        encoder = MultipartEncoder([], "content", "source.txt", io.BytesIO(b"Hello, world!"))
+        first = encoder.read()
+        encoder.seek(0)
+        assert encoder.read() == first
+
+        encoder.seek(len(first) - 20)
+        assert encoder.read() == first[-20:]
+
+    def test_starts_from_current_position_of_stream(self):
+        """Test that only the remainder of a partially consumed stream is uploaded."""
+        stream = io.BytesIO(b"skipped|uploaded")
+        stream.read(8)
+        encoder = MultipartEncoder([], "content", "source.txt", stream, "b0undary")
+
+        expected, _ = encode_multipart_formdata([("content", ("source.txt", b"uploaded"))], boundary="b0undary")
+        assert encoder.read() == expected
+
+    def test_spools_unseekable_streams(self):
+        """Test that streams which cannot be sized (e.g., pipes) are supported."""
+        content = b"Hello, world!" * 1000
+        encoder = MultipartEncoder([], "content", "source.txt", io.BufferedReader(Unseekable(content)), "b0undary")
+
+        expected, _ = encode_multipart_formdata([("content", ("source.txt", content))], boundary="b0undary")
+        assert len(encoder) == len(expected)
+        assert encoder.read() == expected
+        encoder.close()
+
+
+class Unseekable(io.RawIOBase):
+    def __init__(self, content: bytes):
+        self._content = io.BytesIO(content)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def readinto(self, buffer):
+        data = self._content.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
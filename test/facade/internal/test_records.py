@@ -0,0 +1,48 @@
+import dataclasses
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from zamzar.facade._internal import record_builder, record_type
+from zamzar.models import Job, Jobs
+
+JOB = {
+    "id": 1,
+    "status": "successful",
+    "created_at": "2022-01-01T14:15:22Z",
+    "finished_at": None,
+    "import": {"id": 3, "url": "https://example.org/example.docx", "status": "successful"},
+    "source_file": {"id": 1, "name": "example.docx", "size": 1024, "format": "docx"},
+    "target_files": [{"id": 2, "name": "example.pdf", "size": 2048, "format": "pdf"}],
+    "target_format": "pdf",
+    "unspecified": "value",
+}
+
+
+class TestRecords:
+    def test_records_have_the_attributes_of_models(self):
+        """Test that a record has the same attribute names (and values) as the model built from the same data."""
+        model = Job.from_dict(JOB)
+        record = record_builder(Job)(json.loads(json.dumps(JOB)))
+        for name in ["id", "status", "created_at", "finished_at", "target_format", "exports"]:
+            assert getattr(model, name) == getattr(record, name)
+        assert datetime(2022, 1, 1, 14, 15, 22, tzinfo=timezone.utc) == record.created_at
+        assert "https://example.org/example.docx" == record.var_import.url
+        assert "example.docx" == record.source_file.name
+        assert [2] == [file.id for file in record.target_files]
+
+    def test_records_are_frozen_and_slotted(self):
+        """Test that records cannot be modified, and have no per-instance dict."""
+        record = record_builder(Jobs)({"data": [JOB], "paging": {"total_count": 1}})
+        assert type(record) is record_type(Jobs)
+        assert not hasattr(record.data[0], "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.data[0].status = "failed"
+
+    def test_records_are_not_validated(self):
+        """Test that records are built as-is, ignoring fields that are not in the API specification."""
+        record = record_builder(Job)({"id": 1, "status": "unknown", "unspecified": "value"})
+        assert "unknown" == record.status
+        assert not hasattr(record, "unspecified")
+        assert record.target_files is None
@@ -0,0 +1,66 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from zamzar.facade._internal import parse_date, parse_datetime, with_lazy_timestamps
+from zamzar.models import Account, File, Job, Jobs
+
+TIMESTAMP = "2022-01-01T14:15:22Z"
+PARSED = datetime(2022, 1, 1, 14, 15, 22, tzinfo=timezone.utc)
+
+
+class TestTimestamps:
+    def test_parses_iso_8601(self):
+        """Test that the timestamps emitted by the API are parsed (by the fast path)."""
+        assert PARSED == parse_datetime(TIMESTAMP)
+        assert PARSED == parse_datetime("2022-01-01T14:15:22.000+00:00")
+        assert date(2022, 1, 1) == parse_date("2022-01-01")
+
+    def test_falls_back_for_other_formats(self):
+        """Test that timestamps in other formats are parsed by dateutil."""
+        assert PARSED == parse_datetime("Sat, 01 Jan 2022 14:15:22 GMT")
+        assert date(2022, 1, 1) == parse_date("1 January 2022")
+        with pytest.raises(ValueError):
+            parse_datetime("not a timestamp")
+
+    def test_lazy_timestamps_are_parsed_on_first_access(self):
+        """Test that lazy timestamps are held as raw strings until first accessed."""
+        jobs = with_lazy_timestamps(Jobs).model_validate_json(
+            '{"data": [{"id": 1, "created_at": "%s", "source_file": {"id": 2, "name": "a", "created_at": "%s"}}],'
+            ' "paging": {"total_count": 1}}' % (TIMESTAMP, TIMESTAMP)
+        )
+        assert jobs.data is not None
+        job = jobs.data[0]
+        assert isinstance(job, Job)
+        assert TIMESTAMP == job.__dict__["created_at"]
+        assert PARSED == job.created_at
+        assert PARSED == job.__dict__["created_at"], "Should retain the parsed timestamp"
+        assert job.source_file is not None
+        assert PARSED == job.source_file.created_at
+        assert job.finished_at is None
+
+    def test_lazy_models_dump_and_compare_as_eager_models(self):
+        """Test that dumps (including of nested models) and equality are unaffected by timestamps that are not read."""
+        body = '{"id": 1, "created_at": "%s", "source_file": {"id": 2, "name": "a", "created_at": "%s"}}' % (
+            TIMESTAMP, TIMESTAMP
+        )
+        eager = Job.model_validate_json(body)
+        lazy = with_lazy_timestamps(Job).model_validate_json(body)
+
+        assert eager.model_dump() == lazy.model_dump()
+        assert eager.to_dict() == lazy.to_dict()
+        assert eager == lazy
+        assert lazy == eager
+        assert lazy != Job.model_validate_json('{"id": 1}')
+        assert TIMESTAMP == lazy.__dict__["created_at"], "Should not have retained timestamps parsed by the dump"
+
+    def test_lazy_timestamps_can_be_assigned(self):
+        """Test that (validated) assignment of timestamps is unaffected."""
+        job = with_lazy_timestamps(Job).model_validate_json('{"id": 1}')
+        job.finished_at = PARSED
+        assert PARSED == job.finished_at
+
+    def test_models_without_timestamps_are_unchanged(self):
+        """Test that models without (nested) timestamps are not subclassed."""
+        assert Account is with_lazy_timestamps(Account)
+        assert with_lazy_timestamps(File) is with_lazy_timestamps(File)
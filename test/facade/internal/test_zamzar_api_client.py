@@ -0,0 +1,110 @@
+import json
+from typing import Any, Dict
+
+import pytest
+import urllib3
+
+from zamzar import ApiException
+from zamzar.api_client import ApiClient
+from zamzar.facade._internal import ZamzarApiClient
+from zamzar.facade._internal.zamzar_api_client import deserializer_for
+from zamzar.rest import RESTResponse
+
+JOB: Dict[str, Any] = {
+    "id": 1,
+    "key": "apikey",
+    "status": "successful",
+    "sandbox": True,
+    "created_at": "2022-01-01T14:15:22Z",
+    "finished_at": "2022-01-01T14:15:42Z",
+    "source_file": {"id": 1, "name": "example.docx", "size": 1024, "format": "docx"},
+    "target_files": [{"id": 2, "name": "example.pdf", "size": 2048, "format": "pdf"}],
+    "target_format": "pdf",
+    "credit_cost": 1,
+    "exports": [],
+}
+
+
+def response(body: Any, status: int = 200, content_type: str = "application/json") -> RESTResponse:
+    data = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+    result = RESTResponse(urllib3.HTTPResponse(body=data, status=status, headers={"Content-Type": content_type}))
+    result.read()
+    return result
+
+
+def deserialize(body: Any, response_types_map: Dict[str, str], fast: bool, **kwargs):
+    client = ZamzarApiClient(fast_deserialization=fast)
+    return client.response_deserialize(response(body, **kwargs), response_types_map).data
+
+
+class TestZamzarApiClient:
+    def test_fast_path_matches_generated_path(self):
+        """Test that validating raw bytes builds the same models as the generated (dict-based) deserializer."""
+        page = {"data": [JOB, dict(JOB, id=2, status="failed", finished_at=None)], "paging": {"total_count": 2}}
+        slow = deserialize(page, {"200": "Jobs"}, fast=False)
+        fast = deserialize(page, {"200": "Jobs"}, fast=True)
+        assert slow == fast
+        assert fast.data[0].target_files[0].name == "example.pdf"
+
+    def test_fast_path_supports_lists_of_models(self):
+        """Test that List[...] response types are validated directly."""
+        files = [JOB["source_file"], JOB["target_files"][0]]
+        assert deserialize(files, {"200": "List[File]"}, fast=False) == deserialize(files, {"200": "List[File]"}, True)
+
+    def test_fast_path_ignores_unspecified_fields(self):
+        """Test that (unlike the generated path) fields that are not in the API specification are not retained."""
+        body = dict(JOB, unspecified="value")
+        assert deserialize(body, {"200": "Job"}, fast=False).additional_properties == {"unspecified": "value"}
+        assert deserialize(body, {"200": "Job"}, fast=True).additional_properties == {}
+
+    def test_fast_path_falls_back_for_other_responses(self):
+        """Test that non-model, non-UTF-8 and error responses are deserialized by the generated client."""
+        assert deserialize(b"content", {"200": "bytearray"}, fast=True) == b"content"
+        latin1 = "application/json; charset=latin-1"
+        job = deserialize(dict(JOB, unspecified="value"), {"200": "Job"}, fast=True, content_type=latin1)
+        assert job.additional_properties == {"unspecified": "value"}
+        with pytest.raises(ApiException):
+            deserialize({"errors": [{"code": 10, "message": "not found"}]}, {"404": "Errors"}, fast=True, status=404)
+
+    def test_fast_path_raises_for_invalid_responses(self):
+        """Test that responses which do not match their model are rejected, as with the generated client."""
+        with pytest.raises(ValueError):
+            deserialize(dict(JOB, status="unknown"), {"200": "Job"}, fast=True)
+
+    @pytest.mark.parametrize("response_type, body", [
+        ("Jobs", {"data": [JOB], "paging": {"total_count": 1}}),
+        ("List[File]", [JOB["source_file"], None]),
+        ("Dict[str, List[int]]", {"a": [1, 2], "b": None}),
+        ("datetime", "2022-01-01T14:15:22Z"),
+        ("object", {"any": ["thing"]}),
+    ])
+    def test_compiled_types_match_generated_client(self, response_type, body):
+        """Test that compiled (cached) type resolution deserializes in the same way as the generated client."""
+        text = json.dumps(body)
+        expected = ApiClient().deserialize(text, response_type, "application/json")
+        assert expected == ZamzarApiClient().deserialize(text, response_type, "application/json")
+
+    def test_compiles_each_type_once(self):
+        """Test that each type string is resolved once, rather than on every response."""
+        client = ZamzarApiClient()
+        client.deserialize(json.dumps([JOB]), "List[Job]", "application/json")
+        misses = deserializer_for.cache_info().misses
+        client.deserialize(json.dumps([JOB]), "List[Job]", "application/json")
+        assert misses == deserializer_for.cache_info().misses
+
+    def test_reports_invalid_timestamps_as_generated_client(self):
+        """Test that timestamps which cannot be parsed (by either parser) raise the generated client's error."""
+        with pytest.raises(ApiException, match="Failed to parse `never` as datetime object"):
+            ZamzarApiClient().deserialize('"never"', "datetime", "application/json")
+
+    def test_parses_json_from_raw_bytes(self):
+        """Test that JSON responses are parsed from (and share, not copy) the raw body, as by the generated client."""
+        page = {"data": [dict(JOB, unspecified="value")], "paging": {"total_count": 1}}
+        rest_response = response(page)
+        deserialized = ZamzarApiClient().response_deserialize(rest_response, {"200": "Jobs"})
+        assert ApiClient().response_deserialize(response(page), {"200": "Jobs"}).data == deserialized.data
+        assert rest_response.data is deserialized.raw_data
+
+    def test_does_not_parse_json_file_content(self):
+        """Test that file content is returned as-is, even when it is JSON."""
+        assert b'{"id": 1}' == deserialize(b'{"id": 1}', {"200": "bytearray"}, fast=False)
@@ -0,0 +1,127 @@
+import asyncio
+import io
+import threading
+from datetime import timedelta
+
+import pytest
+
+from zamzar import ApiException
+from zamzar.exceptions import NotFoundException
+from zamzar.facade.async_job_manager import AsyncJobManager
+from zamzar.models import File, Job
+from .assertions import assert_non_empty_file
+
+
+class TestAsyncZamzarClient:
+    """Test class for the AsyncZamzarClient module."""
+
+    def test_convert_store_delete_all(self, zamzar_async, tmp_path):
+        """Test that the AsyncZamzarClient can convert, store, and delete files."""
+        source = tmp_path / "source"
+        source.touch()
+        target = tmp_path / "target"
+
+        async def convert():
+            job = await zamzar_async.convert(source, "txt", source_format="pdf")
+            await job.store(target)
+            await job.delete_all_files()
+            return job
+
+        job = asyncio.run(convert())
+
+        assert job.has_succeeded(), "Should have awaited completion of the job"
+        assert_non_empty_file(target)
+        with pytest.raises(NotFoundException):
+            zamzar_async.sync.files.find(job.source_file_id)
+
+    def test_upload_download(self, zamzar_async, tmp_path):
+        """Test that the AsyncZamzarClient can upload and download files."""
+        target = tmp_path / "target.txt"
+
+        async def round_trip():
+            uploaded = await zamzar_async.upload(io.BytesIO(b"Hello, world!"), "source.txt")
+            return await zamzar_async.download(uploaded.id, target)
+
+        downloaded = asyncio.run(round_trip())
+
+        assert downloaded.id is not None
+        assert target.read_bytes() == b"Hello, world!"
+
+    def test_await_completion_of_many_jobs_concurrently(self, zamzar_async, succeeding_job_id, failing_job_id):
+        """Test that the AsyncZamzarClient can await the completion of several jobs on a single event loop."""
+
+        async def await_all():
+            jobs = await asyncio.gather(
+                zamzar_async.jobs.find(succeeding_job_id), zamzar_async.jobs.find(failing_job_id)
+            )
+            return await asyncio.gather(*(job.await_completion() for job in jobs))
+
+        succeeded, failed = asyncio.run(await_all())
+
+        assert succeeded.has_succeeded()
+        assert failed.has_failed()
+        assert failed.failure is not None
+
+    def test_refresh_reads_retry_after_from_its_own_response(
+            self, zamzar_async, set_fake_responses, create_mock_response
+    ):
+        """Test that Retry-After is read from the refresh's response, rather than the latest response on any thread."""
+        set_fake_responses([
+            create_mock_response(200, headers={"Retry-After": "7"}, json_body={"id": 1, "status": "converting"}),
+            create_mock_response(200, json_body={"id": 2, "status": "converting"}),
+        ])
+
+        async def refresh():
+            refreshed = await AsyncJobManager(zamzar_async, Job(id=1, status="converting")).refresh()
+            # Another job is refreshed (on another thread) before the first job asks for its requested delay
+            other = threading.Thread(target=zamzar_async.sync.jobs.find, args=(2,))
+            other.start()
+            other.join()
+            return refreshed
+
+        assert timedelta(seconds=7) == asyncio.run(refresh())._requested_delay()
+
+    def test_list_and_page_forwards(self, zamzar_async):
+        """Test that the AsyncZamzarClient can list and page through jobs."""
+
+        async def count_pages():
+            number_of_pages = 0
+            current = await zamzar_async.jobs.list(limit=2)
+            while len(current.items) > 0:
+                number_of_pages += 1
+                assert len(current.items) <= 2
+                current = await current.next_page()
+            return number_of_pages
+
+        assert asyncio.run(count_pages()) >= 2
+
+    def test_create_from_url(self, zamzar_async):
+        """Test that the AsyncZamzarClient can import a file from a URL and start a job to convert it."""
+
+        async def create():
+            return await zamzar_async.jobs.create("https://www.example.com/logo.png", "jpg")
+
+        assert asyncio.run(create()).id > 0, "Should have created a job"
+
+    def test_delete_target_files_raises_for_missing_files(self, zamzar_async):
+        """Test that deleting the target files of a job deletes every file, then raises for any that no longer exist."""
+        uploaded = zamzar_async.sync.files.upload(io.BytesIO(b"Hello, world!"), "target.txt")
+        job = Job(id=1, status="successful", target_files=[File(id=999999, name="missing"), uploaded.model])
+
+        with pytest.raises(NotFoundException):
+            asyncio.run(AsyncJobManager(zamzar_async, job).delete_target_files())
+
+        with pytest.raises(NotFoundException):
+            zamzar_async.sync.files.find(uploaded.id)
+
+    def test_delete_all_files_raises_failure_once_every_file_is_processed(self, zamzar_async, mocker):
+        """Test that a failure to delete one file of a job is raised only once the other files have been processed."""
+        api = zamzar_async.sync.files._api
+        delete = mocker.patch.object(api, "delete_file_by_id", side_effect=ApiException("Boom"))
+        targets = [File(id=2, name="target.pdf"), File(id=3, name="target.zip")]
+        job = Job(id=1, status="successful", source_file=File(id=1, name="source.docx"), target_files=targets)
+
+        with pytest.raises(ApiException):
+            asyncio.run(AsyncJobManager(zamzar_async, job).delete_all_files())
+
+        assert [1, 2, 3] == sorted(call.kwargs["file_id"] for call in delete.call_args_list)
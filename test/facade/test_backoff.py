@@ -0,0 +1,77 @@
+import statistics
+from datetime import timedelta
+from itertools import islice
+
+import pytest
+
+from zamzar.facade.backoff import DEFAULT_BACKOFF, ExpectedDurationBackoff, ExponentialBackoff, Jitter, ListBackoff
+from zamzar.facade.job_manager import JobManager
+from zamzar.models import Job
+
+
+def seconds(backoff, count, awaitable=None):
+    return [delay.total_seconds() for delay in islice(backoff.delays(awaitable), count)]
+
+
+class TestBackoff:
+    """Test class for the backoff module."""
+
+    def test_list_backoff_repeats_last_delay(self):
+        """Test that a ListBackoff repeats the last delay once the list is exhausted."""
+        backoff = ListBackoff([timedelta(seconds=1), timedelta(seconds=2)])
+        assert [1, 2, 2, 2] == seconds(backoff, 4)
+
+    def test_list_backoff_requires_delays(self):
+        """Test that a ListBackoff requires at least one delay."""
+        with pytest.raises(ValueError):
+            ListBackoff([])
+
+    def test_exponential_backoff_without_jitter(self):
+        """Test that an ExponentialBackoff without jitter is deterministic and capped."""
+        backoff = ExponentialBackoff(timedelta(seconds=1), 2, timedelta(seconds=5), Jitter.NONE)
+        assert [1, 2, 4, 5, 5] == seconds(backoff, 5)
+
+    @pytest.mark.parametrize("jitter", [Jitter.FULL, Jitter.DECORRELATED])
+    def test_exponential_backoff_with_jitter(self, jitter):
+        """Test that an ExponentialBackoff with jitter is randomised within its bounds, and reproducible if seeded."""
+        backoff = ExponentialBackoff(timedelta(seconds=1), 2, timedelta(seconds=5), jitter, seed=42)
+        delays = seconds(backoff, 50)
+
+        assert delays == seconds(backoff, 50), "Should be deterministic when seeded"
+        assert len(set(delays)) > 1, "Should be randomised"
+        assert all(0 <= delay <= 5 for delay in delays), "Should not exceed the cap"
+        assert delays != seconds(ExponentialBackoff(timedelta(seconds=1), 2, timedelta(seconds=5), jitter, seed=7), 50)
+
+    @pytest.mark.parametrize("jitter", [Jitter.FULL, Jitter.DECORRELATED])
+    def test_exponential_backoff_grows_exponentially(self, jitter):
+        """Test that jittered delays grow exponentially (on average) until they reach the cap."""
+        backoffs = [ExponentialBackoff(jitter=jitter, seed=seed) for seed in range(200)]
+        means = [statistics.mean(column) for column in zip(*[seconds(backoff, 12) for backoff in backoffs])]
+        growing = [(earlier, later) for earlier, later in zip(means, means[4:]) if earlier < 3]
+        assert 5 <= len(growing)
+        for earlier, later in growing:
+            assert later > 3 * earlier, "Should (at least) triple every four polls until approaching the cap"
+
+    @pytest.mark.parametrize("horizon, limit", [(60, 25), (20 * 60, 80)])
+    def test_default_backoff_bounds_number_of_polls(self, horizon, limit):
+        """Test that the default backoff polls a bounded number of times whilst waiting for a slow operation."""
+        def polls(delays):
+            elapsed = count = 0
+            while elapsed < horizon:
+                elapsed += next(delays).total_seconds()
+                count += 1
+            return count
+
+        counts = [polls(ExponentialBackoff(seed=seed).delays()) for seed in range(200)]
+        assert statistics.mean(counts) < limit
+        assert polls(DEFAULT_BACKOFF.delays()) < 3 * limit
+
+    def test_expected_duration_backoff(self, zamzar):
+        """Test that an ExpectedDurationBackoff first waits for the expected duration of the target format."""
+        backoff = ExpectedDurationBackoff({"mp4": timedelta(seconds=30)}, ListBackoff([timedelta(seconds=1)]))
+
+        mp4 = JobManager(zamzar, Job(id=1, target_format="mp4"))
+        pdf = JobManager(zamzar, Job(id=2, target_format="pdf"))
+
+        assert [30, 1, 1] == seconds(backoff, 3, mp4)
+        assert [1, 1, 1] == seconds(backoff, 3, pdf)
@@ -0,0 +1,113 @@
+import threading
+from datetime import timedelta
+
+import pytest
+
+from zamzar.exceptions import ServiceException
+from zamzar.facade.credit_governor import CreditBudgetExceededException, CreditGovernor
+
+
+class TestCreditGovernor:
+    """Test class for the CreditGovernor module."""
+
+    def test_cost_of(self, zamzar, mocker):
+        """Test that the CreditGovernor looks up the cost of conversions in the client's catalogue."""
+        credit_cost = mocker.patch.object(
+            zamzar.catalogue, "credit_cost", side_effect=lambda source, target: 3 if target == "jpg" else None
+        )
+        governor = CreditGovernor(zamzar, default_cost=2)
+
+        assert 3 == governor.cost_of("pdf", "jpg")
+        assert 2 == governor.cost_of("pdf", "mp3"), "Should assume the default cost for unknown conversions"
+        assert 2 == governor.cost_of(None, "jpg"), "Should assume the default cost for unknown source formats"
+        assert 2 == credit_cost.call_count
+
+    def test_retries_catalogue_after_failure(self, zamzar, mocker):
+        """Test that the CreditGovernor assumes the default cost if the catalogue cannot be retrieved, then retries."""
+        target = zamzar.formats.find("mp3").targets[0]
+        list_formats = mocker.patch.object(zamzar.formats, "list", side_effect=ServiceException(status=503))
+        governor = CreditGovernor(zamzar, default_cost=target.credit_cost + 1)
+
+        assert target.credit_cost + 1 == governor.cost_of("mp3", target.name)
+        assert 1 == list_formats.call_count
+
+        mocker.stopall()
+        assert target.credit_cost == governor.cost_of("mp3", target.name), "Should have retrieved the catalogue"
+
+    def test_admits_when_credits_unknown(self, zamzar):
+        """Test that the CreditGovernor admits submissions until the remaining credits have been reported."""
+        governor = CreditGovernor(zamzar, floor=1000)
+        with governor.reserve(10):
+            assert 10 == governor.reserved
+        assert 0 == governor.reserved
+
+    def test_rejects_reservations_that_cross_the_floor(self, zamzar):
+        """Test that the CreditGovernor rejects reservations that would take the remaining credits below the floor."""
+        zamzar.production_credits.record("10")
+        governor = CreditGovernor(zamzar, floor=5)
+
+        reservation = governor.reserve(3)
+        assert 2 == governor.available
+        with pytest.raises(CreditBudgetExceededException):
+            governor.reserve(3)
+
+        reservation.release()
+        governor.reserve(3)
+
+    def test_governs_sandbox_credits(self, zamzar):
+        """Test that the CreditGovernor can govern sandbox credits."""
+        zamzar.production_credits.record("100")
+        zamzar.sandbox_credits.record("1")
+        with pytest.raises(CreditBudgetExceededException):
+            CreditGovernor(zamzar, sandbox=True).reserve(2)
+
+    def test_waits_for_credits_to_be_released(self, zamzar):
+        """Test that the CreditGovernor waits for outstanding reservations to be released."""
+        zamzar.production_credits.record("10")
+        governor = CreditGovernor(zamzar, wait=timedelta(seconds=5))
+        reservation = governor.reserve(8)
+
+        releaser = threading.Timer(0.1, reservation.release)
+        releaser.start()
+        with governor.reserve(8):
+            assert 8 == governor.reserved
+        releaser.join()
+
+    def test_job_submission_is_governed(self, zamzar, mocker, file_id):
+        """Test that the JobsService does not submit jobs that the CreditGovernor rejects."""
+        zamzar.production_credits.record("10")
+        zamzar.governor = CreditGovernor(zamzar, floor=10)
+        mocker.patch.object(zamzar.governor, "cost_of", return_value=1)
+        submit = mocker.spy(zamzar.jobs._api, "submit_job")
+
+        with pytest.raises(CreditBudgetExceededException):
+            zamzar.jobs.create(file_id, "pdf", source_format="txt")
+
+        assert 0 == submit.call_count
+        zamzar.governor.floor = 0
+        assert zamzar.jobs.create(file_id, "pdf", source_format="txt").id > 0
+        assert 0 == zamzar.governor.reserved, "Should have released the reservation once submitted"
+
+    def test_rejected_job_does_not_upload_source(self, zamzar, mocker, tmp_path):
+        """Test that the JobsService reserves credits before uploading the source, so a rejection orphans no file."""
+        source = tmp_path / "source.txt"
+        source.write_text("Hello, world!")
+        zamzar.production_credits.record("10")
+        zamzar.governor = CreditGovernor(zamzar, floor=10)
+        mocker.patch.object(zamzar.governor, "cost_of", return_value=1)
+        upload = mocker.spy(zamzar, "upload")
+
+        with pytest.raises(CreditBudgetExceededException):
+            zamzar.jobs.create(source, "pdf")
+
+        assert 0 == upload.call_count
+
+    def test_validated_job_resolves_source_format_once(self, zamzar, mocker, file_id):
+        """Test that validating and governing a job by file ID look up the format of the file only once."""
+        zamzar.governor = CreditGovernor(zamzar)
+        source_format = zamzar.files.find(file_id).model.format
+        target = zamzar.formats.find(source_format).targets[0].name
+        find = mocker.spy(zamzar.files, "find")
+
+        assert zamzar.jobs.create(file_id, target, validate=True).id > 0
+        assert 1 == find.call_count
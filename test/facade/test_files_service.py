@@ -1,6 +1,16 @@
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
 import pytest
+import urllib3
 
+from zamzar import ApiException
 from zamzar.exceptions import NotFoundException
+from zamzar.facade.file_manager import FileManager
+from zamzar.models import File
 from zamzar.pagination import after, before
 from .assertions import assert_non_empty_file
 
@@ -37,6 +47,12 @@ class TestFilesService:
         past_end = third_page.next_page()
         assert 0 == len(past_end.items)
 
+    def test_iter_all(self, zamzar):
+        """Test that the FilesService can iterate over every file."""
+        # Note the zamzar-mock provides at least 7 precanned files
+        files = [file.id for file in zamzar.files.iter_all(limit=3, until=lambda file: file.id < 5)]
+        assert files[-3:] == [7, 6, 5]
+
     def test_list_and_page_backwards(self, zamzar):
         """Test that the FilesService can list and page backwards."""
         # Note the zamzar-mock provides at least 7 precanned files
@@ -66,6 +82,50 @@ class TestFilesService:
         with pytest.raises(NotFoundException):
             zamzar.files.delete(999999)
 
+    def test_delete_many(self, zamzar):
+        """Test that the FilesService can delete many files, tolerating files that no longer exist."""
+        uploaded = [zamzar.files.upload(io.BytesIO(b"Hello, world!"), f"{i}.txt") for i in range(5)]
+        reports = []
+
+        report = zamzar.files.delete_many(
+            (file for file in [*uploaded, 999999]),
+            max_in_flight=2,
+            progress=lambda r: reports.append(r.processed),
+        )
+
+        assert sorted(file.id for file in uploaded) == sorted(report.deleted)
+        assert [999999] == report.missing
+        assert report.succeeded
+        assert 6 == len(reports), "Should report progress after each file"
+        assert 6 == reports[-1]
+        for file in uploaded:
+            with pytest.raises(NotFoundException):
+                zamzar.files.find(file.id)
+
+    def test_delete_many_reports_failures(self, zamzar, mocker):
+        """Test that the FilesService reports (rather than raises) a failure to delete one of many files."""
+        mocker.patch.object(zamzar.files._api, "delete_file_by_id", side_effect=ApiException("Boom"))
+
+        report = zamzar.files.delete_many([1, 2])
+
+        assert not report.succeeded
+        assert {1, 2} == set(report.failed)
+        with pytest.raises(ApiException):
+            report.raise_for_failures()
+
+    def test_sweep(self, zamzar):
+        """Test that the FilesService can delete every file that matches the given criteria."""
+        # Note the zamzar-mock provides at least 7 precanned files
+        report = zamzar.files.sweep(older_than=timedelta(hours=1), where=lambda file: file.id in (2, 4))
+
+        assert [2, 4] == sorted(report.deleted)
+        assert {1, 3, 5} <= {file.id for file in zamzar.files.iter_all()}
+
+    def test_sweep_requires_criteria(self, zamzar):
+        """Test that the FilesService refuses to sweep every file."""
+        with pytest.raises(ValueError):
+            zamzar.files.sweep()
+
     def test_download(self, zamzar, file_id, tmp_path):
         """Test that the FilesService can download a file."""
         target = tmp_path / "target"
@@ -80,6 +140,242 @@ class TestFilesService:
         zamzar.files.download(file_id, target)
         assert 1 == len(list(target.iterdir())), "Should have downloaded a file"
 
+    def test_download_in_chunks(self, zamzar, file_id, tmp_path):
+        """Test that the FilesService streams downloads to disk in chunks."""
+        expected = tmp_path / "expected"
+        zamzar.files.download(file_id, expected)
+
+        zamzar.files.download_chunk_size = 1
+        actual = tmp_path / "actual"
+        zamzar.files.download(file_id, actual)
+
+        assert actual.read_bytes() == expected.read_bytes()
+        assert {"expected", "actual"} == {path.name for path in tmp_path.iterdir()}, "Should not leave partial files"
+
+    def test_download_failure_leaves_target_untouched(self, zamzar, tmp_path):
+        """Test that the FilesService does not overwrite or leave partial files behind when a download fails."""
+        target = tmp_path / "target"
+        target.write_text("original")
+
+        with pytest.raises(NotFoundException):
+            FileManager(zamzar, File(id=999999, name="missing")).download(target)
+
+        assert target.read_text() == "original"
+        assert ["target"] == [path.name for path in tmp_path.iterdir()], "Should not leave partial files"
+
+    def test_download_failure_reports_error_detail(self, zamzar, tmp_path):
+        """Test that the FilesService reports the errors in the body of a failed download, as other requests do."""
+        with pytest.raises(NotFoundException) as raised:
+            FileManager(zamzar, File(id=999999, name="missing")).download(tmp_path / "target")
+
+        assert raised.value.data is not None, "Should have deserialized the errors"
+        assert 0 < len(raised.value.data.errors)
+
+    def test_download_resumes_partial_download(self, zamzar_tracked, file_id, tmp_path):
+        """Test that the FilesService resumes a download from the end of a partial file left by an earlier attempt."""
+        expected = tmp_path / "expected"
+        zamzar_tracked.files.download(file_id, expected)
+
+        target = tmp_path / "target"
+        partial = tmp_path / f"target.{file_id}.part"
+        partial.write_bytes(expected.read_bytes()[:5])
+        zamzar_tracked.files.download(file_id, target)
+
+        assert target.read_bytes() == expected.read_bytes()
+        assert not partial.exists(), "Should have renamed the partial file"
+        assert "bytes=5-" == zamzar_tracked.pool_manager.latest.request.headers["Range"]
+
+    def test_download_discards_oversized_partial_download(self, zamzar, file_id, tmp_path):
+        """Test that the FilesService restarts a download when the partial file is larger than the file."""
+        expected = tmp_path / "expected"
+        zamzar.files.download(file_id, expected)
+
+        target = tmp_path / "target"
+        (tmp_path / f"target.{file_id}.part").write_bytes(expected.read_bytes() * 2)
+        zamzar.files.download(file_id, target)
+
+        assert target.read_bytes() == expected.read_bytes()
+
+    def test_download_resumes_interrupted_transfer(self, zamzar, mocker, tmp_path):
+        """Test that the FilesService requests only the remainder of a file when a transfer is interrupted."""
+        content = b"Hello, world!" * 10
+        getconn_mock = mocker.patch("urllib3.connectionpool.HTTPConnectionPool._get_conn")
+        getconn_mock.return_value.getresponse.side_effect = [
+            # The connection drops after 40 bytes...
+            urllib3.HTTPResponse(
+                body=io.BytesIO(content[:40]),
+                status=200,
+                headers={"Content-Length": str(len(content))},
+                preload_content=False,
+            ),
+            # ...and the server honours the subsequent range request
+            urllib3.HTTPResponse(
+                body=io.BytesIO(content[40:]),
+                status=206,
+                headers={"Content-Range": f"bytes 40-{len(content) - 1}/{len(content)}"},
+                preload_content=False,
+            ),
+        ]
+
+        target = tmp_path / "target"
+        zamzar.files.download_chunk_size = 10
+        FileManager(zamzar, File(id=1, name="target", size=len(content))).download(target)
+
+        assert target.read_bytes() == content
+        assert "bytes=40-" == getconn_mock.return_value.request.call_args.kwargs["headers"]["Range"]
+
+    def test_download_restarts_when_range_is_refused(self, zamzar, mocker, tmp_path):
+        """Test that the FilesService starts again from scratch when the server does not honour a range request."""
+        content = b"Hello, world!" * 10
+        getconn_mock = mocker.patch("urllib3.connectionpool.HTTPConnectionPool._get_conn")
+        getconn_mock.return_value.getresponse.side_effect = [
+            urllib3.HTTPResponse(body=io.BytesIO(content), status=200, preload_content=False),
+        ]
+
+        target = tmp_path / "target"
+        (tmp_path / "target.1.part").write_bytes(b"stale")
+        FileManager(zamzar, File(id=1, name="target", size=len(content))).download(target)
+
+        assert target.read_bytes() == content
+
+    def test_download_in_parallel_ranges(self, zamzar, file_id, tmp_path):
+        """Test that the FilesService can download a file as several byte ranges concurrently."""
+        expected = tmp_path / "expected"
+        zamzar.files.download(file_id, expected)
+
+        actual = tmp_path / "actual"
+        zamzar.files.download_chunk_size = 3
+        zamzar.files.download(file_id, actual, ranges=4)
+
+        assert actual.read_bytes() == expected.read_bytes()
+        assert {"expected", "actual"} == {path.name for path in tmp_path.iterdir()}, "Should not leave partial files"
+
+    def test_download_in_parallel_ranges_is_bounded_by_connection_pool(self, zamzar, mocker, file_id, tmp_path):
+        """Test that no more ranges are downloaded at once than the client keeps connections open for."""
+        expected = tmp_path / "expected"
+        zamzar.files.download(file_id, expected)
+        zamzar.files._api.api_client.configuration.connection_pool_maxsize = 2
+        executor = mocker.patch("zamzar.facade.files_service.ThreadPoolExecutor", wraps=ThreadPoolExecutor)
+
+        actual = tmp_path / "actual"
+        zamzar.files.download_chunk_size = 3
+        zamzar.files.download(file_id, actual, ranges=8)
+
+        assert actual.read_bytes() == expected.read_bytes()
+        assert 2 == executor.call_args.kwargs["max_workers"]
+
+    def test_download_rejects_fewer_than_one_range(self, zamzar, file_id, tmp_path):
+        """Test that the FilesService rejects a number of ranges that is less than 1."""
+        with pytest.raises(ValueError):
+            zamzar.files.download(file_id, tmp_path / "target", ranges=0)
+        assert [] == list(tmp_path.iterdir())
+
+    def test_download_in_parallel_ranges_is_not_resumed_after_being_killed(self, zamzar, mocker, file_id, tmp_path):
+        """Test that a preallocated file left by a killed ranged download is never mistaken for a complete download."""
+        expected = tmp_path / "expected"
+        zamzar.files.download(file_id, expected)
+
+        # Kill the download after the first range (so that none of its files are cleaned up)
+        content = zamzar.files._api.get_file_content_by_id_without_preload_content
+
+        def first_range_only(file_id, _headers):
+            if not _headers["Range"].startswith("bytes=0-"):
+                raise KeyboardInterrupt()
+            return content(file_id=file_id, _headers=_headers)
+
+        request = mocker.patch.object(
+            zamzar.files._api, "get_file_content_by_id_without_preload_content", side_effect=first_range_only
+        )
+        unlink = mocker.patch.object(Path, "unlink")
+        actual = tmp_path / "actual"
+        with pytest.raises(KeyboardInterrupt):
+            zamzar.files.download(file_id, actual, ranges=4)
+        mocker.stop(unlink)
+        mocker.stop(request)
+        assert any(path.name.endswith(".part") for path in tmp_path.iterdir()), "Should have left a partial file"
+
+        zamzar.files.download(file_id, actual)
+
+        assert actual.read_bytes() == expected.read_bytes()
+        assert {"expected", "actual"} == {path.name for path in tmp_path.iterdir()}, "Should not leave partial files"
+
+    def test_download_in_parallel_ranges_falls_back_to_single_stream(self, zamzar, mocker, tmp_path):
+        """Test that the FilesService downloads a single stream when the server does not support range requests."""
+        content = b"Hello, world!" * 10
+        getconn_mock = mocker.patch("urllib3.connectionpool.HTTPConnectionPool._get_conn")
+        getconn_mock.return_value.getresponse.side_effect = [
+            # The server refuses the range request for the first range...
+            urllib3.HTTPResponse(body=io.BytesIO(b""), status=416, preload_content=False),
+            # ...so the file is downloaded in a single stream
+            urllib3.HTTPResponse(body=io.BytesIO(content), status=200, preload_content=False),
+        ]
+
+        target = tmp_path / "target"
+        FileManager(zamzar, File(id=1, name="target", size=len(content))).download(target, ranges=4)
+
+        assert target.read_bytes() == content
+        assert "Range" not in (getconn_mock.return_value.request.call_args.kwargs["headers"] or {})
+
+    def test_download_in_parallel_ranges_keeps_whole_file_sent_for_first_range(self, zamzar, mocker, tmp_path):
+        """Test that the FilesService keeps the whole file, when sent in response to the first range request."""
+        content = b"Hello, world!" * 10
+        getconn_mock = mocker.patch("urllib3.connectionpool.HTTPConnectionPool._get_conn")
+        getconn_mock.return_value.getresponse.side_effect = [
+            urllib3.HTTPResponse(body=io.BytesIO(content), status=200, preload_content=False),
+        ]
+
+        target = tmp_path / "target"
+        FileManager(zamzar, File(id=1, name="target", size=len(content))).download(target, ranges=4)
+
+        assert target.read_bytes() == content
+        assert 1 == getconn_mock.return_value.request.call_count, "Should not have requested the file again"
+
+    def test_download_in_parallel_ranges_stops_at_first_failure(self, zamzar, mocker, tmp_path):
+        """Test that the FilesService abandons the other ranges as soon as one fails, rather than completing them."""
+        size = 400
+
+        class SlowBody(io.RawIOBase):
+            """Sends a range of 100 bytes, one byte at a time, over five seconds."""
+
+            def __init__(self):
+                self.remaining = 100
+
+            def readable(self):
+                return True
+
+            def readinto(self, buffer):
+                if not self.remaining:
+                    return 0
+                time.sleep(0.05)
+                self.remaining -= 1
+                buffer[:1] = b"x"
+                return 1
+
+        def content(file_id, _headers):
+            start, end = (int(bound) for bound in _headers["Range"][len("bytes="):].split("-"))
+            headers = {"Content-Range": f"bytes {start}-{end}/{size}"}
+            if start == 0:
+                return urllib3.HTTPResponse(body=io.BytesIO(b"x" * (end + 1)), status=206, headers=headers,
+                                            preload_content=False)
+            if start == 100:
+                return urllib3.HTTPResponse(body=SlowBody(), status=206, headers=headers, preload_content=False)
+            return urllib3.HTTPResponse(
+                body=io.BytesIO(b'{"errors": [{"code": 20, "message": "Not found"}]}'),
+                status=404,
+                headers={"Content-Type": "application/json"},
+                preload_content=False,
+            )
+
+        mocker.patch.object(zamzar.files._api, "get_file_content_by_id_without_preload_content", side_effect=content)
+        zamzar.files.download_chunk_size = 1
+
+        started = time.monotonic()
+        with pytest.raises(NotFoundException):
+            FileManager(zamzar, File(id=1, name="target", size=size)).download(tmp_path / "target", ranges=4)
+
+        assert time.monotonic() - started < 2, "Should not have waited for the slow range to complete"
+        assert [] == list(tmp_path.iterdir()), "Should not leave partial files"
+
     def test_upload(self, zamzar, tmp_path):
         """Test that the FilesService can upload a file."""
         source = tmp_path / "source"
@@ -87,3 +383,28 @@ class TestFilesService:
         source.write_text("Hello, world!")
         uploaded = zamzar.files.upload(source)
         assert uploaded.id is not None, "Should have uploaded a file"
+
+    def test_upload_streams_content(self, zamzar_tracked, tmp_path):
+        """Test that the FilesService streams the content of the file, with a precomputed content length."""
+        source = tmp_path / "source.txt"
+        source.write_text("Hello, world!")
+        zamzar_tracked.files.upload(source)
+
+        request = zamzar_tracked.pool_manager.latest.request
+        assert not isinstance(request.body, bytes), "Should not have read the file into memory"
+        assert int(request.headers["Content-Length"]) > len("Hello, world!")
+
+    def test_upload_file_like(self, zamzar, tmp_path):
+        """Test that the FilesService can upload a binary file-like object."""
+        uploaded = zamzar.files.upload(io.BytesIO(b"Hello, world!"), "source.txt")
+        assert uploaded.id is not None, "Should have uploaded a file"
+        assert uploaded.model.name == "source.txt"
+
+        downloaded = tmp_path / "downloaded.txt"
+        uploaded.download(downloaded)
+        assert downloaded.read_bytes() == b"Hello, world!"
+
+    def test_upload_file_like_requires_name(self, zamzar):
+        """Test that the FilesService requires a name when uploading an anonymous file-like object."""
+        with pytest.raises(ValueError):
+            zamzar.files.upload(io.BytesIO(b"Hello, world!"))
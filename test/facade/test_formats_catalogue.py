@@ -0,0 +1,97 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+
+from zamzar import ApiException
+from zamzar.facade.formats_catalogue import FormatsCatalogue
+
+
+class TestFormatsCatalogue:
+    """Test class for the FormatsCatalogue module."""
+
+    def test_indexes_conversions(self, zamzar):
+        """Test that the FormatsCatalogue indexes the conversions (and their costs) supported for each format."""
+        expected = zamzar.formats.find("mp3").targets[0]
+        catalogue = FormatsCatalogue(zamzar)
+
+        assert catalogue.can_convert("mp3", expected.name)
+        assert expected.credit_cost == catalogue.credit_cost("mp3", expected.name)
+        assert expected.name in catalogue.targets("mp3")
+        assert not catalogue.can_convert("mp3", "not-a-format")
+        assert not catalogue.can_convert("not-a-format", expected.name)
+
+    def test_caches_catalogue(self, zamzar, mocker):
+        """Test that the FormatsCatalogue retrieves the catalogue once, paging through every format."""
+        list_spy = mocker.spy(zamzar.formats, "list")
+        catalogue = FormatsCatalogue(zamzar)
+
+        catalogue.can_convert("mp3", "pdf")
+        calls = list_spy.call_count
+        catalogue.can_convert("pdf", "mp3")
+
+        assert calls > 1, "Should have paged through the formats"
+        assert calls == list_spy.call_count, "Should not have retrieved the catalogue again"
+
+    def test_refreshes_stale_catalogue_in_background(self, zamzar, mocker):
+        """Test that the FormatsCatalogue serves a stale catalogue while it is refreshed (once) in the background."""
+        list_spy = mocker.spy(zamzar.formats, "list")
+        catalogue = FormatsCatalogue(zamzar, ttl=timedelta(milliseconds=200))
+        catalogue.refresh()
+        pages = list_spy.call_count
+        time.sleep(0.25)
+        assert catalogue.is_stale()
+
+        target = zamzar.formats.find("mp3").targets[0].name
+        for _ in range(5):
+            assert catalogue.can_convert("mp3", target)
+        for _ in range(100):
+            if not catalogue.is_stale():
+                break
+            time.sleep(0.01)
+
+        assert not catalogue.is_stale(), "Should have refreshed the catalogue"
+        assert 2 * pages == list_spy.call_count, "Should have refreshed the catalogue exactly once"
+
+    def test_retrieves_catalogue_once_when_first_needed_concurrently(self, zamzar, mocker):
+        """Test that threads that first need the catalogue at the same time wait for a single retrieval of it."""
+        retrieve = zamzar.formats.list
+
+        def slowly_retrieve(*args, **kwargs):
+            time.sleep(0.01)
+            return retrieve(*args, **kwargs)
+
+        list_spy = mocker.patch.object(zamzar.formats, "list", side_effect=slowly_retrieve)
+        FormatsCatalogue(zamzar).refresh()
+        pages = list_spy.call_count
+
+        catalogue = FormatsCatalogue(zamzar)
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            indexes = list(executor.map(lambda _: catalogue.index, range(5)))
+
+        assert all(index is indexes[0] for index in indexes)
+        assert 2 * pages == list_spy.call_count, "Should have retrieved the catalogue once more"
+
+    def test_persists_catalogue(self, zamzar, mocker, tmp_path):
+        """Test that the FormatsCatalogue can be loaded from a file without any network calls."""
+        path = tmp_path / "formats.json"
+        FormatsCatalogue(zamzar, path=path).refresh()
+        assert path.exists(), "Should have saved the catalogue"
+
+        list_spy = mocker.spy(zamzar.formats, "list")
+        catalogue = FormatsCatalogue(zamzar, path=path)
+
+        assert catalogue.targets("mp3")
+        assert 0 == list_spy.call_count
+
+    def test_job_creation_can_be_validated(self, zamzar, mocker, tmp_path):
+        """Test that the JobsService can validate a conversion against the catalogue before uploading the source."""
+        source = tmp_path / "source.mp3"
+        source.write_text("Hello, world!")
+        upload = mocker.spy(zamzar.files, "upload")
+
+        with pytest.raises(ApiException):
+            zamzar.jobs.create(source, "not-a-format", validate=True)
+
+        assert 0 == upload.call_count
@@ -17,6 +17,12 @@ class TestFormatsService:
         for f in formats.items:
             assert f.name is not None, "Should have a name"
 
+    def test_iter_all(self, zamzar):
+        """Test that the FormatsService can iterate over every format, across several pages."""
+        names = [f.name for f in zamzar.formats.iter_all(prefetch=True)]
+        assert 50 < len(names)
+        assert len(names) == len(set(names)), "Should not repeat formats"
+
     def test_list_and_page_forwards(self, zamzar):
         """Test that the FormatsService can list and page forwards."""
         number_of_pages = 0
@@ -20,6 +20,13 @@ class TestImportsService:
         for i in imports.items:
             assert i.id > 0, "Should have an id"
 
+    def test_iter_all(self, zamzar):
+        """Test that the ImportsService can iterate over every import."""
+        first_page = zamzar.imports.list(limit=2)
+        imports = list(zamzar.imports.iter_all(limit=2))
+        assert [i.id for i in first_page.items] == [i.id for i in imports[:2]]
+        assert len(imports) > 2
+
     def test_list_and_page_forwards(self, zamzar):
         """Test that the ImportsService can list and page forwards."""
         number_of_pages = 0
@@ -0,0 +1,99 @@
+from typing import List
+
+import pytest
+import urllib3
+
+from zamzar import ZamzarClient
+from zamzar.facade.instrumentation import HistogramCollector, RequestEvent, RequestObserver
+
+
+class RecordingObserver(RequestObserver):
+    def __init__(self):
+        self.calls: List[str] = []
+        self.events: List[RequestEvent] = []
+
+    def on_request_start(self, event):
+        self.calls.append("start")
+
+    def on_retry(self, event, retry):
+        self.calls.append(f"retry {retry.status}")
+
+    def on_response(self, event):
+        self.calls.append("response")
+        self.events.append(event)
+
+    def on_error(self, event, error):
+        self.calls.append("error")
+        self.events.append(event)
+
+
+class TestInstrumentation:
+    """Test class for the instrumentation module."""
+
+    @pytest.mark.parametrize("url, expected", [
+        ("https://api.zamzar.com/v1/jobs", "/jobs"),
+        ("https://api.zamzar.com/v1/jobs/123", "/jobs/{id}"),
+        ("https://api.zamzar.com/v1/files/123/content?limit=1", "/files/{id}/content"),
+    ])
+    def test_templates_routes(self, url, expected):
+        """Test that request routes are templated, with IDs replaced by placeholders."""
+        assert expected == RequestEvent.route_of(url)
+
+    def test_notifies_observers(self, api_key, test_host, file_id):
+        """Test that the ZamzarClient notifies observers of each request."""
+        observer = RecordingObserver()
+        zamzar = ZamzarClient(api_key=api_key, host=test_host, observers=[observer])
+        zamzar.files.find(file_id)
+
+        assert ["start", "response"] == observer.calls
+        event = observer.events[0]
+        assert ("GET", "/files/{id}", 200, 0) == (event.method, event.route, event.status, event.retries)
+        assert event.duration is not None and event.duration > 0
+        assert event.bytes_received is not None and event.bytes_received > 0
+
+    def test_notifies_observers_of_retries_and_errors(self, zamzar, set_fake_responses, create_mock_response):
+        """Test that the ZamzarClient notifies observers of retried and failed requests."""
+        observer = RecordingObserver()
+        zamzar.pool_manager.observers.append(observer)
+        zamzar.retries = urllib3.Retry(total=1, backoff_factor=0, status_forcelist=[503], allowed_methods=None)
+        set_fake_responses([
+            create_mock_response(503),
+            create_mock_response(200, json_body={"data": [], "paging": {"total_count": 0}}),
+            urllib3.exceptions.ProtocolError("Connection aborted"),
+        ])
+
+        zamzar.jobs.list()
+        with pytest.raises(Exception):
+            zamzar.jobs.list()
+
+        assert ["start", "retry 503", "response", "start", "error"] == observer.calls
+        assert 1 == observer.events[0].retries
+
+    def test_ignores_failing_observers(self, zamzar, file_id):
+        """Test that an observer that raises an exception does not cause the request to fail."""
+
+        class FailingObserver(RequestObserver):
+            def on_response(self, event):
+                raise RuntimeError("Boom")
+
+        zamzar.pool_manager.observers.append(FailingObserver())
+        assert zamzar.files.find(file_id).id == file_id
+
+    def test_histogram_collector(self, api_key, test_host, file_id):
+        """Test that the HistogramCollector aggregates statistics per route."""
+        collector = HistogramCollector(buckets=(0.5, 60.0))
+        zamzar = ZamzarClient(api_key=api_key, host=test_host, observers=[collector])
+        zamzar.files.find(file_id)
+        zamzar.files.find(file_id)
+        zamzar.jobs.list()
+
+        statistics = collector.snapshot()
+        assert {("GET", "/files/{id}"), ("GET", "/jobs")} == set(statistics.keys())
+        files = statistics[("GET", "/files/{id}")]
+        assert 2 == files.requests
+        assert 2 == files.statuses[200]
+        assert files.percentile(50) in (0.5, 60.0)
+        assert "GET /jobs: 1 requests" in str(collector)
+
+        collector.reset()
+        assert {} == collector.snapshot()
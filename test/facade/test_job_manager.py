@@ -1,7 +1,12 @@
+import time
+from datetime import timedelta
+
 import pytest
 
 from test.facade.assertions import assert_non_empty_file
 from zamzar import ApiException
+from zamzar.facade.job_manager import JobManager
+from zamzar.models import File, Job
 
 
 class TestJobManager:
@@ -27,6 +32,31 @@ class TestJobManager:
         with pytest.raises(ApiException):
             zamzar.jobs.find(failing_job_id).await_completion(throw_on_failure=True)
 
+    def test_await_honours_retry_after(self, zamzar, mocker, set_fake_responses, create_mock_response):
+        """Test that the JobManager waits at least as long as the server asks before polling again."""
+        sleep = mocker.patch("time.sleep")
+        set_fake_responses([
+            create_mock_response(200, headers={"Retry-After": "7"}, json_body={"id": 1, "status": "converting"}),
+            create_mock_response(200, json_body={"id": 1, "status": "successful"}),
+        ])
+
+        job = JobManager(zamzar, Job(id=1, status="converting"))
+        assert job.await_completion(backoff=[timedelta(milliseconds=1)]).has_succeeded()
+
+        assert [0.001, 7.0] == [call.args[0] for call in sleep.call_args_list]
+
+    def test_await_refreshes_at_deadline_without_oversleeping(self, zamzar, mocker):
+        """Test that the JobManager clamps its backoff to the timeout, and refreshes once more at the deadline."""
+        job = JobManager(zamzar, Job(id=1, status="converting"))
+        refresh = mocker.patch.object(JobManager, "refresh", return_value=job)
+
+        started = time.monotonic()
+        with pytest.raises(ApiException):
+            job.await_completion(timeout=timedelta(milliseconds=50), backoff=[timedelta(seconds=60)])
+
+        assert time.monotonic() - started < 1, "Should not have slept for the full backoff period"
+        assert 1 == refresh.call_count, "Should have refreshed at the deadline"
+
     def test_throw_when_awaited_not_found(self, zamzar, mock_server, succeeding_job_id):
         """Test that an ApiException is thrown when a job is not found."""
         job = zamzar.jobs.find(succeeding_job_id)
@@ -75,3 +105,15 @@ class TestJobManager:
         """Test that an exception is thrown when trying to store a job with no target files."""
         with pytest.raises(ApiException):
             zamzar.jobs.find(failing_job_id).await_completion().store(tmp_path)
+
+    def test_delete_all_files_of_small_job_inline(self, zamzar, mocker):
+        """Test that the files of a job with only a couple of files are deleted without starting a pool of workers."""
+        executor = mocker.patch("zamzar.facade.files_service.ThreadPoolExecutor", side_effect=AssertionError)
+        delete = mocker.patch.object(zamzar.files._api, "delete_file_by_id")
+        source, target = File(id=1, name="source.docx"), File(id=2, name="target.pdf")
+        job = JobManager(zamzar, Job(id=1, status="successful", source_file=source, target_files=[target]))
+
+        job.delete_all_files()
+
+        assert [1, 2] == [call.kwargs["file_id"] for call in delete.call_args_list]
+        executor.assert_not_called()
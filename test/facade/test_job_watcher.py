@@ -0,0 +1,97 @@
+from datetime import timedelta
+from typing import List
+
+import pytest
+
+from zamzar import ApiException
+from zamzar.facade import JobWatcher
+from zamzar.facade.job_manager import JobManager
+from zamzar.facade.job_watcher import Watchable
+from zamzar.models import Job
+
+
+class TestJobWatcher:
+    """Test class for the JobWatcher module."""
+
+    def test_watch_jobs_and_imports(self, zamzar, succeeding_job_id, failing_job_id, succeeding_import_id):
+        """Test that the JobWatcher resolves the future of each watched job and import once it has completed."""
+        watcher = JobWatcher(zamzar)
+        succeeding = watcher.watch(zamzar.jobs.find(succeeding_job_id))
+        failing = watcher.watch(zamzar.jobs.find(failing_job_id))
+        _import = watcher.watch(zamzar.imports.find(succeeding_import_id))
+
+        completed = list(watcher.as_completed())
+
+        assert {succeeding, failing, _import} == set(completed)
+        assert succeeding.result().has_succeeded()
+        assert failing.result().has_failed()
+        assert _import.result().has_succeeded()
+        assert 0 == watcher.pending
+
+    def test_invokes_callbacks(self, zamzar, succeeding_job_id):
+        """Test that the JobWatcher invokes the callback for a job once it has completed."""
+        completed: List[Watchable] = []
+        watcher = JobWatcher(zamzar)
+        watcher.watch(zamzar.jobs.find(succeeding_job_id), completed.append)
+        watcher.run()
+
+        assert [succeeding_job_id] == [job.id for job in completed]
+        assert completed[0].has_succeeded()
+
+    def test_refreshes_many_jobs_with_a_single_list_request(
+            self, zamzar, mocker, succeeding_multi_output_job_id, failing_job_id
+    ):
+        """Test that the JobWatcher refreshes jobs that are due at the same time from a page of jobs."""
+        stale = [
+            JobManager(zamzar, zamzar.jobs.find(job_id).model.model_copy(update={"status": "converting"}))
+            for job_id in [succeeding_multi_output_job_id, failing_job_id]
+        ]
+        list_spy = mocker.spy(zamzar.jobs, "list")
+        find_spy = mocker.spy(zamzar.jobs, "find")
+
+        watcher = JobWatcher(zamzar, backoff=[timedelta(0)])
+        futures = [watcher.watch(job) for job in stale]
+        watcher.run()
+
+        assert [future.result().has_completed() for future in futures] == [True, True]
+        assert 1 == list_spy.call_count
+        assert 0 == find_spy.call_count
+
+    def test_honours_retry_after(self, zamzar, mocker, set_fake_responses, create_mock_response):
+        """Test that the JobWatcher waits at least as long as the server asks before refreshing a job again."""
+        clock = mocker.patch("zamzar.facade.job_watcher.time")
+        clock.monotonic.return_value = 0.0
+        clock.sleep.side_effect = lambda seconds: setattr(clock.monotonic, "return_value", clock.monotonic() + seconds)
+        set_fake_responses([
+            create_mock_response(200, headers={"Retry-After": "7"}, json_body={"id": 1, "status": "converting"}),
+            create_mock_response(200, json_body={"id": 1, "status": "successful"}),
+        ])
+
+        watcher = JobWatcher(zamzar, backoff=[timedelta(milliseconds=1)])
+        future = watcher.watch(JobManager(zamzar, Job(id=1, status="converting")))
+        watcher.run()
+
+        assert future.result().has_succeeded()
+        assert [0.001, 7.0] == [call.args[0] for call in clock.sleep.call_args_list]
+
+    def test_times_out(self, zamzar, mocker, succeeding_job_id):
+        """Test that the JobWatcher fails the future of a job that does not complete in time."""
+        job = JobManager(zamzar, zamzar.jobs.find(succeeding_job_id).model.model_copy(update={"status": "converting"}))
+        mocker.patch.object(JobManager, "refresh", return_value=job)
+
+        watcher = JobWatcher(zamzar, timeout=timedelta(0), backoff=[timedelta(0)])
+        future = watcher.watch(job)
+        watcher.run()
+
+        with pytest.raises(ApiException):
+            future.result()
+
+    def test_reports_refresh_failures(self, zamzar, mock_server, succeeding_job_id):
+        """Test that the JobWatcher fails the future of a job that can no longer be refreshed."""
+        watcher = JobWatcher(zamzar)
+        future = watcher.watch(zamzar.jobs.find(succeeding_job_id))
+        mock_server.destroy(f"/jobs/{succeeding_job_id}")
+        watcher.run()
+
+        with pytest.raises(ApiException):
+            future.result()
@@ -1,3 +1,5 @@
+from typing import List
+
 import pytest
 
 from zamzar import ApiException
@@ -57,6 +59,46 @@ class TestJobsService:
             assert job.id > 0
             assert job.has_succeeded()
 
+    def test_iter_all(self, zamzar):
+        """Test that the JobsService can iterate over every job, one page at a time."""
+        expected: List[int] = []
+        page = zamzar.jobs.list(limit=2)
+        while page.items:
+            expected.extend(job.id for job in page.items)
+            page = page.next_page()
+
+        assert expected == [job.id for job in zamzar.jobs.iter_all(limit=2)]
+        assert expected == [job.id for job in zamzar.jobs.iter_all(limit=2, prefetch=True)]
+
+    def test_iter_all_until(self, zamzar, mocker):
+        """Test that the JobsService stops iterating (and retrieving pages) once the predicate is satisfied."""
+        list_spy = mocker.spy(zamzar.jobs, "list")
+        first_two = [job.id for job in zamzar.jobs.iter_all(limit=2)][:2]
+        list_spy.reset_mock()
+
+        jobs = list(zamzar.jobs.iter_all(limit=1, until=lambda job: job.id < first_two[1]))
+
+        assert first_two == [job.id for job in jobs]
+        assert 3 == list_spy.call_count, "Should not have retrieved any more pages"
+
+    def test_iter_all_stops_at_last_page(self, zamzar, mocker):
+        """Test that the JobsService retrieves no more pages once the last (i.e., partial or only) page is retrieved."""
+        total_count = zamzar.jobs.list().paging.total_count
+        list_spy = mocker.spy(zamzar.jobs, "list")
+
+        assert total_count == len(list(zamzar.jobs.iter_all(limit=total_count)))
+        assert 1 == list_spy.call_count, "Should not have retrieved a page after the only page"
+
+        list_spy.reset_mock()
+        assert total_count == len(list(zamzar.jobs.iter_all(limit=total_count - 1, prefetch=True)))
+        assert 2 == list_spy.call_count, "Should not have retrieved a page after the partial page"
+
+    def test_iter_all_successful(self, zamzar):
+        """Test that the JobsService can iterate over every successful job."""
+        jobs = list(zamzar.jobs.successful.iter_all())
+        assert 0 < len(jobs)
+        assert all(job.has_succeeded() for job in jobs)
+
     def test_list_and_page_forwards(self, zamzar):
         """Test that the JobsService can list and page forwards."""
         number_of_pages = 0
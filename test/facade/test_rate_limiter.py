@@ -0,0 +1,108 @@
+import time
+
+import pytest
+import urllib3
+
+from zamzar import ApiException, ZamzarClient
+from zamzar.facade.rate_limiter import RateLimiter, RequestCategory, TokenBucket
+
+
+class TestRateLimiter:
+    """Test class for the rate_limiter module."""
+
+    @pytest.mark.parametrize("method, url, expected", [
+        ("GET", "https://api.zamzar.com/v1/jobs/1", RequestCategory.POLLING),
+        ("GET", "https://api.zamzar.com/v1/files?limit=50", RequestCategory.POLLING),
+        ("POST", "https://api.zamzar.com/v1/jobs", RequestCategory.SUBMISSION),
+        ("DELETE", "https://api.zamzar.com/v1/files/1", RequestCategory.SUBMISSION),
+        ("POST", "https://api.zamzar.com/v1/files", RequestCategory.TRANSFER),
+        ("GET", "https://api.zamzar.com/v1/files/1/content", RequestCategory.TRANSFER),
+    ])
+    def test_categorize(self, method, url, expected):
+        """Test that requests are categorised, so that each category can be limited separately."""
+        assert expected == RateLimiter.categorize(method, url)
+
+    def test_token_bucket_allows_bursts_then_limits_rate(self):
+        """Test that a TokenBucket allows a burst of requests, and then limits the rate of subsequent requests."""
+        bucket = TokenBucket(rate=20, burst=3)
+
+        started = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+        assert time.monotonic() - started < 0.05, "Should allow a burst"
+
+        for _ in range(2):
+            bucket.acquire()
+        assert time.monotonic() - started >= 0.09, "Should limit the rate after the burst"
+
+    def test_token_bucket_adapts_to_rate_limiting(self, mocker):
+        """Test that a TokenBucket slows down (and pauses for Retry-After) when rate limited, then recovers."""
+        sleep = mocker.patch("time.sleep")
+        bucket = TokenBucket(rate=10, burst=10, increase=0.25)
+
+        bucket.penalize(retry_after=3)
+        assert 5 == bucket.current_rate
+        bucket.acquire()
+        assert sleep.call_args.args[0] >= 2.9, "Should pause for the Retry-After period"
+
+        bucket.reward()
+        assert 7.5 == bucket.current_rate
+        bucket.reward()
+        bucket.reward()
+        assert 10 == bucket.current_rate, "Should never exceed the maximum rate"
+
+    def test_token_bucket_never_adapts_below_minimum_rate(self):
+        """Test that a TokenBucket never slows below its minimum rate."""
+        bucket = TokenBucket(rate=10, min_rate=6)
+        bucket.penalize()
+        assert 6 == bucket.current_rate
+
+    def test_token_bucket_halves_rate_once_per_burst_of_penalties(self):
+        """Test that concurrent rate-limited responses halve the rate only once, but later ones halve it again."""
+        bucket = TokenBucket(rate=100, min_rate=1)
+        for _ in range(5):
+            bucket.penalize()
+        assert 50 == bucket.current_rate
+
+        time.sleep(0.03)
+        bucket.penalize()
+        assert 25 == bucket.current_rate
+
+    def test_client_limits_rate_of_requests(self, api_key, test_host, file_id):
+        """Test that the ZamzarClient acquires a token from the bucket for the category of each request."""
+        polling = TokenBucket(rate=20, burst=1)
+        zamzar = ZamzarClient(api_key=api_key, host=test_host, rate_limiter=RateLimiter(polling=polling))
+
+        started = time.monotonic()
+        for _ in range(3):
+            zamzar.files.find(file_id)
+        assert time.monotonic() - started >= 0.09, "Should have limited the rate of polling requests"
+
+    def test_client_adapts_rate_when_rate_limited(self, zamzar, set_fake_responses, create_mock_response):
+        """Test that the ZamzarClient slows down when its requests are rate limited."""
+        submission = TokenBucket(rate=10)
+        zamzar.rate_limiter = RateLimiter(submission=submission)
+        zamzar.retries = urllib3.Retry(total=0, raise_on_status=False)
+        set_fake_responses([create_mock_response(429)])
+
+        with pytest.raises(Exception):
+            zamzar.jobs.cancel(1)
+
+        assert 5 == submission.current_rate
+
+    @pytest.mark.parametrize("status, expected_rate", [(200, 10), (503, 5)])
+    def test_client_adapts_rate_only_when_retry_after_limits(
+            self, zamzar, set_fake_responses, create_mock_response, status, expected_rate
+    ):
+        """Test that a Retry-After on a 503 slows the client down, but one on a successful response does not."""
+        submission = TokenBucket(rate=10)
+        zamzar.rate_limiter = RateLimiter(submission=submission)
+        zamzar.retries = urllib3.Retry(total=0, raise_on_status=False)
+        set_fake_responses([create_mock_response(status, headers={"Retry-After": "1"}, json_body={"id": 1})])
+
+        try:
+            zamzar.jobs.cancel(1)
+        except ApiException:
+            pass
+
+        assert expected_rate == submission.current_rate
@@ -0,0 +1,138 @@
+import io
+from typing import Any, Dict, List, Tuple
+
+import pytest
+import urllib3
+
+from zamzar import ZamzarClient
+from zamzar.facade.transport import HttpxTransport, Transport
+
+
+class SingleAttemptTransport(Transport):
+    """A minimal transport, which makes a single attempt at each request with a urllib3 PoolManager."""
+
+    def __init__(self):
+        self.pool = urllib3.PoolManager()
+        self.sent: List[str] = []
+
+    def send(self, method, url, body, headers, timeout, preload_content):
+        self.sent.append(f"{method} {url}")
+        return self.pool.urlopen(
+            method, url, body=body, headers=headers, timeout=timeout, retries=False, preload_content=preload_content
+        )
+
+
+class ScriptedTransport(Transport):
+    """A transport that answers requests with the given responses (in order), recording each request."""
+
+    def __init__(self, responses: List[urllib3.HTTPResponse]):
+        self.responses = responses
+        self.sent: List[Tuple[str, str, Any, Dict[str, str]]] = []
+
+    def send(self, method, url, body, headers, timeout, preload_content):
+        self.sent.append((method, url, body, headers))
+        return self.responses.pop(0)
+
+
+class TestTransport:
+    """Test class for the Transport module."""
+
+    def test_pool_manager_is_a_transport(self, zamzar):
+        """Test that the default transport (a urllib3 PoolManager) is a Transport."""
+        assert isinstance(zamzar.pool_manager.delegate, Transport)
+
+    def test_client_uses_transport(self, api_key, test_host, tmp_path):
+        """Test that a client can make every kind of request through an alternative transport."""
+        transport = SingleAttemptTransport()
+        zamzar = ZamzarClient(api_key, host=test_host, transport=transport)
+
+        uploaded = zamzar.files.upload(io.BytesIO(b"Hello, world!"), "source.txt")
+        job = zamzar.jobs.create(uploaded.id, "pdf", options={"quality": 50}).await_completion().store(tmp_path)
+        zamzar.files.list(limit=2)
+
+        assert job.has_succeeded()
+        assert 0 < len(list(tmp_path.iterdir())), "Should have downloaded the converted file"
+        assert any(sent.startswith("POST") and sent.endswith("/jobs") for sent in transport.sent)
+        assert any(sent.endswith("/files?limit=2") for sent in transport.sent)
+
+    def test_retries_per_policy(self, api_key, test_host, mocker):
+        """Test that a transport retries requests per the client's retry policy, rewinding the request body."""
+        transport = SingleAttemptTransport()
+        retries = urllib3.Retry(total=2, status_forcelist=[503], allowed_methods=None, backoff_factor=0)
+        zamzar = ZamzarClient(api_key, host=test_host, transport=transport, retries=retries)
+        bodies: List[bytes] = []
+        send = transport.send
+
+        def unavailable_then_send(method, url, body, headers, timeout, preload_content):
+            bodies.append(body.read() if hasattr(body, "read") else body)
+            if len(bodies) == 1:
+                return urllib3.HTTPResponse(body=b"", status=503, preload_content=False)
+            if hasattr(body, "seek"):
+                body.seek(0)
+            return send(method, url, body, headers, timeout, preload_content)
+
+        mocker.patch.object(transport, "send", side_effect=unavailable_then_send)
+
+        uploaded = zamzar.files.upload(io.BytesIO(b"Hello, world!"), "source.txt")
+
+        assert uploaded.id is not None
+        assert 2 == len(bodies)
+        assert bodies[0] == bodies[1], "Should have resent the whole body"
+
+    def test_follows_redirects(self, api_key, test_host, tmp_path, mocker):
+        """Test that a transport follows redirects (e.g., to the content of a file) per the client's retry policy."""
+        transport = SingleAttemptTransport()
+        zamzar = ZamzarClient(api_key, host=test_host, transport=transport)
+        uploaded = zamzar.files.upload(io.BytesIO(b"Hello, world!"), "source.txt")
+        send = transport.send
+
+        def redirect_content(method, url, body, headers, timeout, preload_content):
+            if url.endswith("/content"):
+                transport.sent.append(f"{method} {url}")
+                return urllib3.HTTPResponse(body=b"", status=307, headers={"Location": f"{url}?signed=1"})
+            return send(method, url, body, headers, timeout, preload_content)
+
+        mocker.patch.object(transport, "send", side_effect=redirect_content)
+
+        target = tmp_path / "target.txt"
+        zamzar.download(uploaded.id, target)
+
+        assert target.read_bytes() == b"Hello, world!"
+        assert transport.sent[-1].endswith(f"/files/{uploaded.id}/content?signed=1")
+
+    @pytest.mark.parametrize("status, method, body", [(303, "GET", None), (307, "POST", b"body")])
+    def test_redirects_per_status(self, status, method, body):
+        """Test that redirects keep (or, for 303, drop) the method and body, and never send credentials elsewhere."""
+        transport = ScriptedTransport([
+            urllib3.HTTPResponse(body=b"", status=status, headers={"Location": "https://other.example.com/content"}),
+            urllib3.HTTPResponse(body=b"content", status=200),
+        ])
+
+        response = transport.request("POST", "https://api.example.com/jobs", body=b"body", headers={
+            "Authorization": "Bearer key",
+            "Content-Type": "text/plain",
+        })
+
+        assert response.data == b"content"
+        redirected = transport.sent[1]
+        assert (method, "https://other.example.com/content", body) == redirected[:3]
+        assert "Authorization" not in redirected[3]
+
+    def test_does_not_follow_redirects_when_disabled(self):
+        """Test that redirects are returned (rather than followed) when the retry policy disables them."""
+        transport = ScriptedTransport([urllib3.HTTPResponse(body=b"", status=302, headers={"Location": "/elsewhere"})])
+
+        assert 302 == transport.request("GET", "https://api.example.com/", retries=urllib3.Retry(redirect=False)).status
+        assert 1 == len(transport.sent)
+
+    def test_httpx_transport(self, api_key, test_host, tmp_path):
+        """Test that a client can make requests through the httpx transport (where httpx is installed)."""
+        pytest.importorskip("httpx")
+        zamzar = ZamzarClient(api_key, host=test_host, transport=HttpxTransport(http2=False))
+
+        uploaded = zamzar.files.upload(io.BytesIO(b"Hello, world!"), "source.txt")
+        job = zamzar.convert(uploaded.id, "pdf")
+
+        assert job.has_succeeded()
+        job.store(tmp_path)
+        assert 0 < len(list(tmp_path.iterdir()))
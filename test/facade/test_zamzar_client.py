@@ -1,7 +1,12 @@
+import threading
+import time
+
 import pytest
 
-from zamzar import Environment, ZamzarClient
+from zamzar import ApiException, Environment, ZamzarClient
 from zamzar.exceptions import NotFoundException
+from zamzar.facade.job_manager import JobManager
+from zamzar.models import Job
 from .assertions import assert_non_empty_file
 
 
@@ -106,6 +111,94 @@ class TestZamzarClient:
         job.store(output)
         assert_non_empty_file(output)
 
+    def test_convert_many(self, zamzar, tmp_path):
+        """Test that the ZamzarClient can convert, store, and delete many files, reporting each outcome."""
+        sources = [tmp_path / f"source-{i}.pdf" for i in range(3)]
+        for source in sources:
+            source.write_text("Hello, world!")
+        missing = tmp_path / "missing.pdf"
+        target = tmp_path / "target"
+        target.mkdir()
+
+        results = list(zamzar.convert_many(sources + [missing], "txt", target, delete_files=True, max_in_flight=2))
+
+        assert {str(source) for source in sources + [missing]} == {str(result.source) for result in results}
+        succeeded = [result for result in results if result.succeeded]
+        assert 3 == len(succeeded), "Should have converted every existing source"
+        # Note the zamzar-mock gives every converted file the same name
+        assert 0 < len(list(target.iterdir())), "Should have stored the converted files"
+        for result in succeeded:
+            with pytest.raises(NotFoundException):
+                zamzar.files.find(result.job.source_file_id)
+
+        failed = next(result for result in results if not result.succeeded)
+        assert failed.source == missing
+        assert isinstance(failed.error, ValueError), "Should report (rather than raise) the failure"
+
+    def test_convert_many_bounds_in_flight_conversions(self, zamzar, mocker):
+        """Test that the ZamzarClient never runs more than max_in_flight conversions at once."""
+        lock = threading.Lock()
+        in_flight = []
+        peak = 0
+
+        def convert(source, *args):
+            nonlocal peak
+            with lock:
+                in_flight.append(source)
+                peak = max(peak, len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(source)
+            job = mocker.Mock(id=source)
+            job.await_completion.return_value = job
+            return job
+
+        mocker.patch.object(zamzar.jobs, "create", side_effect=convert)
+        results = list(zamzar.convert_many(range(20), "pdf", max_in_flight=3))
+
+        assert sorted(result.job.id for result in results) == list(range(20))
+        assert 3 == peak
+
+    def test_convert_many_deletes_files_when_awaiting_fails(self, zamzar, mocker, tmp_path):
+        """Test that the ZamzarClient deletes the files of a job that it fails to await, when asked to delete files."""
+        source = tmp_path / "source.pdf"
+        source.write_text("Hello, world!")
+        mocker.patch.object(
+            JobManager, "await_completion", side_effect=ApiException("Timed out waiting for completion")
+        )
+
+        [result] = list(zamzar.convert_many([source], "txt", delete_files=True))
+
+        assert isinstance(result.error, ApiException)
+        assert result.job is not None, "Should have captured the job that was created"
+        with pytest.raises(NotFoundException):
+            zamzar.files.find(result.job.source_file_id)
+
+    def test_convert_many_stops_without_waiting_for_running_conversions(self, zamzar, mocker):
+        """Test that closing the results early neither waits for running conversions nor starts queued ones."""
+        release = threading.Event()
+        started = []
+
+        def create(source, *args):
+            started.append(source)
+            if source > 0:
+                release.wait(5)
+            job = mocker.Mock(id=source)
+            job.await_completion.return_value = job
+            return job
+
+        mocker.patch.object(zamzar.jobs, "create", side_effect=create)
+        results = zamzar.convert_many(range(20), "pdf", max_in_flight=3)
+
+        began = time.monotonic()
+        assert 0 == next(results).job.id
+        results.close()
+        elapsed = time.monotonic() - began
+        release.set()
+
+        assert elapsed < 1, "Should not have waited for the running conversions"
+        assert len(started) <= 4, "Should not have started the queued conversions"
+
     def test_can_hit_production(self, api_key):
         """Test that the ZamzarClient returns a welcome message when directed at the production environment."""
         zamzar = ZamzarClient(api_key=api_key, environment=Environment.PRODUCTION)
@@ -125,6 +218,34 @@ class TestZamzarClient:
         assert zamzar.timeout.connect_timeout == 15.0
         assert zamzar.timeout.read_timeout == 30.0
 
+    def test_fast_deserialization(self, zamzar):
+        """Test that the fast deserialization path builds the same models as the generated client."""
+        expected = [job.model for job in zamzar.jobs.list().items]
+        zamzar.fast_deserialization = True
+        assert expected == [job.model for job in zamzar.jobs.list().items]
+        assert expected[0] == zamzar.jobs.find(expected[0].id).model
+
+    def test_lazy_timestamps(self, zamzar):
+        """Test that lazy timestamps are parsed (on access) to the same values as the (eager) fast path."""
+        zamzar.fast_deserialization = True
+        expected = [job.model for job in zamzar.jobs.list().items]
+        zamzar.lazy_timestamps = True
+        jobs = [job.model for job in zamzar.jobs.list().items]
+        assert [job.created_at for job in expected] == [job.created_at for job in jobs]
+        assert [job.to_dict() for job in expected] == [job.to_dict() for job in jobs]
+
+    def test_lean_models(self, zamzar):
+        """Test that lean records can be used in place of models when listing jobs."""
+        expected = {job.id: job for job in zamzar.jobs.iter_all()}
+        zamzar.lean_models = True
+        jobs = list(zamzar.jobs.iter_all())
+        assert expected.keys() == {job.id for job in jobs}
+        for job in jobs:
+            assert expected[job.id].model.status == job.model.status
+            assert expected[job.id].target_file_ids == job.target_file_ids
+            assert expected[job.id].has_completed() == job.has_completed()
+        assert isinstance(zamzar.jobs.find(jobs[0].id).model, Job), "Should only use records for lists"
+
     def test_retries_on_server_error(self, zamzar, set_fake_responses, create_mock_response):
         """Test that the ZamzarClient retries on server error."""
         set_fake_responses([
@@ -167,3 +288,40 @@ class TestZamzarClient:
         # should capture the latest credit usage
         assert zamzar.last_production_credits_remaining == 42
         assert zamzar.last_sandbox_credits_remaining == 24
+
+    def test_ignores_malformed_credit_usage(self, zamzar, set_fake_responses, create_mock_response):
+        """Test that a malformed credits header is ignored, rather than failing a request that succeeded."""
+        set_fake_responses([
+            create_mock_response(
+                200,
+                headers={"Zamzar-Credits-Remaining": "--5", "Zamzar-Test-Credits-Remaining": "\u00b2"},
+                json_body={"data": [], "paging": {"total_count": 0}},
+            ),
+        ])
+
+        assert [] == zamzar.jobs.list().items
+        assert zamzar.last_production_credits_remaining is None
+        assert zamzar.last_sandbox_credits_remaining is None
+
+    def test_tracks_credit_usage_per_thread(self, zamzar, set_fake_responses, create_mock_response):
+        """Test that the ZamzarClient tracks the credits reported to each thread, and the lowest overall."""
+        set_fake_responses([
+            create_mock_response(
+                200,
+                headers={"Zamzar-Credits-Remaining": "40"},
+                json_body={"data": [], "paging": {"total_count": 0}},
+            ),
+            create_mock_response(
+                200,
+                headers={"Zamzar-Credits-Remaining": "41"},
+                json_body={"data": [], "paging": {"total_count": 0}},
+            ),
+        ])
+
+        thread = threading.Thread(target=zamzar.jobs.list)
+        thread.start()
+        thread.join()
+        zamzar.jobs.list()
+
+        assert zamzar.production_credits.latest_on_this_thread.credits == 41
+        assert zamzar.last_production_credits_remaining == 40
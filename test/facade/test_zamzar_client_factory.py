@@ -0,0 +1,65 @@
+import socket
+
+import urllib3
+
+from zamzar.facade import ZamzarClientFactory
+
+
+class TestZamzarClientFactory:
+    """Test class for the ZamzarClientFactory module."""
+
+    def test_clients_share_connection_pool(self, api_key, test_host):
+        """Test that the clients created by the factory send their requests through a single connection pool."""
+        factory = ZamzarClientFactory(host=test_host)
+        first = factory.create(api_key)
+        second = factory.create(api_key)
+
+        first.account.get()
+        second.account.get()
+
+        assert first.pool_manager.delegate is factory.pool
+        assert second.pool_manager.delegate is factory.pool
+        assert 1 == len(factory.pool.pools), "Should have reused the connection pool for the host"
+
+    def test_clients_use_their_own_api_keys(self, api_key, test_host, mocker):
+        """Test that each client created by the factory authenticates with its own API key."""
+        factory = ZamzarClientFactory(host=test_host)
+        request_spy = mocker.spy(factory.pool, "request")
+
+        factory.create(api_key).account.get()
+        factory.create("another-api-key").account.get()
+
+        headers = [call.kwargs["headers"]["Authorization"] for call in request_spy.call_args_list]
+        assert [f"Bearer {api_key}", "Bearer another-api-key"] == headers
+
+    def test_clients_have_their_own_state(self, api_key, test_host):
+        """Test that the clients created by the factory track credits independently."""
+        factory = ZamzarClientFactory(host=test_host)
+        first = factory.create(api_key)
+        second = factory.create(api_key)
+
+        first.account.get()
+
+        assert first.last_production_credits_remaining is not None
+        assert second.last_production_credits_remaining is None
+
+    def test_tunes_connection_pool(self, test_host):
+        """Test that the factory applies the requested pool size, blocking behaviour and keep-alive options."""
+        factory = ZamzarClientFactory(host=test_host, maxsize=3, block=True)
+
+        pool = factory.pool.connection_from_url(test_host)
+
+        assert pool.pool is not None and 3 == pool.pool.maxsize
+        assert pool.block
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool.conn_kw["socket_options"]
+
+    def test_keep_alive_can_be_disabled(self, test_host):
+        """Test that the factory leaves the default socket options alone when keep-alive is disabled."""
+        factory = ZamzarClientFactory(host=test_host, keep_alive=False)
+
+        assert "socket_options" not in factory.pool.connection_pool_kw
+
+    def test_client_does_not_create_a_second_pool(self, zamzar):
+        """Test that the client's pool manager wraps its delegate, rather than being a connection pool itself."""
+        assert not isinstance(zamzar.pool_manager, urllib3.PoolManager)
+        assert isinstance(zamzar.pool_manager.delegate, urllib3.PoolManager)
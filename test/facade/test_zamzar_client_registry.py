@@ -0,0 +1,83 @@
+import pytest
+
+from zamzar.facade import HistogramCollector, RateLimiter, ZamzarClientFactory, ZamzarClientRegistry
+
+
+class TestZamzarClientRegistry:
+    """Test class for the ZamzarClientRegistry module."""
+
+    @pytest.fixture
+    def registry(self, test_host) -> ZamzarClientRegistry:
+        return ZamzarClientRegistry(ZamzarClientFactory(host=test_host), max_clients=2)
+
+    def test_reuses_client_per_api_key(self, registry, api_key):
+        """Test that the registry returns the same client for the same API key, and a new client for a new API key."""
+        first = registry.get(api_key)
+
+        assert first is registry.get(api_key)
+        assert first is not registry.get("another-api-key")
+        assert 2 == len(registry)
+
+    def test_clients_share_pool_and_catalogue(self, test_host, api_key):
+        """Test that the clients handed out by the registry share a connection pool and formats catalogue."""
+        registry = ZamzarClientRegistry(ZamzarClientFactory(host=test_host), catalogue_api_key=api_key)
+        first = registry.get(api_key)
+        second = registry.get("another-api-key")
+
+        assert first.pool_manager.delegate is second.pool_manager.delegate
+        assert first.catalogue is second.catalogue is registry.catalogue
+        assert registry.catalogue is not None and 0 < len(registry.catalogue.index)
+        assert registry.catalogue._zamzar is not first, "Should retrieve the catalogue with its own client"
+
+    def test_clients_retrieve_own_catalogue_without_catalogue_api_key(self, registry, api_key):
+        """Test that clients do not share a catalogue retrieved with the API key of one of them."""
+        first = registry.get(api_key)
+        second = registry.get("another-api-key")
+
+        assert registry.catalogue is None
+        assert first.catalogue is not second.catalogue
+        assert first.catalogue._zamzar is first
+
+    def test_clients_have_their_own_rate_limiters(self, test_host, api_key):
+        """Test that each client handed out by the registry has its own rate limiter, if a factory is given."""
+        registry = ZamzarClientRegistry(ZamzarClientFactory(host=test_host), rate_limiter_factory=RateLimiter)
+
+        first = registry.get(api_key).rate_limiter
+        second = registry.get("another-api-key").rate_limiter
+
+        assert first is not None and second is not None
+        assert first is not second
+
+    def test_clients_share_observers(self, registry, api_key):
+        """Test that observers registered with the registry are notified of requests made by every client."""
+        collector = HistogramCollector()
+        registry.observers.append(collector)
+
+        registry.get(api_key).account.get()
+        registry.get("another-api-key").account.get()
+
+        assert 2 == collector.snapshot()[("GET", "/account")].requests
+
+    def test_evicts_least_recently_used(self, registry, api_key):
+        """Test that the registry evicts the least recently used client once it holds more than max_clients."""
+        first = registry.get(api_key)
+        registry.get("second-api-key")
+        registry.get(api_key)
+        registry.get("third-api-key")
+
+        assert api_key in registry
+        assert "second-api-key" not in registry
+        assert first is registry.get(api_key)
+
+    def test_evict(self, registry, api_key):
+        """Test that a client can be explicitly evicted from the registry."""
+        client = registry.get(api_key)
+
+        assert client is registry.evict(api_key)
+        assert api_key not in registry
+        assert registry.evict(api_key) is None
+
+    def test_requires_positive_max_clients(self):
+        """Test that the registry refuses to retain no clients."""
+        with pytest.raises(ValueError):
+            ZamzarClientRegistry(max_clients=0)
@@ -0,0 +1,106 @@
+import socket
+import time
+from urllib.parse import urlparse
+
+import pytest
+import urllib3
+
+from zamzar import ZamzarClient
+from zamzar.testing import MockZamzarServer
+
+NO_RETRIES = urllib3.Retry(total=0, raise_on_status=False)
+
+
+def connect(server: MockZamzarServer) -> socket.socket:
+    """Opens a raw connection to the mock server (e.g., to send a request slowly)."""
+    address = urlparse(server.url)
+    assert address.port is not None
+    return socket.create_connection((address.hostname, address.port))
+
+
+class TestMockZamzarServer:
+    """Test class for the MockZamzarServer module."""
+
+    def test_pytest_fixtures(self, zamzar_mock_client):
+        """Test that the pytest fixtures provide a client of a (reset) mock server."""
+        job = zamzar_mock_client.jobs.find(1).await_completion()
+        assert job.has_succeeded()
+
+    def test_conversion_latency(self):
+        """Test that new jobs take at least the configured latency to convert."""
+        with MockZamzarServer(conversion_latency=0.3, conversion_polls=1) as server:
+            zamzar = ZamzarClient("api-key", host=server.url)
+            job = zamzar.jobs.create(1, "pdf")
+
+            assert not job.refresh().has_completed()
+            time.sleep(0.3)
+            assert job.refresh().has_succeeded()
+
+    def test_failure_injection(self):
+        """Test that the configured fraction of new jobs fail."""
+        with MockZamzarServer(failure_rate=1.0) as server:
+            zamzar = ZamzarClient("api-key", host=server.url)
+            job = zamzar.convert(1, "pdf")
+
+            assert not job.has_succeeded()
+            assert job.failure is not None
+
+    def test_error_injection(self):
+        """Test that the configured fraction of requests are rejected with a 503."""
+        with MockZamzarServer(error_rate=1.0) as server:
+            response = urllib3.request("GET", f"{server.url}/account", retries=NO_RETRIES)
+
+            assert 503 == response.status
+
+    def test_rate_limit(self):
+        """Test that requests beyond the rate limit are rejected with a 429 and a Retry-After header."""
+        with MockZamzarServer(rate_limit=2) as server:
+            statuses = [urllib3.request("GET", f"{server.url}/account", retries=NO_RETRIES) for _ in range(3)]
+
+            assert [200, 200, 429] == [response.status for response in statuses]
+            assert 1 <= int(statuses[-1].headers["Retry-After"])
+
+    @pytest.mark.parametrize("supports_ranges, expected_status", [(True, 206), (False, 200)])
+    def test_ranges(self, supports_ranges, expected_status):
+        """Test that file content can be retrieved in byte ranges, unless disabled."""
+        with MockZamzarServer(supports_ranges=supports_ranges) as server:
+            response = urllib3.request("GET", f"{server.url}/files/1/content", headers={"Range": "bytes=2-4"})
+            content = urllib3.request("GET", f"{server.url}/files/1/content").data
+
+            assert expected_status == response.status
+            assert (content[2:5] if supports_ranges else content) == response.data
+
+    def test_credits(self):
+        """Test that creating a job deducts its cost from the credits reported by the server."""
+        with MockZamzarServer(test_credits=10) as server:
+            zamzar = ZamzarClient("api-key", host=server.url)
+            zamzar.jobs.create(1, "pdf")
+
+            assert 9 == zamzar.last_sandbox_credits_remaining
+            server.reset()
+            assert 10 == zamzar.account.get().test_credits_remaining
+
+    def test_slow_upload_does_not_block_other_requests(self):
+        """Test that other requests are served whilst the body of an upload is still being received."""
+        with MockZamzarServer() as server:
+            with connect(server) as upload:
+                upload.sendall(b"POST /v1/files HTTP/1.1\r\nHost: mock\r\nContent-Type: multipart/form-data; "
+                               b"boundary=b\r\nContent-Length: 1000\r\n\r\n--b\r\n")
+
+                response = urllib3.request("GET", f"{server.url}/account", retries=NO_RETRIES, timeout=2)
+
+                assert 200 == response.status
+
+    def test_slow_download_does_not_block_other_requests(self):
+        """Test that other requests are served whilst the content of a download is still being sent."""
+        with MockZamzarServer() as server:
+            file = server.state.add_file("large.bin", bytes(32 * 1024 * 1024))
+            with connect(server) as download:
+                download.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+                download.sendall(f"GET /v1/files/{file['id']}/content HTTP/1.1\r\nHost: mock\r\n\r\n".encode())
+                download.recv(1)
+                time.sleep(0.1)
+
+                response = urllib3.request("GET", f"{server.url}/account", retries=NO_RETRIES, timeout=2)
+
+                assert 200 == response.status
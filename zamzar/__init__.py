@@ -4,7 +4,8 @@
 
 __version__ = "2.0.1"
 
-__all__ = ["facade", "models", "pagination", "Environment", "ZamzarClient"]
+__all__ = ["facade", "models", "pagination", "AsyncZamzarClient", "Environment", "ZamzarClient"]
 
 from zamzar.exceptions import ApiException
+from zamzar.facade.async_zamzar_client import AsyncZamzarClient
 from zamzar.facade.zamzar_client import Environment, ZamzarClient
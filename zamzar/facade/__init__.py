@@ -1,4 +1,15 @@
 # flake8: noqa
 
 # import facades into facade package
+from zamzar.facade.async_zamzar_client import AsyncZamzarClient
+from zamzar.facade.backoff import Backoff, ExpectedDurationBackoff, ExponentialBackoff, Jitter, ListBackoff
+from zamzar.facade.conversion_result import ConversionResult
+from zamzar.facade.credit_governor import CreditBudgetExceededException, CreditGovernor
+from zamzar.facade.deletion_report import DeletionReport
+from zamzar.facade.formats_catalogue import FormatsCatalogue
+from zamzar.facade.instrumentation import HistogramCollector, RequestEvent, RequestObserver
+from zamzar.facade.job_watcher import JobWatcher
+from zamzar.facade.rate_limiter import RateLimiter, RequestCategory, TokenBucket
 from zamzar.facade.zamzar_client import Environment, ZamzarClient
+from zamzar.facade.zamzar_client_factory import ZamzarClientFactory
+from zamzar.facade.zamzar_client_registry import ZamzarClientRegistry
@@ -1,5 +1,12 @@
 # flake8: noqa
 
 # import internals into _internal package
-from zamzar.facade._internal.awaitable import Awaitable
+from zamzar.facade._internal.awaitable import AsyncAwaitable, Awaitable, requested_delay
+from zamzar.facade._internal.bounded import map_bounded
+from zamzar.facade._internal.credit_ledger import CreditLedger, CreditReading
+from zamzar.facade._internal.pages import MAX_PAGE_SIZE, iterate_all
+from zamzar.facade._internal.multipart import MultipartEncoder
+from zamzar.facade._internal.records import record_builder, record_type
+from zamzar.facade._internal.timestamps import parse_date, parse_datetime, with_lazy_timestamps
+from zamzar.facade._internal.zamzar_api_client import ZamzarApiClient
 from zamzar.facade._internal.zamzar_pool_manager import ZamzarPoolManager
@@ -1,62 +1,74 @@
+import asyncio
 import time
 from abc import ABC, abstractmethod
-from datetime import timedelta, datetime
-from typing import Optional, List
+from datetime import timedelta
+from typing import Iterator, Optional, List, Union
 
 from zamzar import ApiException
+from zamzar.facade.backoff import Backoff, ListBackoff, DEFAULT_BACKOFF
 from zamzar.models import Failure
 
 
+def as_backoff(backoff: Optional[Union[Backoff, List[timedelta]]]) -> Backoff:
+    if backoff is None:
+        return DEFAULT_BACKOFF
+    if isinstance(backoff, Backoff):
+        return backoff
+    return ListBackoff(backoff)
+
+
+def requested_delay(zamzar) -> Optional[timedelta]:
+    """
+    Returns the delay that the latest response received on the calling thread asked us to wait (via a Retry-After
+    header), if any.
+    """
+    # Read Retry-After on the thread that made the request (and before any other request), so that it is never taken
+    # from the response to a concurrent request
+    seconds = zamzar.pool_manager.get_retry_after_from_latest_response()
+    return timedelta(seconds=seconds) if seconds is not None else None
+
+
+def next_wait(delays: Iterator[timedelta], requested: Optional[timedelta]) -> timedelta:
+    # Never poll sooner than the server asked us to (via a Retry-After header)
+    wait = next(delays)
+    return max(wait, requested) if requested is not None else wait
+
+
 class Awaitable(ABC):
     """Awaits the completion of an asynchronous API operation."""
 
-    __DEFAULT_BACKOFF = [
-        timedelta(milliseconds=100),
-        timedelta(milliseconds=100),
-        timedelta(milliseconds=200),
-        timedelta(milliseconds=500),
-        timedelta(milliseconds=1000),
-        timedelta(milliseconds=1500),
-        timedelta(seconds=2),
-        timedelta(seconds=5),
-        timedelta(seconds=10),
-        timedelta(seconds=30),
-        timedelta(seconds=30),
-        timedelta(seconds=60)
-    ]
-
     def await_completion(
             self,
             throw_on_failure: bool = False,
             timeout: timedelta = timedelta(minutes=20),
-            backoff: Optional[List[timedelta]] = None
+            backoff: Optional[Union[Backoff, List[timedelta]]] = None
     ):
         """
         Waits for the operation to succeed or fail, returning once it has.
 
         :param throw_on_failure: whether to raise an exception if the operation fails (default: False)
-        :param timeout: the maximum time to wait (default: 20 minutes)
-        :param backoff: the time between retries: a singleton list results in a constant backoff, while a list of
-        increasing values results in exponential backoff (default: a reasonable exponential backoff)
+        :param timeout: the maximum time to wait (default: 20 minutes); the operation is refreshed one last time when
+        the timeout elapses, and an exception is raised if it has still not completed
+        :param backoff: the strategy for choosing the time between retries (see `zamzar.facade.backoff`), or a list of
+        times: a singleton list results in a constant backoff, while a list of increasing values results in exponential
+        backoff (default: exponential backoff with jitter)
         """
 
-        if backoff is None:
-            backoff = Awaitable.__DEFAULT_BACKOFF
-
-        deadline = datetime.now() + timeout
-        attempt = 0
+        delays = as_backoff(backoff).delays(self)
+        deadline = time.monotonic() + timeout.total_seconds()
         current = self
+        requested = None
         while not current.has_completed():
-            # Wait for the next backoff period
-            wait = backoff[min(attempt, len(backoff) - 1)]
-            time.sleep(wait.total_seconds())
-
             # Blow up if we've waited too long
-            if datetime.now() > deadline:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 raise ApiException("Timed out waiting for completion")
 
-            attempt += 1
+            # Wait for the next backoff period, but never beyond the deadline (so the last refresh happens at it)
+            time.sleep(min(next_wait(delays, requested).total_seconds(), remaining))
+
             current = current.refresh()
+            requested = current._requested_delay()
 
         if throw_on_failure and current.has_failed():
             raise ApiException("Waited for completion but failed")
@@ -82,3 +94,74 @@ class Awaitable(ABC):
 
     def has_failed(self) -> bool:
         return self.has_completed() and not self.has_succeeded()
+
+    def _requested_delay(self) -> Optional[timedelta]:
+        """Returns the delay requested by the server (via Retry-After) when the operation was last retrieved, if any."""
+        return None
+
+
+class AsyncAwaitable(ABC):
+    """Awaits the completion of an asynchronous API operation without blocking the event loop."""
+
+    async def await_completion(
+            self,
+            throw_on_failure: bool = False,
+            timeout: timedelta = timedelta(minutes=20),
+            backoff: Optional[Union[Backoff, List[timedelta]]] = None
+    ):
+        """
+        Waits for the operation to succeed or fail, returning once it has.
+
+        :param throw_on_failure: whether to raise an exception if the operation fails (default: False)
+        :param timeout: the maximum time to wait (default: 20 minutes); the operation is refreshed one last time when
+        the timeout elapses, and an exception is raised if it has still not completed
+        :param backoff: the strategy for choosing the time between retries (see `zamzar.facade.backoff`), or a list of
+        times: a singleton list results in a constant backoff, while a list of increasing values results in exponential
+        backoff (default: exponential backoff with jitter)
+        """
+
+        delays = as_backoff(backoff).delays(self)
+        deadline = time.monotonic() + timeout.total_seconds()
+        current = self
+        requested = None
+        while not current.has_completed():
+            # Blow up if we've waited too long
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ApiException("Timed out waiting for completion")
+
+            # Wait for the next backoff period, but never beyond the deadline (yielding to other tasks on the event
+            # loop)
+            await asyncio.sleep(min(next_wait(delays, requested).total_seconds(), remaining))
+
+            current = await current.refresh()
+            requested = current._requested_delay()
+
+        if throw_on_failure and current.has_failed():
+            raise ApiException("Waited for completion but failed")
+
+        return current
+
+    @property
+    @abstractmethod
+    def failure(self) -> Optional[Failure]:
+        pass
+
+    @abstractmethod
+    def has_completed(self) -> bool:
+        pass
+
+    @abstractmethod
+    def has_succeeded(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def refresh(self):
+        pass
+
+    def has_failed(self) -> bool:
+        return self.has_completed() and not self.has_succeeded()
+
+    def _requested_delay(self) -> Optional[timedelta]:
+        """Returns the delay requested by the server (via Retry-After) when the operation was last retrieved, if any."""
+        return None
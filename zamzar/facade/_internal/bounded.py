@@ -0,0 +1,37 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Generator, Iterable, Set, TypeVar
+
+ITEM = TypeVar('ITEM')
+RESULT = TypeVar('RESULT')
+
+
+def map_bounded(
+        function: Callable[[ITEM], RESULT],
+        items: Iterable[ITEM],
+        max_in_flight: int
+) -> Generator[RESULT, None, None]:
+    """
+    Lazily applies a function to each item on a pool of at most max_in_flight workers, yielding each result as it
+    completes. Items are consumed only as workers become free, so the items can be a generator over a large listing.
+
+    If the caller stops early (e.g., closes the generator), the queued items are cancelled without waiting for those
+    that are running.
+    """
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_in_flight)
+    try:
+        in_flight: Set[Future[RESULT]] = set()
+        while True:
+            # Top up the pool with more items, but never hold more than max_in_flight at once
+            for item in items:
+                in_flight.add(executor.submit(function, item))
+                if len(in_flight) >= max_in_flight:
+                    break
+            if not in_flight:
+                return
+
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,66 @@
+import threading
+import time
+from datetime import timedelta
+from typing import NamedTuple, Optional
+
+
+class CreditReading(NamedTuple):
+    """A number of remaining credits, as reported by a response, and when it was observed (per `time.monotonic`)."""
+    credits: int
+    observed_at: float
+
+
+class CreditLedger:
+    """
+    Tracks the remaining credits reported by a header of each response, as responses arrive:
+    - the global view is the lowest value seen, since responses to concurrent requests can arrive out of order (and
+      credits only go down); a higher value replaces it only once it is older than `stale_after` (e.g., after a top up)
+    - the per-thread view is the value reported by the latest response received on the calling thread
+
+    Only the parsed value is kept (never the response itself). Readers never block: each view is a single immutable
+    reading that is replaced atomically.
+
+    The ledger is not lock-free: an update to the global view is a compare-then-replace, which Python cannot perform
+    atomically (it has no compare-and-swap), so it is done under a lock. Responses that would not change the global
+    view (most responses, as credits only go down) are discarded before the lock is taken.
+    """
+
+    def __init__(self, header: str, stale_after: timedelta = timedelta(minutes=1)):
+        self.header = header
+        self.stale_after = stale_after.total_seconds()
+        self.__latest: Optional[CreditReading] = None
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+
+    @property
+    def latest(self) -> Optional[CreditReading]:
+        """Returns the global view of the remaining credits, or None if no response has reported them yet."""
+        return self.__latest
+
+    @property
+    def latest_on_this_thread(self) -> Optional[CreditReading]:
+        """Returns the remaining credits reported to the calling thread, or None if none have been reported yet."""
+        return getattr(self.__local, "latest", None)
+
+    def record(self, value: Optional[str]):
+        """Records the value of the header from a response (if it was present and numeric)."""
+        if value is None:
+            return
+        try:
+            remaining = int(value.strip())
+        except ValueError:
+            return
+
+        reading = CreditReading(remaining, time.monotonic())
+        self.__local.latest = reading
+
+        current = self.__latest
+        if current is not None and reading.credits > current.credits and not self.__is_stale(current, reading):
+            return
+        with self.__lock:
+            current = self.__latest
+            if current is None or reading.credits <= current.credits or self.__is_stale(current, reading):
+                self.__latest = reading
+
+    def __is_stale(self, current: CreditReading, reading: CreditReading) -> bool:
+        return reading.observed_at - current.observed_at > self.stale_after
@@ -0,0 +1,127 @@
+import io
+import mimetypes
+import tempfile
+from typing import IO, BinaryIO, List, Optional, Tuple
+
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+
+
+class MultipartEncoder:
+    """
+    Streams a multipart/form-data body containing some form fields followed by a single file:
+    - the form fields and the headers of the file part are rendered up front (they are small)
+    - the content of the file is read from the underlying stream on demand, one chunk at a time
+    - the length of the body is computed up front, so that a Content-Length header can be sent
+
+    Instances are file-like (read, tell, seek), which allows urllib3 to send the body in fixed-size blocks and to
+    rewind it when a request is retried. Streams that cannot be sized or rewound (e.g., pipes) are first spooled to a
+    temporary file on disk, so memory usage remains constant regardless of the size of the file.
+    """
+
+    SPOOL_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+            self,
+            fields: List[Tuple[str, str]],
+            file_field: str,
+            filename: str,
+            stream: BinaryIO,
+            boundary: Optional[str] = None,
+    ):
+        self.boundary = boundary or choose_boundary()
+        self._stream, self._spooled = MultipartEncoder.__seekable(stream)
+        self._stream_start = self._stream.tell()
+        self._stream_length = self._stream.seek(0, io.SEEK_END) - self._stream_start
+        self._stream.seek(self._stream_start)
+
+        # Render everything that precedes the content of the file, in the same format as urllib3's encoder
+        head = io.BytesIO()
+        for name, value in fields:
+            MultipartEncoder.__write_part_headers(head, self.boundary, RequestField.from_tuples(name, value))
+            head.write(value.encode("utf-8"))
+            head.write(b"\r\n")
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        part = RequestField.from_tuples(file_field, (filename, b"", mimetype))
+        MultipartEncoder.__write_part_headers(head, self.boundary, part)
+        self._head = head.getvalue()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("latin-1")
+        self._position = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._head) + self._stream_length + len(self._tail)
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = len(self) - self._position
+
+        chunks = []
+        while size > 0 and self._position < len(self):
+            chunk = self.__read_segment(size)
+            self._position += len(chunk)
+            size -= len(chunk)
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self)
+        self._position = max(0, min(offset, len(self)))
+        if self._position > len(self._head):
+            self._stream.seek(self._stream_start + min(self._position - len(self._head), self._stream_length))
+        else:
+            self._stream.seek(self._stream_start)
+        return self._position
+
+    def close(self):
+        if self._spooled:
+            self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __read_segment(self, size: int) -> bytes:
+        head_length = len(self._head)
+        if self._position < head_length:
+            return self._head[self._position:self._position + size]
+
+        stream_end = head_length + self._stream_length
+        if self._position < stream_end:
+            chunk = self._stream.read(min(size, stream_end - self._position))
+            if not chunk:
+                raise IOError("File was truncated while it was being uploaded")
+            return chunk
+
+        offset = self._position - stream_end
+        return self._tail[offset:offset + size]
+
+    @staticmethod
+    def __write_part_headers(body: io.BytesIO, boundary: str, field: RequestField):
+        body.write(f"--{boundary}\r\n".encode("latin-1"))
+        body.write(field.render_headers().encode("utf-8"))
+
+    @staticmethod
+    def __seekable(stream: BinaryIO) -> Tuple[IO[bytes], bool]:
+        try:
+            if stream.seekable():
+                return stream, False
+        except (AttributeError, ValueError, OSError):
+            pass
+
+        spooled: IO[bytes] = tempfile.TemporaryFile()
+        for chunk in iter(lambda: stream.read(MultipartEncoder.SPOOL_CHUNK_SIZE), b""):
+            spooled.write(chunk)
+        spooled.seek(0)
+        return spooled, True
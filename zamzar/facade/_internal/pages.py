@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, TypeVar
+
+ITEM = TypeVar('ITEM')
+
+MAX_PAGE_SIZE = 50
+
+
+def iterate_all(
+        lister,
+        limit: int = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        until: Optional[Callable[[ITEM], bool]] = None
+) -> Iterator[ITEM]:
+    """
+    Lazily iterates over every item of a lister (i.e., a service with a `list` method), one page at a time, so that only
+    the current page (and, if prefetching, the next page) is held in memory.
+
+    :param lister: the service whose items to iterate over
+    :param limit: the number of items to retrieve per page
+    :param prefetch: whether to retrieve the next page on a background thread while the current page is consumed
+    :param until: an optional predicate; iteration stops (without yielding it) at the first item for which it is true
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = lister.list(limit=limit)
+        last = _holds_whole_collection(page)
+        while page.items:
+            last = last or len(page.items) < (page.paging.limit or limit)
+            upcoming = executor.submit(page.next_page) if executor and not last else None
+            for item in page.items:
+                if until is not None and until(item):
+                    return
+                yield item
+            if last:
+                return
+            page = upcoming.result() if upcoming else page.next_page()
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _holds_whole_collection(page) -> bool:
+    # The total count is only compared with the first page, as it changes if items are deleted whilst iterating (and so
+    # cannot tell whether a later page is the last)
+    total_count = page.paging.total_count
+    return total_count is not None and len(page.items) >= total_count
@@ -0,0 +1,84 @@
+import dataclasses
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from .timestamps import parse_datetime
+
+MAX_CACHED_RECORDS = 64
+
+# Converts a (non-null) value parsed from JSON to its value in a record
+Converter = Callable[[Any], Any]
+
+
+def fields_of(klass: Type[BaseModel]) -> List[Tuple[str, Any]]:
+    """Returns the (attribute) names and annotations of the fields of a model that are in the API specification."""
+    return [(name, field) for name, field in klass.model_fields.items() if name != "additional_properties"]
+
+
+@lru_cache(maxsize=MAX_CACHED_RECORDS)
+def record_type(klass: Type[BaseModel]) -> Type[Any]:
+    """
+    Returns a frozen, slotted dataclass (e.g., JobRecord) with the same attribute names as the given model, for use in
+    place of the model where many instances are held (e.g., when listing many jobs). A record has no per-instance
+    __dict__, set of fields or additional_properties, and is not validated (nor revalidated on assignment).
+    """
+    fields: List[Tuple[str, Any, Any]] = [(name, Any, dataclasses.field()) for name, _ in fields_of(klass)]
+    return dataclasses.make_dataclass(
+        f"{klass.__name__}Record",
+        fields,
+        frozen=True,
+        slots=True,
+    )
+
+
+@lru_cache(maxsize=MAX_CACHED_RECORDS)
+def record_builder(klass: Type[BaseModel]) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Compiles a function that builds a record (see record_type) of the given model from a dict parsed from JSON,
+    converting nested models to records and timestamps to datetimes (but otherwise using values as-is).
+    """
+    record = record_type(klass)
+    # Set each slot directly (as the __init__ of a frozen dataclass is several times slower, per field)
+    fields = [
+        (field.alias or name, converter_for(field.annotation), getattr(record, name).__set__)
+        for name, field in fields_of(klass)
+    ]
+
+    def build(data: Dict[str, Any]) -> Any:
+        instance: Any = object.__new__(record)
+        for key, convert, set_slot in fields:
+            value = data.get(key)
+            set_slot(instance, value if value is None or convert is None else convert(value))
+        return instance
+
+    return build
+
+
+def converter_for(annotation: Any) -> Optional[Converter]:
+    """Returns a function that converts values of the given type for a record, or None if values are used as-is."""
+    if annotation is datetime:
+        return parse_datetime
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return record_builder(annotation)
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union:
+        converters = [converter_for(arg) for arg in args if arg is not type(None)]
+        return converters[0] if len(converters) == 1 else None
+    if origin is list:
+        item: Optional[Converter] = converter_for(args[0])
+        if item is None:
+            return None
+        convert_item: Converter = item
+        return lambda values: [None if v is None else convert_item(v) for v in values]
+    if origin is dict:
+        value_of: Optional[Converter] = converter_for(args[1])
+        if value_of is None:
+            return None
+        convert_value: Converter = value_of
+        return lambda values: {key: None if v is None else convert_value(v) for key, v in values.items()}
+    return None
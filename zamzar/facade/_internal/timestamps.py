@@ -0,0 +1,128 @@
+import copy
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Annotated, Any, ClassVar, Dict, List, Tuple, Type, TypeVar, Union, cast, get_args, get_origin
+
+from dateutil.parser import parse
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, WrapSerializer, create_model
+
+M = TypeVar("M", bound=BaseModel)
+
+MAX_CACHED_MODELS = 64
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    Parses a timestamp, which the Zamzar API emits in (strict) ISO-8601 format, with the (fast) standard library parser,
+    falling back to the (slower, but more lenient) dateutil parser for any timestamp in another format.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parse(value)
+
+
+def parse_date(value: str) -> date:
+    """Parses a date, in the same way as parse_datetime."""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return parse(value).date()
+
+
+class LazyTimestamp:
+    """
+    A descriptor for a timestamp field of a model, which is held as the raw string from the response until first read,
+    then parsed (and the parsed value retained). Other fields are not affected, so are read as quickly as ever.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name]
+        if isinstance(value, str):
+            value = instance.__dict__[self.name] = parse_datetime(value)
+        return value
+
+    def __set__(self, instance: Any, value: Any):
+        # Makes this a data descriptor, which takes precedence over __dict__ (to which pydantic assigns fields directly)
+        instance.__dict__[self.name] = value
+
+
+class LazyTimestamps:
+    """
+    Mixed into a model to parse its timestamps (which are held as the raw strings from the response) on first access,
+    so that time is not spent parsing timestamps that are never read (e.g., when listing many jobs).
+    """
+
+    __eager_model__: ClassVar[Type[BaseModel]]
+
+    def __eq__(self, other: Any) -> bool:
+        # Equal to the (eager) generated model with the same fields, whose timestamps are parsed
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        eager = getattr(type(other), "__eager_model__", type(other))
+        return self.__eager_model__ is eager and self.model_dump() == other.model_dump()  # type: ignore[attr-defined]
+
+
+def _serialize_timestamp(value: Any, handler: SerializerFunctionWrapHandler) -> Any:
+    # Dumps (e.g., by to_dict, including of nested models) parse timestamps that have not been read, as the eager model
+    return handler(parse_datetime(value) if isinstance(value, str) else value)
+
+
+def with_lazy_timestamps(klass: Type[M]) -> Type[M]:
+    """
+    Returns a subclass of the given model (e.g., Job) whose timestamps, and those of its nested models (e.g., the
+    source file of a job), are validated as strings and parsed on first access. Returns the model itself if it has no
+    timestamps.
+    """
+    return cast(Type[M], _lazy_model(klass))
+
+
+@lru_cache(maxsize=MAX_CACHED_MODELS)
+def _lazy_model(klass: Type[BaseModel]) -> Type[BaseModel]:
+    fields: Dict[str, Tuple[Any, Any]] = {}
+    timestamps = set()
+    for name, field in klass.model_fields.items():
+        annotation = _lazy_annotation(field.annotation)
+        if annotation != field.annotation:
+            fields[name] = (annotation, copy.copy(field))
+            if datetime in get_args(field.annotation) or field.annotation is datetime:
+                timestamps.add(name)
+    if not fields:
+        return klass
+
+    lazy = create_model(  # type: ignore[call-overload]
+        f"Lazy{klass.__name__}",
+        __base__=(LazyTimestamps, klass),
+        __module__=klass.__module__,
+        **fields,
+    )
+    lazy.__eager_model__ = klass
+    for name in timestamps:
+        setattr(lazy, name, LazyTimestamp(name))
+    return lazy
+
+
+def _lazy_annotation(annotation: Any) -> Any:
+    if annotation is datetime:
+        # Strings are kept as-is (rather than parsed), whilst datetimes can still be assigned
+        return Annotated[
+            Union[str, datetime], Field(union_mode="left_to_right"), WrapSerializer(_serialize_timestamp)
+        ]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return with_lazy_timestamps(annotation)
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union:
+        return Union[tuple(_lazy_annotation(arg) for arg in args)]
+    if origin is list:
+        # The item types are only known at runtime, so List and Dict are subscripted dynamically
+        return cast(Any, List)[_lazy_annotation(args[0])]
+    if origin is dict:
+        return cast(Any, Dict)[args[0], _lazy_annotation(args[1])]
+    return annotation
@@ -0,0 +1,201 @@
+import datetime
+import decimal
+import json
+import re
+import uuid
+from enum import Enum
+from functools import lru_cache
+from typing import IO, Any, Callable, Dict, List, Optional, cast
+
+import urllib3
+from pydantic import BaseModel, TypeAdapter
+
+import zamzar.models
+from zamzar import rest
+from zamzar.api_client import ApiClient
+from zamzar.api_response import ApiResponse, T as ApiResponseT
+from zamzar.configuration import Configuration
+from zamzar.exceptions import ApiException
+from .multipart import MultipartEncoder
+from .records import record_builder
+from .timestamps import parse_date, parse_datetime, with_lazy_timestamps
+
+JSON_CONTENT_TYPE = re.compile(r"^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)", re.IGNORECASE)
+NON_UTF8_CHARSET = re.compile(r"charset=(?!utf-?8\b)", re.IGNORECASE)
+LIST_TYPE = re.compile(r"^List\[(.+)]$")
+DICT_TYPE = re.compile(r"^Dict\[([^,]*), (.+)]$")
+
+# The response types of the endpoints that list jobs, files, imports and formats (i.e., that return many models)
+LEAN_RESPONSE_TYPES = frozenset({"Files", "Formats", "Imports", "Jobs"})
+
+MAX_CACHED_ADAPTERS = 64
+MAX_CACHED_DESERIALIZERS = 256
+
+# Deserializes (non-null) data for a ZamzarApiClient
+Deserializer = Callable[["ZamzarApiClient", Any], Any]
+
+# The generated deserializers of leaf types (which are private to ApiClient, and so name-mangled)
+_deserialize_primitive = getattr(ApiClient, "_ApiClient__deserialize_primitive")
+_deserialize_date = getattr(ApiClient, "_ApiClient__deserialize_date")
+_deserialize_datetime = getattr(ApiClient, "_ApiClient__deserialize_datetime")
+_deserialize_enum = getattr(ApiClient, "_ApiClient__deserialize_enum")
+
+
+@lru_cache(maxsize=MAX_CACHED_ADAPTERS)
+def adapter_for(response_type: str, lazy_timestamps: bool = False) -> Optional[TypeAdapter[Any]]:
+    """
+    Returns a (compiled) TypeAdapter for the given response type (e.g., "Jobs" or "List[File]"), or None if the type
+    is not a model (or list of models) and so must be deserialized by the generated client.
+    """
+    match = LIST_TYPE.match(response_type)
+    klass = getattr(zamzar.models, match.group(1) if match else response_type, None)
+    if not isinstance(klass, type) or not issubclass(klass, BaseModel):
+        return None
+    if lazy_timestamps:
+        klass = with_lazy_timestamps(klass)
+    return TypeAdapter(List[klass] if match else klass)  # type: ignore[valid-type]
+
+
+@lru_cache(maxsize=MAX_CACHED_DESERIALIZERS)
+def deserializer_for(klass: Any) -> Deserializer:
+    """
+    Compiles a type (or the name of a type, e.g., "Jobs" or "Dict[str, List[File]]") into a function that deserializes
+    data of that type in the same way as the generated ApiClient, so that each type is parsed and resolved only once.
+    """
+    if isinstance(klass, str):
+        match = LIST_TYPE.match(klass)
+        if match:
+            item = nullable(deserializer_for(match.group(1)))
+            return lambda client, data: [item(client, value) for value in data]
+
+        match = DICT_TYPE.match(klass)
+        if match:
+            value_of = nullable(deserializer_for(match.group(2)))
+            return lambda client, data: {key: value_of(client, value) for key, value in data.items()}
+
+        klass = ApiClient.NATIVE_TYPES_MAPPING.get(klass) or getattr(zamzar.models, klass)
+
+    if klass in ApiClient.PRIMITIVE_TYPES:
+        return lambda client, data: _deserialize_primitive(client, data, klass)
+    elif klass is object:
+        return lambda client, data: data
+    elif klass is datetime.date:
+        return lambda client, data: parse_or_fail(parse_date, _deserialize_date, client, data)
+    elif klass is datetime.datetime:
+        return lambda client, data: parse_or_fail(parse_datetime, _deserialize_datetime, client, data)
+    elif klass is decimal.Decimal:
+        return lambda client, data: decimal.Decimal(data)
+    elif klass is uuid.UUID:
+        return lambda client, data: uuid.UUID(data)
+    elif issubclass(klass, Enum):
+        return lambda client, data: _deserialize_enum(client, data, klass)
+    else:
+        return lambda client, data: klass.from_dict(data)
+
+
+def nullable(deserializer: Deserializer) -> Deserializer:
+    return lambda client, data: None if data is None else deserializer(client, data)
+
+
+def parse_or_fail(parser: Callable[[str], Any], generated: Callable[..., Any], client: ApiClient, data: Any) -> Any:
+    try:
+        return parser(data)
+    except (TypeError, ValueError, OverflowError):
+        # Let the generated client report the failure (i.e., with the same ApiException)
+        return generated(client, data)
+
+
+class ZamzarApiClient(ApiClient):
+    """
+    Extends the generated ApiClient to stream multipart uploads, and to deserialize JSON responses from the raw bytes
+    (optionally as validated models, lazy timestamps, or lean records).
+    """
+
+    def __init__(
+            self,
+            configuration: Optional[Configuration] = None,
+            fast_deserialization: bool = False,
+            lazy_timestamps: bool = False,
+            lean_models: bool = False
+    ):
+        super().__init__(configuration=configuration)
+        self.fast_deserialization = fast_deserialization
+        self.lazy_timestamps = lazy_timestamps
+        self.lean_models = lean_models
+
+    def call_api(
+            self,
+            method,
+            url,
+            header_params=None,
+            body=None,
+            post_params=None,
+            _request_timeout=None
+    ) -> rest.RESTResponse:
+        if not isinstance(body, MultipartEncoder):
+            return super().call_api(method, url, header_params, body, post_params, _request_timeout)
+
+        # The generated RESTClientObject only sends bodies that are held in memory, so send a streamed multipart body
+        # (which is file-like, and so is read by urllib3 one block at a time) directly through its pool manager
+        headers = dict(header_params or {})
+        headers["Content-Type"] = body.content_type
+        headers["Content-Length"] = str(len(body))
+        if isinstance(_request_timeout, (int, float)):
+            timeout = urllib3.Timeout(total=_request_timeout)
+        elif isinstance(_request_timeout, tuple):
+            timeout = urllib3.Timeout(connect=_request_timeout[0], read=_request_timeout[1])
+        else:
+            timeout = None
+        try:
+            response = self.rest_client.pool_manager.request(
+                method, url, body=cast(IO[bytes], body), headers=headers, timeout=timeout, preload_content=False
+            )
+        except urllib3.exceptions.SSLError as e:
+            raise ApiException(status=0, reason="\n".join([type(e).__name__, str(e)]))
+        return rest.RESTResponse(response)
+
+    def response_deserialize(
+            self,
+            response_data: rest.RESTResponse,
+            response_types_map: Optional[Dict[str, ApiResponseT]] = None
+    ) -> ApiResponse[ApiResponseT]:
+        response_type = self.__json_response_type(response_data, response_types_map)
+        if response_type is None:
+            return super().response_deserialize(response_data, response_types_map)
+
+        # Parse the body from the raw bytes (which raw_data shares, rather than copies), never decoding it to a str
+        raw_data = cast(bytes, response_data.data)
+        adapter = adapter_for(response_type, self.lazy_timestamps) if self.fast_deserialization else None
+        if self.lean_models and response_type in LEAN_RESPONSE_TYPES:
+            data = record_builder(getattr(zamzar.models, response_type))(json.loads(raw_data))
+        elif adapter is not None:
+            data = adapter.validate_json(raw_data)
+        else:
+            data = self._ApiClient__deserialize(json.loads(raw_data), response_type)
+
+        return ApiResponse(
+            status_code=response_data.status,
+            data=data,
+            headers=response_data.headers,
+            raw_data=raw_data
+        )
+
+    def _ApiClient__deserialize(self, data, klass):
+        # Overrides the generated (and so name-mangled) ApiClient.__deserialize, which resolves klass on every call
+        return None if data is None else deserializer_for(klass)(self, data)
+
+    @staticmethod
+    def __json_response_type(
+            response_data: rest.RESTResponse,
+            response_types_map: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        # Returns the type of a successful (UTF-8) JSON response, or None for any other response
+        if not 200 <= response_data.status <= 299 or not response_data.data:
+            return None
+        response_type = (response_types_map or {}).get(str(response_data.status))
+        if not isinstance(response_type, str) or response_type in ("bytearray", "bytes", "file"):
+            return None
+        content_type = response_data.headers.get("content-type")
+        if content_type is None or not JSON_CONTENT_TYPE.match(content_type) or NON_UTF8_CHARSET.search(content_type):
+            return None
+        return response_type
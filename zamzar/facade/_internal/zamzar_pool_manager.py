@@ -1,35 +1,139 @@
-from typing import Optional
+import logging
+import threading
+import time
+from typing import List, Optional, Union
 
-from urllib3 import BaseHTTPResponse, PoolManager, Timeout, Retry
+from urllib3 import BaseHTTPResponse, HTTPHeaderDict, PoolManager, Timeout, Retry
+from urllib3.exceptions import InvalidHeader
 
+from zamzar.facade.instrumentation import RequestEvent, RequestObserver
+from zamzar.facade.rate_limiter import RateLimiter
+from zamzar.facade.transport import Transport
+from .credit_ledger import CreditLedger
 
-class ZamzarPoolManager(PoolManager):
+logger = logging.getLogger(__name__)
+
+CREDITS_REMAINING_HEADER = "Zamzar-Credits-Remaining"
+TEST_CREDITS_REMAINING_HEADER = "Zamzar-Test-Credits-Remaining"
+
+
+class ZamzarPoolManager:
     """
-    Wraps a PoolManager and:
-    - keeps track of the latest response
+    Wraps a PoolManager or other Transport (by composition, so that it holds no connections of its own) and:
+    - keeps track of the headers of the latest response (on each thread, and overall)
+    - records the remaining credits reported by every response
     - adds our timeout and retry configuration to every request
+    - notifies observers of the progress of every request
+    - (optionally) limits the rate of requests
     """
 
-    def __init__(self, delegate: PoolManager, timeout: Timeout, retries: Retry):
-        super().__init__()
+    @staticmethod
+    def __bytes_sent(kwargs) -> Optional[int]:
+        body = kwargs.get("body")
+        if body is None:
+            return 0 if kwargs.get("fields") is None else None
+        if isinstance(body, str):
+            return len(body.encode("utf-8"))
+        try:
+            return len(body)
+        except TypeError:
+            return None
+
+    @staticmethod
+    def __bytes_received(response: BaseHTTPResponse) -> Optional[int]:
+        value = response.headers.get("Content-Length")
+        return int(value) if value is not None and value.isdigit() else None
+
+    def __init__(
+            self,
+            delegate: Union[PoolManager, Transport],
+            timeout: Timeout,
+            retries: Retry,
+            observers: Optional[List[RequestObserver]] = None,
+            rate_limiter: Optional[RateLimiter] = None
+    ):
         self.delegate = delegate
         self.timeout = timeout
         self.retries = retries
-        self.latest_response: Optional[BaseHTTPResponse] = None
+        self.observers: List[RequestObserver] = list(observers or [])
+        self.rate_limiter = rate_limiter
+        self.production_credits = CreditLedger(CREDITS_REMAINING_HEADER)
+        self.sandbox_credits = CreditLedger(TEST_CREDITS_REMAINING_HEADER)
+        self.__latest_headers: Optional[HTTPHeaderDict] = None
+        self.__local = threading.local()
 
     def request(self, method, url, *args, **kwargs):
         if kwargs.get("timeout") is None:
             kwargs["timeout"] = self.timeout
         if kwargs.get("retries") is None:
             kwargs["retries"] = self.retries
-        self.latest_response = self.delegate.request(method, url, *args, **kwargs)
-        return self.latest_response
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, url)
+        if not self.observers:
+            response = self.delegate.request(method, url, *args, **kwargs)
+            self.__record(method, url, response)
+            return response
+
+        event = RequestEvent(method, url, ZamzarPoolManager.__bytes_sent(kwargs))
+        self.__notify("on_request_start", event)
+        started = time.perf_counter()
+        try:
+            response = self.delegate.request(method, url, *args, **kwargs)
+        except Exception as e:
+            event.duration = time.perf_counter() - started
+            self.__notify("on_error", event, e)
+            raise
+        event.duration = time.perf_counter() - started
+
+        self.__record(method, url, response)
+        history = response.retries.history if response.retries else ()
+        event.status = response.status
+        event.bytes_received = ZamzarPoolManager.__bytes_received(response)
+        event.retries = len(history)
+        for retry in history:
+            self.__notify("on_retry", event, retry)
+        self.__notify("on_response", event)
+        return response
 
     def get_header_from_latest_response(self, name, default=None):
-        if self.latest_response is None:
+        """
+        Returns a header of the latest response received on the calling thread (or, if the calling thread has not
+        made any requests, of the latest response received on any thread).
+        """
+        headers = getattr(self.__local, "headers", None) or self.__latest_headers
+        if headers is None:
             return default
-        return self.latest_response.headers.get(name, default)
+        return headers.get(name, default)
+
+    def get_retry_after_from_latest_response(self) -> Optional[float]:
+        """Returns the number of seconds that the latest response asked us to wait (via Retry-After), if any."""
+        value = self.get_header_from_latest_response("Retry-After", None)
+        if value is None:
+            return None
+        try:
+            return Retry.DEFAULT.parse_retry_after(value)
+        except InvalidHeader:
+            return None
+
+    def __record(self, method: str, url: str, response: BaseHTTPResponse):
+        # Keep only the headers (never the response itself, which may hold a connection and a buffered body)
+        headers = response.headers
+        self.__local.headers = self.__latest_headers = headers
+        self.production_credits.record(headers.get(CREDITS_REMAINING_HEADER))
+        self.sandbox_credits.record(headers.get(TEST_CREDITS_REMAINING_HEADER))
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(method, url, response)
+
+    def __notify(self, callback: str, *args):
+        for observer in self.observers:
+            try:
+                getattr(observer, callback)(*args)
+            except Exception:
+                # A misbehaving observer should never cause a request to fail
+                logger.exception("Request observer %r raised an exception from %s", observer, callback)
 
     def __getattr__(self, name):
-        # Delegate all attribute accesses to the delegate object
+        # Delegate all other attribute accesses (e.g., urlopen, clear) to the delegate object
+        if name == "delegate":
+            raise AttributeError(name)
         return getattr(self.delegate, name)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Union
+
+from zamzar.models import File
+
+
+class AsyncFileManager:
+    """Provides operations that can be performed on a file resident on the Zamzar API servers, as coroutines."""
+
+    def __init__(self, zamzar, model: File):
+        self._zamzar = zamzar
+        self.model = model
+        self.id = model.id
+
+    async def delete(self) -> AsyncFileManager:
+        """Immediately deletes the file from the Zamzar API servers."""
+        await self._zamzar.files.delete(self.id)
+        return self
+
+    async def download(self, target: Union[str, Path], ranges: int = 1) -> AsyncFileManager:
+        """
+        Downloads the file to the specified destination, returning once the download is complete.
+
+        :param ranges: the number of byte ranges to download concurrently (see `FilesService.download`)
+        """
+        await asyncio.to_thread(self._zamzar.sync.files._download_model, self.model, Path(target), ranges)
+        return self
+
+    def to_str(self) -> str:
+        return f"AsyncFileManager(id={self.id})"
@@ -0,0 +1,68 @@
+import asyncio
+from pathlib import Path
+from typing import Union, Optional, BinaryIO
+
+from zamzar.api import FilesApi
+from zamzar.api_client import ApiClient
+from zamzar.models import File
+from zamzar.pagination import Paged, Anchor
+from .async_file_manager import AsyncFileManager
+
+
+class AsyncFilesService:
+    """
+    Uploads to, downloads from, and retrieves files on the Zamzar API servers, as coroutines.
+
+    Each HTTP request is made on a worker thread (see `asyncio.to_thread`), so that the event loop is never blocked.
+    """
+
+    def __init__(self, zamzar, client: ApiClient):
+        self._zamzar = zamzar
+        self._api = FilesApi(client)
+
+    async def delete(self, file_id: int) -> AsyncFileManager:
+        """
+        Immediately deletes a file from the Zamzar API servers.
+        """
+        return self.__to_file(await asyncio.to_thread(self._api.delete_file_by_id, file_id=file_id))
+
+    async def download(self, file_id: int, target: Union[str, Path], ranges: int = 1) -> AsyncFileManager:
+        """
+        Downloads a file to the specified destination, returning once the download is complete.
+
+        :param file_id: the ID of the file to download
+        :param target: the path (or directory) to which to download the file
+        :param ranges: the number of byte ranges to download concurrently (see `FilesService.download`)
+        """
+        return await (await self.find(file_id)).download(Path(target), ranges)
+
+    async def find(self, file_id: int) -> AsyncFileManager:
+        """Retrieves a file by its ID."""
+        return self.__to_file(await asyncio.to_thread(self._api.get_file_by_id, file_id=file_id))
+
+    async def list(self, anchor: Optional[Anchor] = None, limit: Optional[int] = None) -> Paged[AsyncFileManager]:
+        """
+        Retrieves a list of files. Await `next_page` or `previous_page` on the result to retrieve further pages.
+
+        :param anchor: indicates the position in the list from which to start retrieving files
+        :param limit: indicates the maximum number of files to retrieve
+        """
+        after = anchor.get_after_parameter_value() if anchor else None
+        before = anchor.get_before_parameter_value() if anchor else None
+        response = await asyncio.to_thread(self._api.list_files, after=after, before=before, limit=limit)
+        files = [self.__to_file(file) for file in (response.data or [])]
+        return Paged(self, files, response.paging)
+
+    async def upload(self, source: Union[str, Path, BinaryIO], name: Optional[str] = None) -> AsyncFileManager:
+        """
+        Uploads a file to the Zamzar API servers, returning once the upload is complete.
+
+        :param source: the path to the file to upload, or a binary file-like object from which to read the file
+        :param name: the name to give the file on the Zamzar API servers (defaults to the name of the file at the
+        source path)
+        """
+        uploaded = await asyncio.to_thread(self._zamzar.sync.files.upload, source, name)
+        return self.__to_file(uploaded.model)
+
+    def __to_file(self, model: File) -> AsyncFileManager:
+        return AsyncFileManager(self._zamzar, model)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import Optional
+
+from zamzar.models import Failure
+from zamzar.models import ModelImport
+from ._internal import AsyncAwaitable
+from .async_file_manager import AsyncFileManager
+from .import_manager import ImportManager
+
+
+class AsyncImportManager(AsyncAwaitable):
+    """
+    Provides operations that can be performed on an import request running on the Zamzar API servers, as coroutines.
+    """
+
+    def __init__(self, zamzar, model: ModelImport):
+        self._zamzar = zamzar
+        self._import = ImportManager(zamzar.sync, model)
+        self.model = model
+        self.id = model.id
+
+    def has_completed(self) -> bool:
+        """Indicates whether the import request has completed."""
+        return self._import.has_completed()
+
+    def has_succeeded(self) -> bool:
+        """Indicates whether the import request has successfully completed."""
+        return self._import.has_succeeded()
+
+    @property
+    def failure(self) -> Optional[Failure]:
+        """If the import request has failed, returns the reason for the failure."""
+        return self._import.failure
+
+    @property
+    def imported_file(self) -> AsyncFileManager:
+        """Returns a file manager for the imported file."""
+        return AsyncFileManager(self._zamzar, self._import.imported_file.model)
+
+    async def refresh(self) -> AsyncImportManager:
+        """Performs an API request to determine the current state of the import request."""
+        # Refresh (and so read any Retry-After) on a single worker thread, rather than on the event loop's thread
+        refreshed = await asyncio.to_thread(self._import.refresh)
+        manager = AsyncImportManager(self._zamzar, refreshed.model)
+        manager._import = refreshed
+        return manager
+
+    def _requested_delay(self) -> Optional[timedelta]:
+        return self._import._requested_delay()
+
+    def to_str(self) -> str:
+        return f"AsyncImportManager(id={self.id})"
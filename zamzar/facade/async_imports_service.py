@@ -0,0 +1,47 @@
+import asyncio
+from typing import Optional
+
+from zamzar.api import ImportsApi
+from zamzar.models.model_import import ModelImport
+from zamzar.pagination import Paged, Anchor
+from .async_import_manager import AsyncImportManager
+from ..api_client import ApiClient
+
+
+class AsyncImportsService:
+    """Starts imports on -- and retrieves information about existing imports from -- the Zamzar API, as coroutines."""
+
+    def __init__(self, zamzar, client: ApiClient):
+        self._zamzar = zamzar
+        self._api = ImportsApi(client)
+
+    async def find(self, import_id: int) -> AsyncImportManager:
+        """Retrieves an import request by its ID."""
+        return self.__to_import(await asyncio.to_thread(self._api.get_import_by_id, import_id=import_id))
+
+    async def list(self, anchor: Optional[Anchor] = None, limit: Optional[int] = None) -> Paged[AsyncImportManager]:
+        """
+        Retrieves a list of import requests. Await `next_page` or `previous_page` on the result to retrieve further
+        pages.
+
+        :param anchor: indicates the position in the list from which to start retrieving import requests
+        :param limit: indicates the maximum number of import requests to retrieve
+        """
+        after = anchor.get_after_parameter_value() if anchor else None
+        before = anchor.get_before_parameter_value() if anchor else None
+        response = await asyncio.to_thread(self._api.list_imports, after=after, before=before, limit=limit)
+        imports = [self.__to_import(_import) for _import in (response.data or [])]
+        return Paged(self, imports, response.paging)
+
+    async def start(self, url: str, filename: Optional[str] = None) -> AsyncImportManager:
+        """
+        Starts an import request.
+
+        :param url: the URL of the file to import
+        :param filename: the name to give the file on the Zamzar API servers (defaults to the name of the file in the
+        path of the URL)
+        """
+        return self.__to_import(await asyncio.to_thread(self._api.start_import, url, filename))
+
+    def __to_import(self, model: ModelImport) -> AsyncImportManager:
+        return AsyncImportManager(self._zamzar, model)
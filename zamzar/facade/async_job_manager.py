@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional, Union
+
+from zamzar.models import Failure
+from zamzar.models import Job
+from ._internal import AsyncAwaitable
+from .job_manager import JobManager
+
+
+class AsyncJobManager(AsyncAwaitable):
+    """Provides operations that can be performed on a job running on the Zamzar API servers, as coroutines."""
+
+    def __init__(self, zamzar, model: Job):
+        self._zamzar = zamzar
+        self._job = JobManager(zamzar.sync, model)
+        self.model = model
+        self.id = model.id
+        self.target_files = model.target_files
+
+    async def delete_all_files(self) -> AsyncJobManager:
+        """Immediately deletes the source file and all target files from the Zamzar API servers, concurrently."""
+        # Like JobManager, tolerate files that no longer exist, and raise any failure only once every file is processed
+        await asyncio.to_thread(self._job.delete_all_files)
+        return self
+
+    async def delete_source_file(self) -> AsyncJobManager:
+        """Immediately deletes the source file from the Zamzar API servers."""
+        if self.source_file_id:
+            await self._zamzar.files.delete(self.source_file_id)
+        return self
+
+    async def delete_target_files(self) -> AsyncJobManager:
+        """Immediately deletes all target files from the Zamzar API servers, concurrently."""
+        await asyncio.to_thread(self._job.delete_target_files)
+        return self
+
+    def has_completed(self) -> bool:
+        """Indicates whether the job has completed."""
+        return self._job.has_completed()
+
+    def has_succeeded(self) -> bool:
+        """ Indicates whether the job has successfully completed."""
+        return self._job.has_succeeded()
+
+    @property
+    def failure(self) -> Optional[Failure]:
+        """If the job has failed, returns the reason for the failure."""
+        return self._job.failure
+
+    async def refresh(self) -> AsyncJobManager:
+        """Performs an API request to determine the current state of the job."""
+        # Refresh (and so read any Retry-After) on a single worker thread, rather than on the event loop's thread
+        refreshed = await asyncio.to_thread(self._job.refresh)
+        manager = AsyncJobManager(self._zamzar, refreshed.model)
+        manager._job = refreshed
+        return manager
+
+    @property
+    def source_file_id(self) -> Optional[int]:
+        """Returns the ID of the source file being converted."""
+        return self._job.source_file_id
+
+    async def store(
+            self,
+            target: Union[str, Path],
+            extract_multiple_file_output: bool = True,
+            ranges: int = 1
+    ) -> AsyncJobManager:
+        """
+        Downloads all the target files produced by the conversion to the specified destination, returning once the
+        download is complete.
+
+        If extract_multiple_file_output is False and there are multiple target files, the ZIP file will not be
+        extracted.
+
+        :param ranges: the number of byte ranges to download concurrently (see `FilesService.download`)
+        """
+        await asyncio.to_thread(self._job.store, target, extract_multiple_file_output, ranges)
+        return self
+
+    @property
+    def target_file_ids(self) -> list[int]:
+        """Returns the IDs of the target files produced by the job."""
+        return self._job.target_file_ids
+
+    def _requested_delay(self) -> Optional[timedelta]:
+        return self._job._requested_delay()
+
+    def to_str(self) -> str:
+        return f"AsyncJobManager(id={self.id})"
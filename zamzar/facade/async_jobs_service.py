@@ -0,0 +1,89 @@
+import asyncio
+from pathlib import Path
+from typing import Union, Optional, Any, Dict
+
+from zamzar.api import JobsApi
+from zamzar.models import Job
+from zamzar.pagination import Paged, Anchor
+from .async_job_manager import AsyncJobManager
+from .jobs_service import JobsService
+from ..api_client import ApiClient
+
+
+class AsyncJobsService:
+    """Starts jobs -- and retrieves information about existing jobs -- on the Zamzar API servers, as coroutines."""
+
+    def __init__(self, zamzar, client: ApiClient):
+        self._zamzar = zamzar
+        self._api = JobsApi(client)
+
+    async def cancel(self, job_id: int) -> AsyncJobManager:
+        """Immediately cancels a job by its ID."""
+        return self.__to_job(await asyncio.to_thread(self._api.cancel_job_by_id, job_id))
+
+    async def create(
+            self,
+            source: Union[Path, str, int],
+            target_format: str,
+            source_format: Optional[str] = None,
+            export_url: Optional[str] = None,
+            options: Optional[Dict[str, Any]] = None,
+            validate: bool = False
+    ) -> AsyncJobManager:
+        """
+        Starts a job to convert a local file, returning once the job has been created. Await `await_completion` on the
+        returned AsyncJobManager to wait for the job to complete.
+
+        :param source: the path to the file to convert, the ID of the file to convert, or the URL of the file to convert
+        :param target_format: the format to convert the file to
+        :param source_format: the format of the file to convert (defaults to the extension of the source)
+        :param export_url: an optional URL to which to export the converted file
+        :param options: optional parameters to customize the conversion
+        :param validate: whether to check that the conversion is supported (per the client's formats catalogue) before
+        uploading or importing the source and submitting the job (default: False)
+        """
+        # Reserve the credits before uploading (or importing) the source, so that a rejected job leaves no orphaned file
+        with await asyncio.to_thread(self._zamzar.sync.jobs._admit, source, source_format, target_format, validate):
+            source_file_id = await self.__prepare_source(source, source_format)
+            job = await asyncio.to_thread(
+                self._api.submit_job,
+                source_file=source_file_id,
+                target_format=target_format,
+                source_format=source_format,
+                export_url=export_url,
+                options=options,
+            )
+        return self.__to_job(job)
+
+    async def find(self, job_id: int) -> AsyncJobManager:
+        """Retrieves a job by its ID."""
+        return self.__to_job(await asyncio.to_thread(self._api.get_job_by_id, job_id))
+
+    async def list(self, anchor: Optional[Anchor] = None, limit: Optional[int] = None) -> Paged[AsyncJobManager]:
+        """
+        Retrieves a list of jobs. Await `next_page` or `previous_page` on the result to retrieve further pages.
+
+        :param anchor: indicates the position in the list from which to start retrieving jobs
+        :param limit: indicates the maximum number of jobs to retrieve
+        """
+        after = anchor.get_after_parameter_value() if anchor else None
+        before = anchor.get_before_parameter_value() if anchor else None
+        response = await asyncio.to_thread(self._api.list_jobs, after=after, before=before, limit=limit)
+        jobs = [self.__to_job(job) for job in (response.data or [])]
+        return Paged(self, jobs, response.paging)
+
+    def __to_job(self, model: Job) -> AsyncJobManager:
+        return AsyncJobManager(self._zamzar, model)
+
+    async def __prepare_source(self, source, source_format) -> int:
+        if isinstance(source, int):
+            source_file_id = source
+        elif isinstance(source, str) and JobsService._is_url(source):
+            filename = JobsService._infer_filename(source, source_format)
+            started = await self._zamzar.imports.start(source, filename)
+            source_file_id = (await started.await_completion()).imported_file.id
+        elif Path(source).exists():
+            source_file_id = (await self._zamzar.upload(source)).id
+        else:
+            raise ValueError(f"Source {source} is not a valid URL or file path")
+        return source_file_id
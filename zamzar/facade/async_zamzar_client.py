@@ -0,0 +1,111 @@
+from pathlib import Path
+from typing import Optional, Union, Dict, Any, BinaryIO, List
+
+import urllib3
+
+from .async_file_manager import AsyncFileManager
+from .async_files_service import AsyncFilesService
+from .async_imports_service import AsyncImportsService
+from .async_job_manager import AsyncJobManager
+from .async_jobs_service import AsyncJobsService
+from .instrumentation import RequestObserver
+from .rate_limiter import RateLimiter
+from .transport import Transport
+from .zamzar_client import Environment, ZamzarClient, DEFAULT_RETRY_POLICY, DEFAULT_TIMEOUT_POLICY
+
+
+class AsyncZamzarClient:
+    """
+    An asyncio entrypoint for making requests against the Zamzar API, mirroring ZamzarClient.
+
+    Polling for the completion of jobs and imports is performed with `asyncio.sleep`, so a single event loop can wait
+    on many conversions at once. HTTP requests are made with the same (blocking) transport as ZamzarClient -- sharing
+    its connection pool, retry and timeout policies -- on worker threads, so they never block the event loop.
+
+    Example usage:
+
+        ```python
+        import asyncio
+
+        from zamzar import AsyncZamzarClient
+
+        async def main():
+            zamzar = AsyncZamzarClient("YOUR_API_KEY_GOES_HERE")
+            job = await zamzar.convert("/tmp/example.docx", "pdf")
+            await job.store("/tmp/")
+            await job.delete_all_files()
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+            self,
+            api_key: str,
+            environment: Environment = Environment.PRODUCTION,
+            host: Optional[str] = None,
+            retries: urllib3.Retry = DEFAULT_RETRY_POLICY,
+            timeout: urllib3.Timeout = DEFAULT_TIMEOUT_POLICY,
+            observers: Optional[List[RequestObserver]] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            transport: Optional[Union[urllib3.PoolManager, Transport]] = None,
+    ):
+        """
+        Create a new instance of the asynchronous Zamzar client.
+
+        :param api_key: The API key to use for authenticating requests.
+        :param environment: The environment to use for making requests. Defaults to PRODUCTION.
+        :param host: The host to use for making requests. Used when mocking the API.
+        :param retries: The retry policy to use for making requests. Defaults to a reasonable exponential backoff.
+        :param timeout: The timeout policy to use for making requests. Defaults to 15s connect and 30s read.
+        :param observers: Observers to notify of every HTTP request made (e.g., a HistogramCollector). Defaults to none.
+        :param rate_limiter: A RateLimiter to limit the rate of HTTP requests made. Defaults to none (no limit).
+        :param transport: The transport through which to send requests, such as a urllib3 PoolManager shared between
+        many clients (see ZamzarClientFactory) or an HttpxTransport. Defaults to a urllib3 PoolManager owned by this
+        client.
+        """
+        self.sync = ZamzarClient(api_key, environment, host, retries, timeout, observers, rate_limiter, transport)
+
+        self.files = AsyncFilesService(self, self.sync._client)
+        self.imports = AsyncImportsService(self, self.sync._client)
+        self.jobs = AsyncJobsService(self, self.sync._client)
+
+    async def convert(
+            self,
+            source: Union[Path, str, int],
+            target_format: str,
+            source_format: Optional[str] = None,
+            export_url: Optional[str] = None,
+            options: Optional[Dict[str, Any]] = None
+    ) -> AsyncJobManager:
+        """
+        Converts a local file to the specified format, returning once the conversion is complete.
+
+        :param source: the path to the file to convert, the ID of the file to convert, or the URL of the file to convert
+        :param target_format: the format to convert the file to
+        :param source_format: the format of the file to convert (defaults to the extension of the source)
+        :param export_url: an optional URL to which to export the converted file
+        :param options: optional parameters to customize the conversion
+        """
+        job = await self.jobs.create(source, target_format, source_format, export_url, options)
+        return await job.await_completion()
+
+    async def download(self, file_id: int, target: Union[str, Path], ranges: int = 1) -> AsyncFileManager:
+        """
+        Downloads a file from Zamzar's API servers to the given destination, returning once the download is complete.
+
+        :param file_id: the ID of the file to download
+        :param target: the path (or directory) to which to download the file
+        :param ranges: the number of byte ranges to download concurrently (see `FilesService.download`)
+        """
+        return await self.files.download(file_id, Path(target), ranges)
+
+    async def upload(self, source: Union[str, Path, BinaryIO], name: Optional[str] = None) -> AsyncFileManager:
+        """
+        Uploads a local file to Zamzar's API servers with the given name, returning once the upload is complete.
+
+        :param source: the path to the file to upload, or a binary file-like object from which to read the file
+        :param name: the name to give the file on the Zamzar API servers (defaults to the name of the file at the
+        source path)
+        """
+        return await self.files.upload(source, name)
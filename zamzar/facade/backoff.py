@@ -0,0 +1,113 @@
+import random
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from enum import Enum
+from typing import Dict, Iterator, List, Optional
+
+# The standard multiplier for decorrelated jitter, under which delays grow by 1.5x (on average) per poll
+DECORRELATED_MULTIPLIER = 3.0
+
+
+class Backoff(ABC):
+    """A strategy for choosing how long to wait between successive polls of an asynchronous API operation."""
+
+    @abstractmethod
+    def delays(self, awaitable=None) -> Iterator[timedelta]:
+        """
+        Returns an endless iterator over the delays before each successive poll of an operation.
+
+        :param awaitable: the job or import request being awaited, which strategies may use to tailor the delays
+        """
+        pass
+
+
+class Jitter(Enum):
+    """
+    The randomisation applied to exponentially increasing delays, so that many operations do not poll in lockstep.
+
+    NONE: no randomisation; the delays are deterministic.
+    FULL: each delay is chosen uniformly between zero and the exponentially increasing delay.
+    DECORRELATED: each delay is chosen uniformly between the initial delay and three times the previous delay.
+    """
+    NONE = "none"
+    FULL = "full"
+    DECORRELATED = "decorrelated"
+
+
+class ListBackoff(Backoff):
+    """Waits for each of a fixed list of delays in turn, repeating the last delay once the list is exhausted."""
+
+    def __init__(self, delays: List[timedelta]):
+        if not delays:
+            raise ValueError("At least one delay is required")
+        self._delays = list(delays)
+
+    def delays(self, awaitable=None) -> Iterator[timedelta]:
+        yield from self._delays
+        while True:
+            yield self._delays[-1]
+
+
+class ExponentialBackoff(Backoff):
+    """
+    Waits for exponentially increasing delays (capped at a maximum), randomised by the chosen jitter. The multiplier
+    applies to the exponential ceiling of NONE and FULL jitter; DECORRELATED jitter always uses the standard multiplier
+    of three times the previous delay.
+
+    Pass a seed to make the randomised delays deterministic (e.g., in tests).
+    """
+
+    def __init__(
+            self,
+            initial: timedelta = timedelta(milliseconds=100),
+            multiplier: float = 2.0,
+            cap: timedelta = timedelta(seconds=60),
+            jitter: Jitter = Jitter.DECORRELATED,
+            seed: Optional[int] = None
+    ):
+        self.initial = initial
+        self.multiplier = multiplier
+        self.cap = cap
+        self.jitter = jitter
+        self.seed = seed
+
+    def delays(self, awaitable=None) -> Iterator[timedelta]:
+        rng = random.Random(self.seed)
+        initial = self.initial.total_seconds()
+        cap = self.cap.total_seconds()
+        ceiling = previous = initial
+        while True:
+            if self.jitter == Jitter.FULL:
+                delay = rng.uniform(0, ceiling)
+            elif self.jitter == Jitter.DECORRELATED:
+                delay = min(cap, rng.uniform(initial, previous * DECORRELATED_MULTIPLIER))
+            else:
+                delay = ceiling
+            yield timedelta(seconds=delay)
+            ceiling = min(cap, ceiling * self.multiplier)
+            previous = max(delay, initial)
+
+
+class ExpectedDurationBackoff(Backoff):
+    """
+    Waits for the expected duration of a conversion to the target format of a job before first polling it, and then
+    falls back to another strategy. This avoids polling repeatedly for conversions that are known to take a while.
+    """
+
+    def __init__(self, expected: Dict[str, timedelta], backoff: Optional[Backoff] = None):
+        """
+        :param expected: the expected duration of conversions, keyed by target format (e.g., {"mp4": 30s})
+        :param backoff: the strategy to fall back to after the first poll (default: the default backoff)
+        """
+        self.expected = expected
+        self.backoff = backoff or DEFAULT_BACKOFF
+
+    def delays(self, awaitable=None) -> Iterator[timedelta]:
+        model = getattr(awaitable, "model", None)
+        expected = self.expected.get(getattr(model, "target_format", None) or "")
+        if expected is not None:
+            yield expected
+        yield from self.backoff.delays(awaitable)
+
+
+DEFAULT_BACKOFF: Backoff = ExponentialBackoff()
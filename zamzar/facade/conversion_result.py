@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional, Union
+
+from .job_manager import JobManager
+
+
+class ConversionResult:
+    """The outcome of converting one of the sources passed to `ZamzarClient.convert_many`."""
+
+    def __init__(
+            self,
+            source: Union[Path, str, int],
+            job: Optional[JobManager] = None,
+            error: Optional[Exception] = None
+    ):
+        self.source = source
+        self.job = job
+        self.error = error
+
+    @property
+    def succeeded(self) -> bool:
+        """Indicates whether the source was converted (and stored, if requested) without error."""
+        return self.error is None and self.job is not None and self.job.has_succeeded()
+
+    def to_str(self) -> str:
+        job_id = self.job.id if self.job else None
+        return f"ConversionResult(source={self.source}, job={job_id}, succeeded={self.succeeded})"
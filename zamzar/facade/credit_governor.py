@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import timedelta
+from typing import Optional
+
+from ._internal import CreditLedger
+from .. import ApiException
+
+
+class CreditBudgetExceededException(ApiException):
+    """Raised when submitting a job would take the remaining credits below the floor of a CreditGovernor."""
+    pass
+
+
+class CreditReservation:
+    """Credits set aside by a CreditGovernor for a job that is being submitted. Release once the job is submitted."""
+
+    def __init__(self, governor: CreditGovernor, credits: int):
+        self._governor = governor
+        self.credits = credits
+        self.released = False
+
+    def release(self):
+        """Returns the credits to the governor (the cost of a submitted job is then reflected by the ledger)."""
+        if not self.released:
+            self.released = True
+            self._governor._release(self.credits)
+
+    def __enter__(self) -> CreditReservation:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+class CreditGovernor:
+    """
+    Controls admission of jobs based on the credits that remain, so that a runaway batch cannot spend the whole balance.
+
+    Before a job is submitted, the governor reserves the cost of the conversion (per the client's FormatsCatalogue).
+    If the remaining credits -- as reported by the headers of the client's latest responses, less any outstanding
+    reservations -- would fall below the floor, the submission waits (for up to `wait`) for credits to become
+    available, and is otherwise rejected with a CreditBudgetExceededException. No extra requests are made to check
+    the balance; until a response has reported the remaining credits, all submissions are admitted.
+
+    Example usage:
+
+            ```python
+            zamzar = ZamzarClient("YOUR_API_KEY_GOES_HERE")
+            zamzar.governor = CreditGovernor(zamzar, floor=100)
+
+            zamzar.convert("path/to/source.pdf", "jpg")  # raises if fewer than 100 credits would remain
+            ```
+    """
+
+    __RECHECK_INTERVAL = 1.0
+
+    def __init__(
+            self,
+            zamzar,
+            floor: int = 0,
+            wait: Optional[timedelta] = None,
+            sandbox: bool = False,
+            default_cost: int = 1
+    ):
+        """
+        :param zamzar: the client whose credits to govern
+        :param floor: the number of credits that must remain after any job is submitted (default: 0)
+        :param wait: how long a submission may wait for credits to become available before it is rejected (default:
+        reject immediately)
+        :param sandbox: whether to govern sandbox credits rather than production credits (default: False)
+        :param default_cost: the cost to assume for conversions whose cost is unknown (default: 1)
+        """
+        self._zamzar = zamzar
+        self.floor = floor
+        self.wait = wait
+        self.sandbox = sandbox
+        self.default_cost = default_cost
+        self.__reserved = 0
+        self.__condition = threading.Condition()
+
+    @property
+    def ledger(self) -> CreditLedger:
+        return self._zamzar.sandbox_credits if self.sandbox else self._zamzar.production_credits
+
+    @property
+    def reserved(self) -> int:
+        """Returns the number of credits reserved by submissions that are in progress."""
+        return self.__reserved
+
+    @property
+    def available(self) -> Optional[int]:
+        """Returns the number of credits that can be reserved before reaching the floor, or None if not yet known."""
+        reading = self.ledger.latest
+        return reading.credits - self.__reserved - self.floor if reading is not None else None
+
+    def cost_of(self, source_format: Optional[str], target_format: str) -> int:
+        """Returns the number of credits charged to convert from the source format to the target format."""
+        if not source_format:
+            return self.default_cost
+        try:
+            credit_cost = self._zamzar.catalogue.credit_cost(source_format, target_format)
+        except ApiException:
+            # Assume the default cost; the catalogue is retrieved again next time (e.g., after a 429 or a 5xx)
+            return self.default_cost
+        return credit_cost if credit_cost is not None else self.default_cost
+
+    def admit(self, source_format: Optional[str], target_format: str) -> CreditReservation:
+        """Reserves the cost of converting from the source format to the target format (see `reserve`)."""
+        return self.reserve(self.cost_of(source_format, target_format))
+
+    def reserve(self, credits: int) -> CreditReservation:
+        """
+        Reserves credits, waiting (for up to `wait`) until they are available without crossing the floor.
+
+        :raises CreditBudgetExceededException: if the credits do not become available in time
+        """
+        deadline = time.monotonic() + (self.wait.total_seconds() if self.wait else 0)
+        with self.__condition:
+            while True:
+                available = self.available
+                if available is None or credits <= available:
+                    self.__reserved += credits
+                    return CreditReservation(self, credits)
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise CreditBudgetExceededException(
+                        f"Reserving {credits} credits would leave fewer than {self.floor} credits remaining"
+                    )
+
+                # Reservations notify on release, but top ups are only seen in the ledger, so recheck periodically
+                self.__condition.wait(min(remaining, self.__RECHECK_INTERVAL))
+
+    def _release(self, credits: int):
+        with self.__condition:
+            self.__reserved -= credits
+            self.__condition.notify_all()
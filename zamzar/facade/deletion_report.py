@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict, List
+
+
+class DeletionReport:
+    """
+    The progress (and, once complete, the outcome) of deleting many files via `FilesService.delete_many` or
+    `FilesService.sweep`.
+
+    Files that no longer exist on the Zamzar API servers (i.e., for which the API responded 404 Not Found) are counted
+    as missing rather than failed, as the end result is the same.
+    """
+
+    def __init__(self):
+        self.deleted: List[int] = []
+        self.missing: List[int] = []
+        self.failed: Dict[int, Exception] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def processed(self) -> int:
+        """The number of files processed so far (whether deleted, missing or failed)."""
+        return len(self.deleted) + len(self.missing) + len(self.failed)
+
+    @property
+    def succeeded(self) -> bool:
+        """Indicates whether every file processed so far was deleted (or was already missing)."""
+        return not self.failed
+
+    def raise_for_failures(self) -> DeletionReport:
+        """Raises the exception for the first file that could not be deleted, if any."""
+        for error in self.failed.values():
+            raise error
+        return self
+
+    def to_str(self) -> str:
+        return f"DeletionReport(deleted={len(self.deleted)}, missing={len(self.missing)}, failed={len(self.failed)})"
+
+    def _record_deleted(self, file_id: int):
+        with self._lock:
+            self.deleted.append(file_id)
+
+    def _record_missing(self, file_id: int):
+        with self._lock:
+            self.missing.append(file_id)
+
+    def _record_failed(self, file_id: int, error: Exception):
+        with self._lock:
+            self.failed[file_id] = error
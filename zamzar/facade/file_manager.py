@@ -19,9 +19,13 @@ class FileManager:
         self._zamzar.files.delete(self.id)
         return self
 
-    def download(self, target: Union[str, Path]) -> FileManager:
-        """Downloads the file to the specified destination, blocking until the download is complete."""
-        self._zamzar.files._download_model(self.model, Path(target))
+    def download(self, target: Union[str, Path], ranges: int = 1) -> FileManager:
+        """
+        Downloads the file to the specified destination, blocking until the download is complete.
+
+        :param ranges: the number of byte ranges to download concurrently (see `FilesService.download`)
+        """
+        self._zamzar.files._download_model(self.model, Path(target), ranges)
         return self
 
     def to_str(self) -> str:
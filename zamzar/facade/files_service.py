@@ -1,20 +1,50 @@
 import os
+import re
+import threading
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Union, Optional
+from typing import Union, Optional, BinaryIO, Callable, Iterable, Iterator, List
 
+import urllib3
+from urllib3.exceptions import MaxRetryError, ProtocolError, ReadTimeoutError
+
+from zamzar import ApiException
 from zamzar.api import FilesApi
 from zamzar.api_client import ApiClient
+from zamzar.exceptions import NotFoundException
+from zamzar.facade.deletion_report import DeletionReport
 from zamzar.facade.file_manager import FileManager
 from zamzar.models import File
 from zamzar.pagination import Paged, Anchor
+from zamzar.rest import RESTResponse
+from ._internal import MAX_PAGE_SIZE, MultipartEncoder, iterate_all, map_bounded
+
+
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class FilesService:
     """Uploads to, downloads from, and retrieves files on the Zamzar API servers."""
 
+    @staticmethod
+    def __filename(source: Union[str, Path, BinaryIO], name: Optional[str]) -> str:
+        if isinstance(source, (str, Path)):
+            return os.path.basename(os.fspath(source))
+
+        source_name = getattr(source, "name", None)
+        if isinstance(source_name, str) and os.path.basename(source_name):
+            return os.path.basename(source_name)
+
+        if name:
+            return name
+
+        raise ValueError("Could not determine the name of the file to upload. Provide a name for the file.")
+
     def __init__(self, zamzar, client: ApiClient):
         self._zamzar = zamzar
         self._api = FilesApi(client)
+        self.download_chunk_size = DEFAULT_DOWNLOAD_CHUNK_SIZE
 
     def delete(self, file_id: int) -> FileManager:
         """
@@ -22,16 +52,133 @@ class FilesService:
         """
         return self.__to_file(self._api.delete_file_by_id(file_id=file_id))
 
-    def download(self, file_id: int, target: Union[str, Path]) -> FileManager:
+    def delete_many(
+            self,
+            files: Iterable[Union[int, FileManager]],
+            max_in_flight: int = 8,
+            progress: Optional[Callable[[DeletionReport], None]] = None
+    ) -> DeletionReport:
+        """
+        Immediately deletes many files from the Zamzar API servers, blocking until every file has been processed.
+
+        Files are deleted by a pool of at most max_in_flight workers (or, if max_in_flight is 1, one after another on
+        the calling thread), and are consumed lazily, so the files can be a generator over a large listing. Files that
+        no longer exist are reported as missing, and a failure to delete one file is reported in the result, and does
+        not abort the batch.
+
+        :param files: the IDs of the files to delete (or the files themselves)
+        :param max_in_flight: the maximum number of files to delete concurrently (default: 8)
+        :param progress: an optional callback, which is passed the report each time a file has been processed
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        report = DeletionReport()
+
+        def delete(file_id: int):
+            try:
+                self._api.delete_file_by_id(file_id=file_id)
+                report._record_deleted(file_id)
+            except NotFoundException:
+                report._record_missing(file_id)
+            except Exception as e:
+                report._record_failed(file_id, e)
+
+        file_ids = (file.id if isinstance(file, FileManager) else file for file in files)
+        if max_in_flight == 1:
+            for file_id in file_ids:
+                delete(file_id)
+                if progress:
+                    progress(report)
+            return report
+
+        for _ in map_bounded(delete, file_ids, max_in_flight):
+            if progress:
+                progress(report)
+        return report
+
+    def sweep(
+            self,
+            older_than: Optional[timedelta] = None,
+            where: Optional[Callable[[FileManager], bool]] = None,
+            max_in_flight: int = 8,
+            progress: Optional[Callable[[DeletionReport], None]] = None
+    ) -> DeletionReport:
+        """
+        Deletes every file on the Zamzar API servers that matches the given criteria (e.g., files orphaned by a worker
+        that crashed before cleaning up after itself).
+
+        The matching files are gathered from a full listing of the account's files before any are deleted, so that the
+        listing is not paged while it is being modified. See `delete_many` for how the files are deleted.
+
+        :param older_than: if specified, only delete files which were created at least this long ago
+        :param where: if specified, only delete files for which this predicate returns True
+        :param max_in_flight: the maximum number of files to delete concurrently (default: 8)
+        :param progress: an optional callback, which is passed the report each time a file has been processed
+
+        Example usage:
+
+                    ```python
+                    zamzar = ZamzarClient("YOUR_API_GOES_HERE")
+
+                    report = zamzar.files.sweep(older_than=timedelta(hours=6))
+                    print(f"Deleted {len(report.deleted)} files")
+                    ```
+        """
+        if older_than is None and where is None:
+            raise ValueError("Specify older_than and/or where, to avoid deleting every file by accident")
+
+        cutoff = datetime.now(timezone.utc) - older_than if older_than is not None else None
+
+        def matches(file: FileManager) -> bool:
+            if cutoff is not None:
+                created_at = file.model.created_at
+                if created_at is None or FilesService.__as_utc(created_at) > cutoff:
+                    return False
+            return where is None or where(file)
+
+        file_ids = [file.id for file in self.iter_all(prefetch=True) if matches(file)]
+        return self.delete_many(file_ids, max_in_flight, progress)
+
+    def download(self, file_id: int, target: Union[str, Path], ranges: int = 1) -> FileManager:
         """
         Downloads a file to the specified destination. Blocks until the download is complete.
+
+        The content of the file is streamed to a partial (`.part`) file alongside the destination (in chunks of
+        `download_chunk_size` bytes), which is renamed to the destination once the download is complete. Interrupted
+        downloads are resumed from the end of the partial file, both when retrying and on subsequent calls.
+
+        If ranges is greater than 1, the file is instead split into that many byte ranges, which are downloaded
+        concurrently (by at most as many workers as the client keeps connections open to each host) into a separate
+        preallocated file (which is not resumed). The download falls back to a single stream if the server does not
+        support range requests.
+
+        :param file_id: the ID of the file to download
+        :param target: the path (or directory) to which to download the file
+        :param ranges: the number of byte ranges of the file to download concurrently (default: 1, a single stream)
+        :raises ValueError: if ranges is less than 1
         """
-        return self.find(file_id).download(Path(target))
+        return self.find(file_id).download(Path(target), ranges)
 
     def find(self, file_id: int) -> FileManager:
         """Retrieves a file by its ID."""
         return self.__to_file(self._api.get_file_by_id(file_id=file_id))
 
+    def iter_all(
+            self,
+            limit: int = MAX_PAGE_SIZE,
+            prefetch: bool = False,
+            until: Optional[Callable[[FileManager], bool]] = None
+    ) -> Iterator[FileManager]:
+        """
+        Lazily iterates over every file (most recent first), retrieving one page at a time.
+
+        :param limit: indicates the number of files to retrieve per page (default: the maximum)
+        :param prefetch: whether to retrieve the next page in the background while the current page is consumed
+        :param until: an optional predicate; iteration stops at the first file for which it returns True
+        """
+        return iterate_all(self, limit, prefetch, until)
+
     def list(self, anchor: Optional[Anchor] = None, limit: Optional[int] = None) -> Paged[FileManager]:
         """
         Retrieves a list of files.
@@ -45,26 +192,239 @@ class FilesService:
         files = [self.__to_file(file) for file in (response.data or [])]
         return Paged(self, files, response.paging)
 
-    def upload(self, source: Union[str, Path], name: Optional[str] = None) -> FileManager:
+    def upload(self, source: Union[str, Path, BinaryIO], name: Optional[str] = None) -> FileManager:
         """
         Uploads a file to the Zamzar API servers. Blocks until the upload is complete.
 
-        :param source: the path to the file to upload
+        The content of the file is streamed to the Zamzar API servers in chunks, and is never read into memory in full.
+
+        :param source: the path to the file to upload, or a binary file-like object from which to read the file
         :param name: the name to give the file on the Zamzar API servers (defaults to the name of the file at the
         source path)
         """
-        file = self._api.upload_file(content=os.fspath(Path(source)), name=name)
+        filename = FilesService.__filename(source, name)
+        if isinstance(source, (str, Path)):
+            with open(source, "rb") as stream:
+                file = self.__upload_stream(stream, filename, name)
+        else:
+            file = self.__upload_stream(source, filename, name)
         return FileManager(self._zamzar, file)
 
-    def _download_model(self, model: File, target: Path) -> Path:
+    def _download_model(self, model: File, target: Path, ranges: int = 1) -> Path:
+        if ranges < 1:
+            raise ValueError("ranges must be at least 1")
         if target.is_dir():
             name = model.name if model.name else f"{model.id}"
             target = target / name
 
-        with open(target, "wb") as file:
-            file.write(self._api.get_file_content_by_id(file_id=model.id))
+        partial = target.with_name(f"{target.name}.{model.id}.part")
+        # Ranges are written into a preallocated file, which (unlike the partial file) cannot be resumed from its
+        # length, so is kept apart from the partial file; any left behind by an earlier (e.g., killed) download is
+        # discarded
+        preallocated = target.with_name(f"{target.name}.{model.id}.ranges.part")
+        preallocated.unlink(missing_ok=True)
+        if ranges > 1 and model.size and not partial.exists():
+            downloaded = self.__download_ranges(model, partial, preallocated, ranges)
+        else:
+            self.__download_stream(model, partial)
+            downloaded = partial
 
+        os.replace(downloaded, target)
         return target
 
+    def __download_stream(self, model: File, partial: Path, response: Optional[urllib3.BaseHTTPResponse] = None):
+        def transfer():
+            # Use the given response (if any) for the first attempt only; retries resume with a new request
+            nonlocal response
+            first, response = response, None
+            self.__download_to_partial(model, partial, first)
+
+        self.__retry_interrupted(transfer)
+
+    def __download_ranges(self, model: File, partial: Path, preallocated: Path, ranges: int) -> Path:
+        size = model.size or 0
+        length = -(-size // min(ranges, size))
+        bounds = [(start, min(start + length, size) - 1) for start in range(0, size, length)]
+
+        # The response for the first range doubles as a probe of whether the server supports range requests
+        probe = self.__request_range(model, *bounds[0])
+        if probe.status == 200:
+            # The server sent the whole file (ignoring the range), so keep it rather than requesting it again
+            self.__download_stream(model, partial, probe)
+            return partial
+        if probe.status != 206 or FilesService.__range_start(probe) != 0:
+            try:
+                if probe.status != 416:
+                    self.__raise_for_status(probe)
+            finally:
+                probe.close()
+                probe.release_conn()
+            self.__download_stream(model, partial)
+            return partial
+
+        with open(preallocated, "wb") as file:
+            file.truncate(size)
+        cancelled = threading.Event()
+        # Never download more ranges at once than the pool keeps connections open for (as urllib3 discards the others)
+        maxsize = self._api.api_client.configuration.connection_pool_maxsize
+        executor = ThreadPoolExecutor(max_workers=min(len(bounds), maxsize))
+        futures: List[Future[None]] = []
+        try:
+            for start, end in bounds:
+                futures.append(executor.submit(
+                    self.__download_range, model, preallocated, start, end, cancelled, probe if start == 0 else None
+                ))
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                future.result()
+        except BaseException:
+            # Stop the other ranges (at their next chunk) rather than waiting for them to complete
+            cancelled.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            preallocated.unlink(missing_ok=True)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+        return preallocated
+
+    def __download_range(
+            self,
+            model: File,
+            partial: Path,
+            start: int,
+            end: int,
+            cancelled: threading.Event,
+            response: Optional[urllib3.BaseHTTPResponse] = None
+    ):
+        with open(partial, "r+b") as file:
+            file.seek(start)
+
+            def transfer():
+                nonlocal response
+                position = file.tell()
+                if response is None:
+                    if cancelled.is_set():
+                        return
+                    response = self.__request_range(model, position, end)
+                try:
+                    self.__raise_for_status(response)
+                    if response.status != 206 or FilesService.__range_start(response) != position:
+                        response.close()
+                        raise ApiException(f"The server did not honour the range request for bytes {position}-{end}")
+                    for chunk in response.stream(self.download_chunk_size):
+                        if cancelled.is_set():
+                            # Another range has failed, so the download is abandoned
+                            response.close()
+                            return
+                        file.write(chunk)
+                finally:
+                    response.release_conn()
+                    response = None
+
+                if file.tell() <= end:
+                    raise ProtocolError(f"Range ended after {file.tell() - start} of {end + 1 - start} bytes")
+                if file.tell() > end + 1:
+                    raise ApiException(f"The server sent more than the requested range of bytes {position}-{end}")
+
+            self.__retry_interrupted(transfer)
+
+    def __request_range(self, model: File, start: int, end: int) -> urllib3.BaseHTTPResponse:
+        return self._api.get_file_content_by_id_without_preload_content(
+            file_id=model.id,
+            _headers={"Range": f"bytes={start}-{end}"},
+        )
+
+    def __retry_interrupted(self, transfer: Callable[[], None]):
+        retries = urllib3.Retry.from_int(self._zamzar.retries)
+        while True:
+            try:
+                return transfer()
+            except (ProtocolError, ReadTimeoutError) as e:
+                # The transfer was interrupted, so resume from where it got to (unless out of retries)
+                try:
+                    retries = retries.increment(method="GET", error=e)
+                except MaxRetryError:
+                    raise e
+                retries.sleep()
+
+    def __download_to_partial(
+            self,
+            model: File,
+            partial: Path,
+            response: Optional[urllib3.BaseHTTPResponse] = None
+    ):
+        offset = partial.stat().st_size if partial.exists() else 0
+        if model.size is not None and offset > model.size:
+            partial.unlink()
+            offset = 0
+        if model.size is not None and 0 < offset == model.size:
+            return
+
+        if response is None:
+            headers = {"Range": f"bytes={offset}-"} if offset else None
+            response = self._api.get_file_content_by_id_without_preload_content(file_id=model.id, _headers=headers)
+        try:
+            resumed = offset > 0 and response.status == 206 and FilesService.__range_start(response) == offset
+            restart = offset > 0 and (response.status == 416 or (response.status == 206 and not resumed))
+            if restart:
+                response.drain_conn()
+            else:
+                self.__raise_for_status(response)
+                with open(partial, "ab" if resumed else "wb") as file:
+                    for chunk in response.stream(self.download_chunk_size):
+                        file.write(chunk)
+        finally:
+            response.release_conn()
+
+        if restart:
+            # The server could not resume from our offset, so start again from scratch
+            partial.unlink()
+            return self.__download_to_partial(model, partial)
+
+        size = partial.stat().st_size
+        if model.size is not None and size < model.size:
+            raise ProtocolError(f"Download ended after {size} of {model.size} bytes")
+        if model.size is not None and size > model.size:
+            partial.unlink()
+            raise ApiException(f"Downloaded {size} bytes but expected the file to contain {model.size} bytes")
+
+    @staticmethod
+    def __as_utc(moment: datetime) -> datetime:
+        return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+    @staticmethod
+    def __range_start(response: urllib3.BaseHTTPResponse) -> Optional[int]:
+        match = re.match(r"bytes (\d+)-", response.headers.get("Content-Range", ""))
+        return int(match.group(1)) if match else None
+
+    def __raise_for_status(self, response: urllib3.BaseHTTPResponse):
+        if 200 <= response.status <= 299:
+            return
+        error = RESTResponse(response)
+        error.read()
+        self._api.api_client.response_deserialize(
+            response_data=error, response_types_map={"4XX": "Errors", "5XX": "Errors"}
+        )
+
+    def __upload_stream(self, stream: BinaryIO, filename: str, name: Optional[str]) -> File:
+        client = self._api.api_client
+        fields = [("name", name)] if name is not None else []
+        with MultipartEncoder(fields, "content", filename, stream) as body:
+            # Serialize the request in the same way as the generated upload_file, but send the body as a stream
+            method, url, headers, _, _ = self._api._upload_file_serialize(
+                content=None,
+                name=None,
+                _request_auth=None,
+                _content_type=body.content_type,
+                _headers=None,
+                _host_index=0,
+            )
+            response = client.call_api(method, url, header_params=headers, body=body)
+            response.read()
+
+        return client.response_deserialize(response_data=response, response_types_map={"201": "File"}).data
+
     def __to_file(self, model: File) -> FileManager:
         return FileManager(self._zamzar, model)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+ConversionIndex = Dict[str, Dict[str, Optional[int]]]
+
+
+class FormatsCatalogue:
+    """
+    A cached catalogue of the conversions supported by the Zamzar API, indexed by source format and then by target
+    format (giving the credit cost of each conversion).
+
+    The catalogue is retrieved (by paging through `FormatsService.iter_all`) the first time it is needed -- once,
+    however many threads need it at the same time -- and is then refreshed in the background whenever it is older than
+    its TTL, while the stale catalogue continues to be served.
+    If a path is given, the catalogue is loaded from that file (if present) and saved to it after each retrieval, so
+    that new processes can start without any network calls.
+    """
+
+    def __init__(
+            self,
+            zamzar,
+            ttl: timedelta = timedelta(hours=24),
+            path: Optional[Union[str, Path]] = None
+    ):
+        """
+        :param zamzar: the client with which to retrieve the catalogue
+        :param ttl: how long the catalogue is fresh for, after which it is refreshed (default: 24 hours)
+        :param path: an optional file to which to persist the catalogue, and from which to load it
+        """
+        self._zamzar = zamzar
+        self.ttl = ttl
+        self.path = Path(path) if path is not None else None
+        self.__index: Optional[ConversionIndex] = None
+        self.__retrieved_at = 0.0
+        self.__lock = threading.Lock()
+        self.__first_retrieval = threading.Lock()
+        self.__refreshing: Optional[threading.Thread] = None
+
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    @property
+    def index(self) -> ConversionIndex:
+        """Returns the index of source format -> {target format: credit cost}, retrieving it if necessary."""
+        index = self.__index
+        if index is None:
+            return self.refresh()
+        if self.is_stale():
+            self.refresh(block=False)
+        return index
+
+    def can_convert(self, source_format: str, target_format: str) -> bool:
+        """Indicates whether the Zamzar API supports converting from the source format to the target format."""
+        return target_format in self.index.get(source_format, {})
+
+    def credit_cost(self, source_format: str, target_format: str) -> Optional[int]:
+        """Returns the credit cost of converting from the source format to the target format (None if unsupported)."""
+        return self.index.get(source_format, {}).get(target_format)
+
+    def targets(self, source_format: str) -> Dict[str, Optional[int]]:
+        """Returns the target formats (and their credit costs) to which the source format can be converted."""
+        return dict(self.index.get(source_format, {}))
+
+    def is_stale(self) -> bool:
+        """Indicates whether the catalogue is older than its TTL (or has not been retrieved yet)."""
+        return self.__index is None or time.time() - self.__retrieved_at > self.ttl.total_seconds()
+
+    def refresh(self, block: bool = True) -> ConversionIndex:
+        """
+        Retrieves the catalogue from the Zamzar API.
+
+        :param block: whether to wait for the catalogue to be retrieved; if False (and a catalogue has already been
+        retrieved), the catalogue is retrieved on a background thread -- at most one at a time -- and the current
+        catalogue is returned
+        """
+        index = self.__index
+        if index is None:
+            return self.__retrieve_first()
+        if block:
+            return self.__retrieve()
+
+        with self.__lock:
+            if self.__refreshing is None:
+                self.__refreshing = threading.Thread(target=self.__retrieve_in_background, daemon=True)
+                self.__refreshing.start()
+        return index
+
+    def load(self, path: Union[str, Path]):
+        """Loads the catalogue from a file previously written by `save`."""
+        with open(path, "r", encoding="utf-8") as file:
+            saved = json.load(file)
+        self.__index = saved["formats"]
+        self.__retrieved_at = float(saved["retrieved_at"])
+
+    def save(self, path: Union[str, Path]):
+        """Saves the catalogue to a file (atomically), from which it can later be loaded."""
+        path = Path(path)
+        partial = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.part")
+        with open(partial, "w", encoding="utf-8") as file:
+            json.dump({"retrieved_at": self.__retrieved_at, "formats": self.index}, file)
+        os.replace(partial, path)
+
+    def __retrieve(self) -> ConversionIndex:
+        index: ConversionIndex = {
+            _format.name: {target.name: target.credit_cost for target in (_format.targets or [])}
+            for _format in self._zamzar.formats.iter_all()
+        }
+
+        self.__index = index
+        self.__retrieved_at = time.time()
+        if self.path is not None:
+            self.save(self.path)
+        return index
+
+    def __retrieve_first(self) -> ConversionIndex:
+        # Only the first caller retrieves the catalogue; any others wait for (and then share) its result
+        with self.__first_retrieval:
+            index = self.__index
+            return index if index is not None else self.__retrieve()
+
+    def __retrieve_in_background(self):
+        try:
+            self.__retrieve()
+        except Exception:
+            # Keep serving the stale catalogue; the next access will try again
+            logger.warning("Could not refresh the formats catalogue", exc_info=True)
+        finally:
+            with self.__lock:
+                self.__refreshing = None
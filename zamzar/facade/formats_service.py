@@ -1,7 +1,10 @@
+from typing import Optional, Callable, Iterator
+
 from zamzar.api import FormatsApi
 from zamzar.api_client import ApiClient
 from zamzar.models.format import Format
 from zamzar.pagination import Paged
+from ._internal import MAX_PAGE_SIZE, iterate_all
 
 
 class FormatsService:
@@ -15,6 +18,21 @@ class FormatsService:
         """Retrieves a file format by its name."""
         return self._api.get_format_by_id(format=name)
 
+    def iter_all(
+            self,
+            limit: int = MAX_PAGE_SIZE,
+            prefetch: bool = False,
+            until: Optional[Callable[[Format], bool]] = None
+    ) -> Iterator[Format]:
+        """
+        Lazily iterates over every file format (in alphabetical order), retrieving one page at a time.
+
+        :param limit: indicates the number of file formats to retrieve per page (default: the maximum)
+        :param prefetch: whether to retrieve the next page in the background while the current page is consumed
+        :param until: an optional predicate; iteration stops at the first file format for which it returns True
+        """
+        return iterate_all(self, limit, prefetch, until)
+
     def list(self, anchor=None, limit=None) -> Paged[Format]:
         """
         Retrieves a list of file formats.
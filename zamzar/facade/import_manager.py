@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import Optional
 
 from zamzar.models import Failure
 from zamzar.models import ModelImport
-from ._internal import Awaitable
+from ._internal import Awaitable, requested_delay
 from .file_manager import FileManager
 from .job_status import JobStatus
 
@@ -18,6 +19,7 @@ class ImportManager(Awaitable):
         self._zamzar = zamzar
         self.model = model
         self.id = model.id
+        self.__requested_delay: Optional[timedelta] = None
 
     def has_completed(self) -> bool:
         """Indicates whether the import request has completed."""
@@ -43,7 +45,12 @@ class ImportManager(Awaitable):
 
     def refresh(self) -> ImportManager:
         """Performs an API request to determine the current state of the import request."""
-        return self._zamzar.imports.find(self.id)
+        refreshed = self._zamzar.imports.find(self.id)
+        refreshed.__requested_delay = requested_delay(self._zamzar)
+        return refreshed
+
+    def _requested_delay(self) -> Optional[timedelta]:
+        return self.__requested_delay
 
     def to_str(self) -> str:
         return f"ImportManager(id={self.id})"
@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import Optional, Callable, Iterator
 
 from zamzar.api import ImportsApi
 from zamzar.models.model_import import ModelImport
 from zamzar.pagination import Paged, Anchor
+from ._internal import MAX_PAGE_SIZE, iterate_all
 from .import_manager import ImportManager
 from ..api_client import ApiClient
 
@@ -18,6 +19,21 @@ class ImportsService:
         """Retrieves an import request by its ID."""
         return self.__to_import(self._api.get_import_by_id(import_id=import_id))
 
+    def iter_all(
+            self,
+            limit: int = MAX_PAGE_SIZE,
+            prefetch: bool = False,
+            until: Optional[Callable[[ImportManager], bool]] = None
+    ) -> Iterator[ImportManager]:
+        """
+        Lazily iterates over every import request (most recent first), retrieving one page at a time.
+
+        :param limit: indicates the number of import requests to retrieve per page (default: the maximum)
+        :param prefetch: whether to retrieve the next page in the background while the current page is consumed
+        :param until: an optional predicate; iteration stops at the first import request for which it returns True
+        """
+        return iterate_all(self, limit, prefetch, until)
+
     def list(self, anchor: Optional[Anchor] = None, limit: Optional[int] = None) -> Paged[ImportManager]:
         """
         Retrieves a list of import requests.
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import bisect
+import copy
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from urllib3.util.retry import RequestHistory
+
+
+class RequestEvent:
+    """
+    Describes an HTTP request made by the client, as it progresses.
+
+    - method: the HTTP method (e.g., GET)
+    - url: the full URL of the request
+    - route: the templated path of the request, with IDs replaced by placeholders (e.g., /jobs/{id})
+    - status: the HTTP status of the (final) response, once received
+    - duration: the number of seconds until the (final) response headers were received, or the request failed
+    - bytes_sent: the size of the request body, if known
+    - bytes_received: the size of the response body (as advertised by its Content-Length), if known
+    - retries: the number of times that the request was retried
+    """
+
+    @staticmethod
+    def route_of(url: str) -> str:
+        path = re.sub(r"^/v\d+(?=/)", "", urlparse(url).path)
+        return re.sub(r"/\d+(?=/|$)", "/{id}", path)
+
+    def __init__(self, method: str, url: str, bytes_sent: Optional[int] = None):
+        self.method = method
+        self.url = url
+        self.route = RequestEvent.route_of(url)
+        self.status: Optional[int] = None
+        self.duration: Optional[float] = None
+        self.bytes_sent = bytes_sent
+        self.bytes_received: Optional[int] = None
+        self.retries = 0
+
+    def to_str(self) -> str:
+        return f"RequestEvent({self.method} {self.route}, status={self.status}, duration={self.duration})"
+
+
+class RequestObserver:
+    """
+    Observes the HTTP requests made by a client. Override any of the methods to be notified of the corresponding
+    events; register the observer with `ZamzarClient(observers=[...])` or `zamzar.pool_manager.observers.append(...)`.
+
+    Observers are notified on the thread that made the request, so must be thread-safe and should return quickly.
+    """
+
+    def on_request_start(self, event: RequestEvent):
+        """Called before a request is sent."""
+        pass
+
+    def on_retry(self, event: RequestEvent, retry: RequestHistory):
+        """Called for each retry performed by urllib3 (once the final response has been received)."""
+        pass
+
+    def on_response(self, event: RequestEvent):
+        """Called once the headers of the final response have been received."""
+        pass
+
+    def on_error(self, event: RequestEvent, error: Exception):
+        """Called if a request fails without a response (e.g., once retries have been exhausted)."""
+        pass
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class RouteStatistics:
+    """Aggregated statistics for the requests made to one route with one method."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.total_duration = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.statuses: Counter[int] = Counter()
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Returns an upper bound on the given percentile (0-100) of the request durations, i.e., the upper bound of the
+        histogram bucket in which it falls (or infinity, if it falls beyond the last bucket).
+        """
+        observed = sum(self.counts)
+        if not observed:
+            return None
+        rank = q / 100 * observed
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return float("inf")
+
+    def copy(self) -> RouteStatistics:
+        return copy.deepcopy(self)
+
+
+class HistogramCollector(RequestObserver):
+    """
+    Collects an in-memory histogram of request durations -- plus counts of bytes, retries and statuses -- per route.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        :param buckets: the (ascending) upper bounds, in seconds, of the buckets of the histogram of request durations
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.__lock = threading.Lock()
+        self.__statistics: Dict[Tuple[str, str], RouteStatistics] = {}
+
+    def on_response(self, event: RequestEvent):
+        self.__record(event, error=False)
+
+    def on_error(self, event: RequestEvent, error: Exception):
+        self.__record(event, error=True)
+
+    def snapshot(self) -> Dict[Tuple[str, str], RouteStatistics]:
+        """Returns a copy of the statistics collected so far, keyed by (method, route)."""
+        with self.__lock:
+            return {key: statistics.copy() for key, statistics in self.__statistics.items()}
+
+    def reset(self):
+        """Discards the statistics collected so far."""
+        with self.__lock:
+            self.__statistics.clear()
+
+    def __record(self, event: RequestEvent, error: bool):
+        with self.__lock:
+            statistics = self.__statistics.get((event.method, event.route))
+            if statistics is None:
+                statistics = self.__statistics[(event.method, event.route)] = RouteStatistics(self.buckets)
+
+            statistics.requests += 1
+            statistics.retries += event.retries
+            statistics.bytes_sent += event.bytes_sent or 0
+            statistics.bytes_received += event.bytes_received or 0
+            if error:
+                statistics.errors += 1
+            if event.status is not None:
+                statistics.statuses[event.status] += 1
+            if event.duration is not None:
+                statistics.total_duration += event.duration
+                statistics.counts[bisect.bisect_left(self.buckets, event.duration)] += 1
+
+    def __str__(self) -> str:
+        lines: List[str] = []
+        for (method, route), statistics in sorted(self.snapshot().items()):
+            lines.append(
+                f"{method} {route}: {statistics.requests} requests, {statistics.errors} errors, "
+                f"{statistics.retries} retries, p50<={statistics.percentile(50)}s, p99<={statistics.percentile(99)}s"
+            )
+        return "\n".join(lines)
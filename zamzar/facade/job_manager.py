@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import zipfile
+from datetime import timedelta
 from pathlib import Path
 from typing import Optional, Union
 
+from zamzar.exceptions import NotFoundException
 from zamzar.models import Failure
 from zamzar.models import File
 from zamzar.models import Job
-from ._internal import Awaitable
+from ._internal import Awaitable, requested_delay
 from .job_status import JobStatus
 from .. import ApiException
 
@@ -30,12 +32,17 @@ class JobManager(Awaitable):
         self._zamzar = zamzar
         self.model = model
         self.id = model.id
+        self.__requested_delay: Optional[timedelta] = None
         self.target_files = model.target_files
 
     def delete_all_files(self) -> JobManager:
-        """Immediately deletes the source file and all target files from the Zamzar API servers."""
-        self.delete_source_file()
-        self.delete_target_files()
+        """
+        Immediately deletes the source file and all target files from the Zamzar API servers, concurrently.
+
+        :raises NotFoundException: if any of the files had already been deleted (once every file has been processed)
+        """
+        file_ids = ([self.source_file_id] if self.source_file_id else []) + self.target_file_ids
+        self.__delete_many(file_ids)
         return self
 
     def delete_source_file(self) -> JobManager:
@@ -45,9 +52,12 @@ class JobManager(Awaitable):
         return self
 
     def delete_target_files(self) -> JobManager:
-        """Immediately deletes all target files from the Zamzar API servers."""
-        for target_file_id in self.target_file_ids:
-            self._zamzar.files.delete(target_file_id)
+        """
+        Immediately deletes all target files from the Zamzar API servers, concurrently.
+
+        :raises NotFoundException: if any of the files had already been deleted (once every file has been processed)
+        """
+        self.__delete_many(self.target_file_ids)
         return self
 
     def has_completed(self) -> bool:
@@ -65,23 +75,32 @@ class JobManager(Awaitable):
 
     def refresh(self) -> JobManager:
         """Performs an API request to determine the current state of the job."""
-        return self._zamzar.jobs.find(self.id)
+        refreshed = self._zamzar.jobs.find(self.id)
+        refreshed.__requested_delay = requested_delay(self._zamzar)
+        return refreshed
 
     @property
     def source_file_id(self) -> Optional[int]:
         """Returns the ID of the source file being converted."""
         return self.model.source_file.id if self.model.source_file else None
 
-    def store(self, target: Union[str, Path], extract_multiple_file_output: bool = True) -> JobManager:
+    def store(
+            self,
+            target: Union[str, Path],
+            extract_multiple_file_output: bool = True,
+            ranges: int = 1
+    ) -> JobManager:
         """
         Downloads all the target files produced by the conversion to the specified destination, blocking until the
         download is complete.
 
         If extract_multiple_file_output is False and there are multiple target files, the ZIP file will not be extracted.
+
+        :param ranges: the number of byte ranges to download concurrently (see `FilesService.download`)
         """
         source = self.__primary_target_file()
         target = Path(target)
-        destination = self._zamzar.files._download_model(source, target)
+        destination = self._zamzar.files._download_model(source, target, ranges)
         if len(self.target_file_ids) > 1 and extract_multiple_file_output:
             JobManager.__extract(destination)
         return self
@@ -91,6 +110,14 @@ class JobManager(Awaitable):
         """Returns the IDs of the target files produced by the job."""
         return [target_file.id for target_file in self.model.target_files] if self.model.target_files else []
 
+    def __delete_many(self, file_ids: list[int]):
+        # A job rarely has more than a couple of files, which are deleted inline rather than by a pool of workers
+        max_in_flight = 1 if len(file_ids) <= 2 else 8
+        report = self._zamzar.files.delete_many(file_ids, max_in_flight=max_in_flight).raise_for_failures()
+        # Unlike delete_many, report files that had already been deleted (as deleting them one by one always has)
+        if report.missing:
+            raise NotFoundException(status=404, reason=f"File {report.missing[0]} was not found")
+
     def __primary_target_file(self) -> File:
         if not self.target_files:
             raise ApiException("No target files to download")
@@ -121,5 +148,8 @@ class JobManager(Awaitable):
         # Return true if and only if all exports have completed
         return all(export.status in self.__TERMINAL_EXPORT_STATUSES for export in self.model.exports)
 
+    def _requested_delay(self) -> Optional[timedelta]:
+        return self.__requested_delay
+
     def to_str(self) -> str:
         return f"JobManager(id={self.id})"
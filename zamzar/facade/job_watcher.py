@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from collections import deque
+from concurrent.futures import Future
+from datetime import timedelta
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+from zamzar.pagination import after
+from ._internal.awaitable import as_backoff, next_wait, requested_delay
+from .backoff import Backoff
+from .import_manager import ImportManager
+from .job_manager import JobManager
+from .. import ApiException
+
+Watchable = Union[JobManager, ImportManager]
+
+
+class JobWatcher:
+    """
+    Waits for the completion of many jobs and/or import requests using a single polling loop.
+
+    Rather than each job polling independently (see `await_completion`), the watcher keeps every watched job in a
+    priority queue ordered by the time at which it is next due to be refreshed, and refreshes every job that is due
+    at once. When several jobs are due together, their state is retrieved from pages of `jobs.list()` (or
+    `imports.list()`) -- so that many recent jobs are refreshed with a single request -- falling back to refreshing
+    individual jobs that do not appear in the list. A job is never refreshed sooner than the server asked (via the
+    Retry-After header of the response from which it was last refreshed).
+
+    Example usage:
+
+            ```python
+            zamzar = ZamzarClient("YOUR_API_KEY_GOES_HERE")
+
+            watcher = JobWatcher(zamzar)
+            for source in sources:
+                watcher.watch(zamzar.jobs.create(source, "pdf"), lambda job: job.store("/tmp/"))
+            watcher.run()
+            ```
+    """
+
+    __PAGE_SIZE = 50
+
+    def __init__(
+            self,
+            zamzar,
+            timeout: timedelta = timedelta(minutes=20),
+            backoff: Optional[Union[Backoff, List[timedelta]]] = None,
+            batch_refresh: bool = True
+    ):
+        """
+        :param zamzar: the client with which to refresh the watched jobs
+        :param timeout: the maximum time to wait for each job (default: 20 minutes)
+        :param backoff: the strategy for choosing the time between refreshes of each job (see `zamzar.facade.backoff`),
+        or a list of times (default: exponential backoff with jitter)
+        :param batch_refresh: whether to refresh jobs that are due at the same time by listing (default: True)
+        """
+        self._zamzar = zamzar
+        self.timeout = timeout
+        self.backoff = as_backoff(backoff)
+        self.batch_refresh = batch_refresh
+        self.__queue: List[Tuple[float, int, _Watched]] = []
+        self.__completed: Deque[Future[Watchable]] = deque()
+        self.__sequence = itertools.count()
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of watched jobs that have not yet completed."""
+        return len(self.__queue)
+
+    def watch(self, watchable: Watchable, callback: Optional[Callable[[Watchable], None]] = None) -> Future[Watchable]:
+        """
+        Watches a job or import request, returning a future that is resolved (while the watcher runs) with the
+        refreshed job once it has completed, or with an exception if it could not be refreshed or timed out.
+
+        :param watchable: the JobManager or ImportManager to watch
+        :param callback: an optional function to call with the refreshed job once it has completed
+        """
+        watched = _Watched(watchable, self.backoff.delays(watchable), time.monotonic() + self.timeout.total_seconds())
+        if callback is not None:
+            def notify(future: Future[Watchable]):
+                if future.exception() is None:
+                    callback(future.result())
+
+            watched.future.add_done_callback(notify)
+
+        if watchable.has_completed():
+            self.__complete(watched)
+        else:
+            self.__schedule(watched)
+        return watched.future
+
+    def as_completed(self) -> Iterator[Future[Watchable]]:
+        """Polls the watched jobs, yielding the future of each job as it completes, until no jobs remain."""
+        while self.__completed or self.__queue:
+            while self.__completed:
+                yield self.__completed.popleft()
+            if self.__queue:
+                self.poll()
+
+    def run(self):
+        """Polls the watched jobs, blocking until every job has completed."""
+        for _ in self.as_completed():
+            pass
+
+    def poll(self):
+        """Waits until the next job(s) are due, and refreshes them (and any others that are due at the same time)."""
+        if not self.__queue:
+            return
+
+        wait = self.__queue[0][0] - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+        due: List[_Watched] = []
+        while self.__queue and self.__queue[0][0] <= time.monotonic():
+            due.append(heapq.heappop(self.__queue)[2])
+
+        self.__refresh(due)
+        for watched in due:
+            if watched.future.done():
+                self.__completed.append(watched.future)
+            elif watched.watchable.has_completed():
+                self.__complete(watched)
+            elif time.monotonic() >= watched.deadline:
+                watched.future.set_exception(ApiException("Timed out waiting for completion"))
+                self.__completed.append(watched.future)
+            else:
+                self.__schedule(watched)
+
+    def __complete(self, watched: _Watched):
+        watched.future.set_result(watched.watchable)
+        self.__completed.append(watched.future)
+
+    def __schedule(self, watched: _Watched):
+        # Never schedule a refresh beyond the deadline, so the last refresh happens at it
+        delay = next_wait(watched.delays, watched.requested)
+        due = min(time.monotonic() + delay.total_seconds(), watched.deadline)
+        heapq.heappush(self.__queue, (due, next(self.__sequence), watched))
+
+    def __refresh(self, due: List[_Watched]):
+        jobs = [watched for watched in due if isinstance(watched.watchable, JobManager)]
+        imports = [watched for watched in due if isinstance(watched.watchable, ImportManager)]
+        remaining = self.__refresh_from_list(self._zamzar.jobs, jobs) + \
+            self.__refresh_from_list(self._zamzar.imports, imports)
+
+        for watched in remaining:
+            try:
+                watched.watchable = watched.watchable.refresh()
+                watched.requested = watched.watchable._requested_delay()
+            except Exception as e:
+                watched.future.set_exception(e)
+
+    def __refresh_from_list(self, service, due: List[_Watched]) -> List[_Watched]:
+        if not self.batch_refresh or len(due) < 2:
+            return due
+
+        # Lists are ordered by descending ID, so page backwards from the most recent due job
+        by_id: Dict[int, _Watched] = {watched.watchable.id: watched for watched in due}
+        anchor = after(max(by_id) + 1)
+        requests = 0
+        try:
+            # Stop paging once the pages have cost more requests than refreshing the jobs they found individually would
+            while by_id and requests < len(due) - len(by_id) + 1:
+                page = service.list(anchor=anchor, limit=self.__PAGE_SIZE)
+                requested = requested_delay(self._zamzar)
+                requests += 1
+                for item in page.items:
+                    if item.id in by_id:
+                        watched = by_id.pop(item.id)
+                        watched.watchable = item
+                        watched.requested = requested
+                if not page.items or min(item.id for item in page.items) <= min(by_id, default=0):
+                    break
+                anchor = after(min(item.id for item in page.items))
+        except ApiException:
+            pass
+        return list(by_id.values())
+
+
+class _Watched:
+    def __init__(self, watchable: Watchable, delays: Iterator[timedelta], deadline: float):
+        self.watchable = watchable
+        self.delays = delays
+        self.deadline = deadline
+        self.requested: Optional[timedelta] = None
+        self.future: Future[Watchable] = Future()
@@ -1,11 +1,13 @@
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Union, Optional, Any, Dict
+from typing import Union, Optional, Any, Dict, Callable, ContextManager, Iterator
 from urllib.parse import urlparse
 
 from zamzar.api import JobsApi
 from zamzar.facade.job_manager import JobManager
 from zamzar.models import Job
 from zamzar.pagination import Paged, Anchor
+from ._internal import MAX_PAGE_SIZE, iterate_all
 from .successful_jobs_service import SuccessfulJobsService
 from .. import ApiException
 from ..api_client import ApiClient
@@ -31,7 +33,7 @@ class JobsService:
         raise ApiException(f"Could not infer filename from URL ({source}). Provide an extension to disambiguate.")
 
     @staticmethod
-    def __is_url(string: str) -> bool:
+    def _is_url(string: str) -> bool:
         result = urlparse(string)
         return all([result.scheme, result.netloc])
 
@@ -50,7 +52,8 @@ class JobsService:
             target_format: str,
             source_format: Optional[str] = None,
             export_url: Optional[str] = None,
-            options: Optional[Dict[str, Any]] = None
+            options: Optional[Dict[str, Any]] = None,
+            validate: bool = False
     ) -> JobManager:
         """
         Starts a job to convert a local file, returning once the job has been created. Call `await_completion` on the
@@ -61,20 +64,40 @@ class JobsService:
         :param source_format: the format of the file to convert (defaults to the extension of the source)
         :param export_url: an optional URL to which to export the converted file
         :param options: optional parameters to customize the conversion
+        :param validate: whether to check that the conversion is supported (per the client's formats catalogue) before
+        uploading or importing the source and submitting the job (default: False)
         """
-        job = self._api.submit_job(
-            source_file=self.__prepare_source(source, source_format),
-            target_format=target_format,
-            source_format=source_format,
-            export_url=export_url,
-            options=options,
-        )
+        # Reserve the credits before uploading (or importing) the source, so that a rejected job leaves no orphaned file
+        with self._admit(source, source_format, target_format, validate):
+            source_file_id = self.__prepare_source(source, source_format)
+            job = self._api.submit_job(
+                source_file=source_file_id,
+                target_format=target_format,
+                source_format=source_format,
+                export_url=export_url,
+                options=options,
+            )
         return JobManager(self._zamzar, job)
 
     def find(self, job_id: int) -> JobManager:
         """Retrieves a job by its ID."""
         return self.__to_job(self._api.get_job_by_id(job_id))
 
+    def iter_all(
+            self,
+            limit: int = MAX_PAGE_SIZE,
+            prefetch: bool = False,
+            until: Optional[Callable[[JobManager], bool]] = None
+    ) -> Iterator[JobManager]:
+        """
+        Lazily iterates over every job (most recent first), retrieving one page at a time.
+
+        :param limit: indicates the number of jobs to retrieve per page (default: the maximum)
+        :param prefetch: whether to retrieve the next page in the background while the current page is consumed
+        :param until: an optional predicate; iteration stops at the first job for which it returns True
+        """
+        return iterate_all(self, limit, prefetch, until)
+
     def list(self, anchor: Optional[Anchor] = None, limit: Optional[int] = None) -> Paged[JobManager]:
         """
         Retrieves a list of jobs.
@@ -91,10 +114,36 @@ class JobsService:
     def __to_job(self, model: Job) -> JobManager:
         return JobManager(self._zamzar, model)
 
+    def _admit(self, source, source_format: Optional[str], target_format: str, validate: bool) -> ContextManager[Any]:
+        # Validates the job (if requested) and reserves its credits (if governed), resolving the source format (which,
+        # for the ID of a file, takes a request) only once for both
+        governor = self._zamzar.governor
+        if not validate and governor is None:
+            return nullcontext()
+        resolved = self._source_format_of(source, source_format)
+        if validate:
+            self.__validate(source, resolved, target_format)
+        return governor.admit(resolved, target_format) if governor is not None else nullcontext()
+
+    def __validate(self, source, resolved: Optional[str], target_format: str):
+        if resolved is None:
+            raise ApiException(f"Could not determine the format of {source}. Provide a source format to validate.")
+        if not self._zamzar.catalogue.can_convert(resolved, target_format):
+            raise ApiException(f"Converting from {resolved} to {target_format} is not supported")
+
+    def _source_format_of(self, source, source_format: Optional[str]) -> Optional[str]:
+        if source_format:
+            return source_format
+        if isinstance(source, int):
+            return self._zamzar.files.find(source).model.format
+        is_url = isinstance(source, str) and JobsService._is_url(source)
+        name = JobsService._infer_filename(source, "") if is_url else Path(source).name
+        return Path(name).suffix[1:].lower() or None
+
     def __prepare_source(self, source, source_format) -> int:
         if isinstance(source, int):
             source_file_id = source
-        elif isinstance(source, str) and self.__is_url(source):
+        elif isinstance(source, str) and JobsService._is_url(source):
             filename = JobsService._infer_filename(source, source_format)
             source_file_id = self._zamzar.imports.start(source, filename).await_completion().imported_file.id
         elif Path(source).exists():
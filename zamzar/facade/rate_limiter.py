@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from enum import Enum
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from urllib3 import BaseHTTPResponse, Retry
+from urllib3.exceptions import InvalidHeader
+
+
+class TokenBucket:
+    """
+    Limits the rate of requests to `rate` per second, allowing bursts of up to `burst` requests.
+
+    The rate adapts to the server: a rate-limited response halves the rate (down to `min_rate`) and pauses the bucket
+    for any Retry-After period, after which each successful response restores a fraction of the rate. The rate is
+    halved at most once per interval between requests at the current rate, so that a burst of concurrent rate-limited
+    responses (to requests that were all made at the old rate) only counts once.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            burst: int = 1,
+            min_rate: Optional[float] = None,
+            decrease: float = 0.5,
+            increase: float = 0.05
+    ):
+        """
+        :param rate: the maximum number of requests per second
+        :param burst: the maximum number of requests that can be made at once, after a period of inactivity
+        :param min_rate: the rate below which the bucket never adapts (default: a tenth of the rate)
+        :param decrease: the factor by which the rate is multiplied when a request is rate limited (default: 0.5)
+        :param increase: the fraction of the maximum rate restored by each successful request (default: 0.05)
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.decrease = decrease
+        self.increase = increase
+        self.__current_rate = rate
+        self.__tokens = float(burst)
+        self.__updated = time.monotonic()
+        self.__paused_until = 0.0
+        self.__decreased_at: Optional[float] = None
+        self.__lock = threading.Lock()
+
+    @property
+    def current_rate(self) -> float:
+        """Returns the rate currently permitted, which is lower than the maximum rate after being rate limited."""
+        return self.__current_rate
+
+    def acquire(self):
+        """Takes a token from the bucket, blocking until one is available."""
+        with self.__lock:
+            now = self.__refill()
+            # Take the token now, even if that leaves the bucket in debt, so that waiting callers are served in order
+            self.__tokens -= 1
+            wait = max(-self.__tokens / self.__current_rate, self.__paused_until - now, 0.0)
+        if wait > 0:
+            time.sleep(wait)
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """Reduces the rate after a request was rate limited, pausing for the Retry-After period (if any)."""
+        with self.__lock:
+            now = self.__refill()
+            if self.__decreased_at is None or now - self.__decreased_at >= 1 / self.__current_rate:
+                self.__current_rate = max(self.min_rate, self.__current_rate * self.decrease)
+                self.__decreased_at = now
+            self.__tokens = min(self.__tokens, 0.0)
+            if retry_after:
+                self.__paused_until = max(self.__paused_until, now + retry_after)
+
+    def reward(self):
+        """Restores some of the rate after a request succeeded without being rate limited."""
+        if self.__current_rate < self.rate:
+            with self.__lock:
+                self.__current_rate = min(self.rate, self.__current_rate + self.rate * self.increase)
+
+    def __refill(self) -> float:
+        now = time.monotonic()
+        elapsed = now - max(self.__updated, min(self.__paused_until, now))
+        if elapsed > 0:
+            self.__tokens = min(float(self.burst), self.__tokens + elapsed * self.__current_rate)
+        self.__updated = now
+        return now
+
+
+class RequestCategory(Enum):
+    """
+    The categories of request that are rate limited separately.
+
+    POLLING: requests that retrieve information (e.g., refreshing the status of a job).
+    SUBMISSION: requests that start or change something (e.g., submitting a job, starting an import, deleting a file).
+    TRANSFER: requests that upload or download the content of a file.
+    """
+    POLLING = "polling"
+    SUBMISSION = "submission"
+    TRANSFER = "transfer"
+
+
+class RateLimiter:
+    """
+    Proactively limits the rate of requests made by a client, with a separate TokenBucket per category of request (a
+    category without a bucket is not limited). Pass to `ZamzarClient(rate_limiter=...)`.
+
+    Example usage:
+
+            ```python
+            limiter = RateLimiter(
+                polling=TokenBucket(rate=5, burst=10),
+                submission=TokenBucket(rate=2, burst=5),
+                transfer=TokenBucket(rate=2, burst=2),
+            )
+            zamzar = ZamzarClient("YOUR_API_KEY_GOES_HERE", rate_limiter=limiter)
+            ```
+    """
+
+    @staticmethod
+    def categorize(method: str, url: str) -> RequestCategory:
+        path = urlparse(url).path
+        if re.search(r"/files/\d+/content$", path) or (method == "POST" and re.search(r"/files$", path)):
+            return RequestCategory.TRANSFER
+        if method in ("GET", "HEAD", "OPTIONS"):
+            return RequestCategory.POLLING
+        return RequestCategory.SUBMISSION
+
+    def __init__(
+            self,
+            polling: Optional[TokenBucket] = None,
+            submission: Optional[TokenBucket] = None,
+            transfer: Optional[TokenBucket] = None
+    ):
+        self.buckets: Dict[RequestCategory, Optional[TokenBucket]] = {
+            RequestCategory.POLLING: polling,
+            RequestCategory.SUBMISSION: submission,
+            RequestCategory.TRANSFER: transfer,
+        }
+
+    def acquire(self, method: str, url: str):
+        """Blocks until the request is permitted by the bucket for its category."""
+        bucket = self.buckets[RateLimiter.categorize(method, url)]
+        if bucket is not None:
+            bucket.acquire()
+
+    def observe(self, method: str, url: str, response: BaseHTTPResponse):
+        """Adapts the bucket for the category of the request to the (final) response, and any retries before it."""
+        bucket = self.buckets[RateLimiter.categorize(method, url)]
+        if bucket is None:
+            return
+
+        # Only 429s (and 503s that ask for a pause) are rate limiting; a Retry-After on any other response (e.g., on a
+        # successful refresh of a job) is a hint of when to poll again, which the caller already respects
+        history = response.retries.history if response.retries else ()
+        retry_after = RateLimiter.__retry_after(response)
+        limited = response.status == 429 or any(retry.status == 429 for retry in history)
+        if limited or (response.status == 503 and retry_after):
+            bucket.penalize(retry_after)
+        else:
+            bucket.reward()
+
+    @staticmethod
+    def __retry_after(response: BaseHTTPResponse) -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return Retry.DEFAULT.parse_retry_after(value)
+        except InvalidHeader:
+            return None
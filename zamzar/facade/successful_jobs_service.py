@@ -1,10 +1,11 @@
-from typing import Optional
+from typing import Optional, Callable, Iterator
 
 from zamzar.api import JobsApi
 from zamzar.api_client import ApiClient
 from zamzar.facade.job_manager import JobManager
 from zamzar.models import Job
 from zamzar.pagination import Paged, Anchor
+from ._internal import MAX_PAGE_SIZE, iterate_all
 
 
 class SuccessfulJobsService:
@@ -14,6 +15,21 @@ class SuccessfulJobsService:
         self._zamzar = zamzar
         self._api = JobsApi(client)
 
+    def iter_all(
+            self,
+            limit: int = MAX_PAGE_SIZE,
+            prefetch: bool = False,
+            until: Optional[Callable[[JobManager], bool]] = None
+    ) -> Iterator[JobManager]:
+        """
+        Lazily iterates over every successful job (most recent first), retrieving one page at a time.
+
+        :param limit: indicates the number of successful jobs to retrieve per page (default: the maximum)
+        :param prefetch: whether to retrieve the next page in the background while the current page is consumed
+        :param until: an optional predicate; iteration stops at the first successful job for which it returns True
+        """
+        return iterate_all(self, limit, prefetch, until)
+
     def list(self, anchor: Optional[Anchor] = None, limit: Optional[int] = None) -> Paged[JobManager]:
         """
         Retrieves a list of successful jobs.
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import io
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+from urllib.parse import urlencode, urljoin
+
+import urllib3
+from urllib3 import BaseHTTPResponse, HTTPHeaderDict, HTTPResponse, Retry, Timeout
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, ProtocolError, ReadTimeoutError
+from urllib3.filepost import encode_multipart_formdata
+from urllib3.util import parse_url
+
+DEFAULT_BODY_CHUNK_SIZE = 64 * 1024
+
+
+class Transport(ABC):
+    """
+    Sends the HTTP requests made by a ZamzarClient (see the transport parameter of ZamzarClient).
+
+    The default transport is the urllib3.PoolManager built by the generated API client, which is registered as a
+    (virtual) subclass of Transport. Alternative transports (e.g., one that multiplexes many requests over a single
+    HTTP/2 connection) need only implement `send`, which makes a single attempt at a request; this class encodes form
+    fields in the same way as urllib3, and applies the client's urllib3.Retry policy around `send`, including following
+    redirects (e.g., to the content of a file) as urllib3.PoolManager does.
+    """
+
+    __METHODS_WITHOUT_BODY = {"DELETE", "GET", "HEAD", "OPTIONS"}
+
+    def request(
+            self,
+            method: str,
+            url: str,
+            body: Any = None,
+            fields: Optional[Any] = None,
+            headers: Optional[Dict[str, str]] = None,
+            encode_multipart: bool = True,
+            timeout: Optional[Union[Timeout, float]] = None,
+            retries: Optional[Union[Retry, bool, int]] = None,
+            preload_content: bool = True,
+            redirect: bool = True,
+            **kwargs
+    ) -> BaseHTTPResponse:
+        """Makes a request (with the same signature as urllib3.PoolManager.request), retrying it per its policy."""
+        headers = dict(headers or {})
+        if fields:
+            if method.upper() in Transport.__METHODS_WITHOUT_BODY:
+                url = f"{url}{'&' if '?' in url else '?'}{urlencode(fields)}"
+            elif encode_multipart:
+                body, headers["Content-Type"] = encode_multipart_formdata(fields)
+            else:
+                body = urlencode(fields)
+                headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        if not isinstance(timeout, Timeout):
+            timeout = Timeout(total=timeout) if isinstance(timeout, (int, float)) else Timeout()
+        retries = Retry.from_int(retries, redirect=redirect)
+        body_start = body.tell() if hasattr(body, "tell") and hasattr(body, "seek") else None
+        while True:
+            if body_start is not None:
+                body.seek(body_start)
+            try:
+                response = self.send(method, url, body, headers, timeout, preload_content)
+            except (ProtocolError, ConnectTimeoutError, ReadTimeoutError) as e:
+                retries = retries.increment(method, url, error=e)
+                retries.sleep()
+                continue
+
+            location = response.get_redirect_location() if redirect else None
+            if location:
+                try:
+                    retries = retries.increment(method, url, response=response)
+                except MaxRetryError:
+                    if retries.raise_on_redirect:
+                        response.drain_conn()
+                        raise
+                    response.retries = retries
+                    return response
+                response.drain_conn()
+                retries.sleep_for_retry(response)
+
+                location = urljoin(url, location)
+                if response.status == 303:
+                    # See Other: fetch the new location with a GET (and so without the body)
+                    method, body, body_start = "GET", None, None
+                    headers = {k: v for k, v in headers.items() if k.lower() not in ("content-type", "content-length")}
+                if Transport.__origin(location) != Transport.__origin(url):
+                    # Never send credentials (e.g., the API key) to another host
+                    headers = {k: v for k, v in headers.items() if k.lower() not in retries.remove_headers_on_redirect}
+                url = location
+                continue
+
+            has_retry_after = bool(response.headers.get("Retry-After"))
+            if not retries.is_retry(method, response.status, has_retry_after):
+                response.retries = retries
+                return response
+
+            try:
+                retries = retries.increment(method, url, response=response)
+            except MaxRetryError:
+                if retries.raise_on_status:
+                    response.drain_conn()
+                    raise
+                response.retries = retries
+                return response
+            response.drain_conn()
+            retries.sleep(response)
+
+    @abstractmethod
+    def send(
+            self,
+            method: str,
+            url: str,
+            body: Optional[Any],
+            headers: Dict[str, str],
+            timeout: Timeout,
+            preload_content: bool
+    ) -> BaseHTTPResponse:
+        """
+        Makes a single attempt at a request, returning the response (with its content unread, unless preload_content).
+
+        Should raise urllib3.exceptions.ProtocolError, ConnectTimeoutError or ReadTimeoutError when a request is
+        interrupted or times out, so that the request is retried per the client's retry policy.
+        """
+
+    def clear(self):
+        """Closes any connections held open by the transport."""
+
+    @staticmethod
+    def __origin(url: str) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+        parsed = parse_url(url)
+        return parsed.scheme, parsed.host, parsed.port
+
+
+Transport.register(urllib3.PoolManager)
+
+
+class HttpxTransport(Transport):
+    """
+    A transport that sends requests with an httpx.Client, which negotiates HTTP/2 (where the server supports it) and
+    multiplexes concurrent requests to the same host over a single connection, rather than holding a connection (and
+    a slot in the connection pool) per request in flight. Suited to polling many jobs concurrently.
+
+    HTTP/2 is negotiated during the TLS handshake (via ALPN), so only with https:// hosts; requests to http:// hosts
+    (e.g., a local mock of the API) are sent with HTTP/1.1.
+
+    Requires the optional httpx dependency, with HTTP/2 support: `pip install zamzar[httpx]`.
+    """
+
+    def __init__(self, http2: bool = True, max_connections: int = 10, client: Optional[Any] = None):
+        """
+        :param http2: whether to negotiate HTTP/2 with (https://) servers that support it (default: True)
+        :param max_connections: the maximum number of connections to hold open
+        :param client: an optional httpx.Client to send requests with (if given, http2 and max_connections are ignored)
+        """
+        try:
+            import httpx  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError("HttpxTransport requires httpx; install it with `pip install zamzar[httpx]`") from e
+
+        self._httpx = httpx
+        self.client = client or httpx.Client(http2=http2, limits=httpx.Limits(max_connections=max_connections))
+
+    def send(
+            self,
+            method: str,
+            url: str,
+            body: Optional[Any],
+            headers: Dict[str, str],
+            timeout: Timeout,
+            preload_content: bool
+    ) -> BaseHTTPResponse:
+        httpx = self._httpx
+        if hasattr(body, "read"):
+            # Stream file-like bodies (e.g., uploads) rather than reading them into memory
+            content: Any = iter(lambda: body.read(DEFAULT_BODY_CHUNK_SIZE), b"")  # type: ignore[union-attr]
+        else:
+            content = body
+        request = self.client.build_request(
+            method,
+            url,
+            content=content,
+            headers=headers,
+            timeout=httpx.Timeout(
+                None,
+                connect=HttpxTransport.__seconds(timeout.connect_timeout),
+                read=HttpxTransport.__seconds(timeout.read_timeout),
+            ),
+        )
+
+        try:
+            # Redirects are followed (per the retry policy) by Transport.request, rather than by httpx
+            response = self.client.send(request, stream=True, follow_redirects=False)
+        except httpx.ConnectTimeout as e:
+            raise ConnectTimeoutError(None, f"Connection to {url} timed out") from e
+        except httpx.ReadTimeout as e:
+            raise ReadTimeoutError(None, url, "Read timed out") from e  # type: ignore[arg-type]
+        except httpx.TransportError as e:
+            raise ProtocolError(f"Request to {url} failed: {e}", e) from e
+
+        return HTTPResponse(
+            body=_HttpxBody(response, httpx),
+            headers=HTTPHeaderDict(response.headers.multi_items()),
+            status=response.status_code,
+            version=20 if response.http_version == "HTTP/2" else 11,
+            version_string=response.http_version,
+            reason=response.reason_phrase,
+            preload_content=preload_content,
+            request_method=method,
+            request_url=url,
+        )
+
+    def clear(self):
+        """Closes the httpx client (and therefore its connections); the transport cannot be used afterwards."""
+        self.client.close()
+
+    @staticmethod
+    def __seconds(value: Any) -> Optional[float]:
+        return float(value) if isinstance(value, (int, float)) else None
+
+
+class _HttpxBody(io.RawIOBase):
+    """Adapts the (undecoded) content of a streamed httpx response to the file-like body expected by urllib3."""
+
+    def __init__(self, response, httpx):
+        self._response = response
+        self._httpx = httpx
+        self._chunks: Iterator[bytes] = response.iter_raw()
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        try:
+            while not self._pending:
+                self._pending = next(self._chunks)
+        except StopIteration:
+            return 0
+        except self._httpx.TransportError as e:
+            raise ProtocolError(f"Response ended prematurely: {e}", e) from e
+
+        length = min(len(buffer), len(self._pending))
+        buffer[:length] = self._pending[:length]
+        self._pending = self._pending[length:]
+        return length
+
+    def close(self):
+        if not self.closed:
+            self._response.close()
+        super().close()
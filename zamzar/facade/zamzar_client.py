@@ -1,17 +1,22 @@
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, BinaryIO, Iterable, Iterator, List
 
 import urllib3
 
-from zamzar.api_client import ApiClient
 from zamzar.configuration import Configuration
-from ._internal import ZamzarPoolManager
+from ._internal import CreditLedger, ZamzarApiClient, ZamzarPoolManager, map_bounded
 from .account_service import AccountService
+from .conversion_result import ConversionResult
+from .credit_governor import CreditGovernor
 from .file_manager import FileManager
 from .files_service import FilesService
+from .formats_catalogue import FormatsCatalogue
 from .formats_service import FormatsService
 from .imports_service import ImportsService
+from .instrumentation import RequestObserver
+from .rate_limiter import RateLimiter
+from .transport import Transport
 from .job_manager import JobManager
 from .jobs_service import JobsService
 from .welcome_service import WelcomeService
@@ -50,9 +55,6 @@ HTTP_CONNECTION_TIMEOUT = 15.0
 HTTP_READ_TIMEOUT = 30.0
 DEFAULT_TIMEOUT_POLICY = urllib3.Timeout(connect=HTTP_CONNECTION_TIMEOUT, read=HTTP_READ_TIMEOUT)
 
-CREDITS_REMAINING_HEADER = "Zamzar-Credits-Remaining";
-TEST_CREDITS_REMAINING_HEADER = "Zamzar-Test-Credits-Remaining";
-
 
 class ZamzarClient:
     """
@@ -84,6 +86,9 @@ class ZamzarClient:
             host: Optional[str] = None,
             retries: urllib3.Retry = DEFAULT_RETRY_POLICY,
             timeout: urllib3.Timeout = DEFAULT_TIMEOUT_POLICY,
+            observers: Optional[List[RequestObserver]] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            transport: Optional[Union[urllib3.PoolManager, Transport]] = None,
     ):
         """
         Create a new instance of the Zamzar client.
@@ -93,13 +98,19 @@ class ZamzarClient:
         :param host: The host to use for making requests. Used when mocking the API.
         :param retries: The retry policy to use for making requests. Defaults to a reasonable exponential backoff.
         :param timeout: The timeout policy to use for making requests. Defaults to 15s connect and 30s read.
+        :param observers: Observers to notify of every HTTP request made (e.g., a HistogramCollector). Defaults to none.
+        :param rate_limiter: A RateLimiter to limit the rate of HTTP requests made. Defaults to none (no limit).
+        :param transport: The transport through which to send requests, such as a urllib3 PoolManager shared between
+        many clients (see ZamzarClientFactory) or an HttpxTransport. Defaults to a urllib3 PoolManager owned by this
+        client.
         """
         host = host or environment.value
         configuration = Configuration(access_token=api_key, host=host)
-        self._client = ApiClient(configuration=configuration)
+        self._client = ZamzarApiClient(configuration=configuration)
 
         # Replace the pool manager with ours (to track the latest request and add timeout/retry configuration)
-        self.pool_manager = ZamzarPoolManager(self.pool_manager, timeout, retries)
+        delegate = transport if transport is not None else self.pool_manager
+        self.pool_manager = ZamzarPoolManager(delegate, timeout, retries, observers, rate_limiter)
 
         self.account = AccountService(self, self._client)
         self.files = FilesService(self, self._client)
@@ -108,6 +119,12 @@ class ZamzarClient:
         self.jobs = JobsService(self, self._client)
         self.welcome = WelcomeService(self, self._client)
 
+        # Caches the formats supported by the Zamzar API (retrieved on first use)
+        self.catalogue = FormatsCatalogue(self)
+
+        # Optionally controls admission of jobs based on the remaining credits (see CreditGovernor)
+        self.governor: Optional[CreditGovernor] = None
+
     @property
     def timeout(self) -> urllib3.Timeout:
         return self.pool_manager.timeout
@@ -124,23 +141,86 @@ class ZamzarClient:
     def retries(self, value: urllib3.Retry):
         self.pool_manager.retries = value
 
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self.pool_manager.rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: Optional[RateLimiter]):
+        self.pool_manager.rate_limiter = value
+
+    @property
+    def fast_deserialization(self) -> bool:
+        """
+        Whether successful responses are validated directly from their raw JSON by pydantic (faster, particularly for
+        large pages of jobs or files), rather than via an intermediate dict. Defaults to False. When enabled, fields
+        that are not in the API specification are not retained in the `additional_properties` of models.
+        """
+        return self._client.fast_deserialization
+
+    @fast_deserialization.setter
+    def fast_deserialization(self, value: bool):
+        self._client.fast_deserialization = value
+
+    @property
+    def lazy_timestamps(self) -> bool:
+        """
+        Whether the models built by the fast deserialization path (see `fast_deserialization`) hold their timestamps
+        (e.g., created_at) as raw strings, parsing each on first access. Defaults to False. Saves parsing timestamps
+        that are never read, such as when listing many jobs or files.
+        """
+        return self._client.lazy_timestamps
+
+    @lazy_timestamps.setter
+    def lazy_timestamps(self, value: bool):
+        self._client.lazy_timestamps = value
+
+    @property
+    def lean_models(self) -> bool:
+        """
+        Whether the endpoints that list jobs, files, imports and formats return (unvalidated) read-only records, with
+        the same attribute names as the models, rather than models. Defaults to False. Records take a fraction of the
+        memory of models, and are faster to build, so suit paging through many thousands of jobs (e.g., with iter_all).
+        """
+        return self._client.lean_models
+
+    @lean_models.setter
+    def lean_models(self, value: bool):
+        self._client.lean_models = value
+
     @property
     def last_production_credits_remaining(self) -> Optional[int]:
         """
-         Returns the remaining production credits for the last request made by the client.
+         Returns the remaining production credits, as reported by the responses to requests made by the client.
          Will return None if no successful request has been made yet.
+
+         When the client is shared between threads, this is the lowest value reported by a recent response (since
+         responses to concurrent requests can arrive out of order). See `production_credits` for a per-thread view.
         """
-        value = self.pool_manager.get_header_from_latest_response(CREDITS_REMAINING_HEADER, None)
-        return int(value) if value is not None else None
+        reading = self.production_credits.latest
+        return reading.credits if reading is not None else None
 
     @property
     def last_sandbox_credits_remaining(self) -> Optional[int]:
         """
-        Returns the remaining sandbox credits for the last request made by the client.
+        Returns the remaining sandbox credits, as reported by the responses to requests made by the client.
         Will return None if no successful request has been made yet.
+
+        When the client is shared between threads, this is the lowest value reported by a recent response (since
+        responses to concurrent requests can arrive out of order). See `sandbox_credits` for a per-thread view.
         """
-        value = self.pool_manager.get_header_from_latest_response(TEST_CREDITS_REMAINING_HEADER, None)
-        return int(value) if value is not None else None
+        reading = self.sandbox_credits.latest
+        return reading.credits if reading is not None else None
+
+    @property
+    def production_credits(self) -> CreditLedger:
+        """Returns the ledger of remaining production credits, with global and per-thread views."""
+        return self.pool_manager.production_credits
+
+    @property
+    def sandbox_credits(self) -> CreditLedger:
+        """Returns the ledger of remaining sandbox credits, with global and per-thread views."""
+        return self.pool_manager.sandbox_credits
 
     @property
     def pool_manager(self):
@@ -179,13 +259,73 @@ class ZamzarClient:
             .create(source, target_format, source_format, export_url, options) \
             .await_completion()
 
-    def download(self, file_id: int, target: Union[str, Path]) -> FileManager:
+    def convert_many(
+            self,
+            sources: Iterable[Union[Path, str, int]],
+            target_format: str,
+            target: Optional[Union[str, Path]] = None,
+            source_format: Optional[str] = None,
+            export_url: Optional[str] = None,
+            options: Optional[Dict[str, Any]] = None,
+            delete_files: bool = False,
+            max_in_flight: int = 8
+    ) -> Iterator[ConversionResult]:
+        """
+        Converts many files to the specified format, yielding a result for each source as its conversion completes.
+
+        Each source is uploaded (or imported), converted, awaited, and then optionally stored and deleted, by a pool of
+        at most max_in_flight workers. Sources are consumed lazily, so the sources can be a generator over a large
+        directory. A failure to convert one source is reported in its result, and does not abort the batch.
+
+        :param sources: the paths, IDs or URLs of the files to convert
+        :param target_format: the format to convert the files to
+        :param target: an optional directory in which to store the converted files
+        :param source_format: the format of the files to convert (defaults to the extension of each source)
+        :param export_url: an optional URL to which to export the converted files
+        :param options: optional parameters to customize the conversions
+        :param delete_files: whether to delete the source and target files from the Zamzar API servers once each
+        conversion has completed (default: False)
+        :param max_in_flight: the maximum number of conversions to run concurrently (default: 8)
+
+        Example usage:
+
+                    ```python
+                    zamzar = ZamzarClient("YOUR_API_GOES_HERE")
+
+                    for result in zamzar.convert_many(Path("in").glob("*.docx"), "pdf", "out", delete_files=True):
+                        if not result.succeeded:
+                            print(f"Could not convert {result.source}: {result.error or result.job.failure}")
+                    ```
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        def convert(source: Union[Path, str, int]) -> ConversionResult:
+            result = ConversionResult(source)
+            try:
+                # Create and await the job separately, so that its files are deleted even if awaiting it fails
+                job = result.job = self.jobs.create(source, target_format, source_format, export_url, options)
+                job = result.job = job.await_completion()
+                if target is not None and job.has_succeeded():
+                    job.store(target)
+            except Exception as e:
+                result.error = e
+            try:
+                if delete_files and result.job is not None:
+                    result.job.delete_all_files()
+            except Exception as e:
+                result.error = result.error or e
+            return result
+
+        return map_bounded(convert, sources, max_in_flight)
+
+    def download(self, file_id: int, target: Union[str, Path], ranges: int = 1) -> FileManager:
         """
         Downloads a file from Zamzar's API servers to the given destination, blocking until the download is complete.
 
-        :param source: the path to the file to upload
-        :param name: the name to give the file on the Zamzar API servers (defaults to the name of the file at the
-        source path)
+        :param file_id: the ID of the file to download
+        :param target: the path (or directory) to which to download the file
+        :param ranges: the number of byte ranges to download concurrently (see `FilesService.download`)
 
         Example usage:
 
@@ -195,7 +335,7 @@ class ZamzarClient:
                 zamzar.download(1234, "path/to/destination.jpg")
                 ```
         """
-        return self.files.download(file_id, Path(target))
+        return self.files.download(file_id, Path(target), ranges)
 
     def get_production_credits_remaining(self) -> int:
         """Makes a request to the API to retrieve the remaining production credits for the client's API key."""
@@ -209,11 +349,11 @@ class ZamzarClient:
         """Checks whether the client can connect to the Zamzar API; useful for testing your API key."""
         return self.welcome.get()
 
-    def upload(self, source: Union[str, Path], name: Optional[str] = None) -> FileManager:
+    def upload(self, source: Union[str, Path, BinaryIO], name: Optional[str] = None) -> FileManager:
         """
         Uploads a local file to Zamzar's API servers with the given name, blocking until the upload is complete.
 
-        :param source: the path to the file to upload
+        :param source: the path to the file to upload, or a binary file-like object from which to read the file
         :param name: the name to give the file on the Zamzar API servers (defaults to the name of the file at the
         source path)
 
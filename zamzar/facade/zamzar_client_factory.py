@@ -0,0 +1,111 @@
+import socket
+from typing import Any, List, Optional, Tuple
+
+import urllib3
+from urllib3.connection import HTTPConnection
+
+from zamzar.configuration import Configuration
+from zamzar.rest import RESTClientObject
+from .instrumentation import RequestObserver
+from .rate_limiter import RateLimiter
+from .zamzar_client import Environment, ZamzarClient, DEFAULT_RETRY_POLICY, DEFAULT_TIMEOUT_POLICY
+
+KEEP_ALIVE_IDLE_SECONDS = 60
+KEEP_ALIVE_INTERVAL_SECONDS = 15
+KEEP_ALIVE_PROBES = 4
+
+
+class ZamzarClientFactory:
+    """
+    Creates ZamzarClient instances (e.g., one per API key in a multi-tenant service) that share a single, tuned
+    connection pool, so that the number of sockets held open does not grow with the number of clients.
+
+    Each client still has its own API key, credit ledgers, observers and rate limiter; only the connections are shared.
+
+    Example usage:
+
+        ```python
+        from zamzar.facade import ZamzarClientFactory
+
+        factory = ZamzarClientFactory(maxsize=32, block=True)
+
+        alice = factory.create("ALICE_API_KEY")
+        bob = factory.create("BOB_API_KEY")
+        ```
+    """
+
+    @staticmethod
+    def __keep_alive_socket_options() -> List[Tuple[int, int, Any]]:
+        options = list(HTTPConnection.default_socket_options) + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        # Not every platform allows TCP keep-alive probes to be tuned
+        for name, value in [
+            ("TCP_KEEPIDLE", KEEP_ALIVE_IDLE_SECONDS),
+            ("TCP_KEEPINTVL", KEEP_ALIVE_INTERVAL_SECONDS),
+            ("TCP_KEEPCNT", KEEP_ALIVE_PROBES),
+        ]:
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        return options
+
+    def __init__(
+            self,
+            environment: Environment = Environment.PRODUCTION,
+            host: Optional[str] = None,
+            maxsize: Optional[int] = None,
+            block: bool = False,
+            keep_alive: bool = True,
+            retries: urllib3.Retry = DEFAULT_RETRY_POLICY,
+            timeout: urllib3.Timeout = DEFAULT_TIMEOUT_POLICY,
+    ):
+        """
+        Create a new factory, and the connection pool shared by the clients that it creates.
+
+        :param environment: The environment to use for making requests. Defaults to PRODUCTION.
+        :param host: The host to use for making requests. Used when mocking the API.
+        :param maxsize: The maximum number of connections to keep open to each host. Defaults to cpu_count * 5.
+        :param block: Whether to wait for a free connection (rather than opening, and then discarding, an extra
+        connection) when all maxsize connections are in use. Defaults to False.
+        :param keep_alive: Whether to enable TCP keep-alive probes on every connection, so that idle connections
+        are not silently dropped by intermediaries. Defaults to True.
+        :param retries: The retry policy of the clients created. Defaults to a reasonable exponential backoff.
+        :param timeout: The timeout policy of the clients created. Defaults to 15s connect and 30s read.
+        """
+        self.host = host or environment.value
+        self.retries = retries
+        self.timeout = timeout
+
+        # Build the pool exactly as the generated client would (for SSL and proxy settings), with our tuning applied
+        configuration = Configuration(host=self.host)
+        if maxsize is not None:
+            configuration.connection_pool_maxsize = maxsize
+        if keep_alive:
+            configuration.socket_options = ZamzarClientFactory.__keep_alive_socket_options()
+        self.pool: urllib3.PoolManager = RESTClientObject(configuration).pool_manager
+        self.pool.connection_pool_kw["block"] = block
+
+    def create(
+            self,
+            api_key: str,
+            observers: Optional[List[RequestObserver]] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+    ) -> ZamzarClient:
+        """
+        Create a new client which uses the given API key and sends its requests through the shared connection pool.
+
+        :param api_key: The API key to use for authenticating requests.
+        :param observers: Observers to notify of every HTTP request made by the client. Defaults to none.
+        :param rate_limiter: A RateLimiter to limit the rate of HTTP requests made by the client. Defaults to none.
+        """
+        return ZamzarClient(
+            api_key,
+            host=self.host,
+            retries=self.retries,
+            timeout=self.timeout,
+            observers=observers,
+            rate_limiter=rate_limiter,
+            transport=self.pool,
+        )
+
+    def clear(self):
+        """Closes every connection in the shared pool (connections are reopened on demand)."""
+        self.pool.clear()
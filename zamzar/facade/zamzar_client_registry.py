@@ -0,0 +1,120 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from .formats_catalogue import FormatsCatalogue
+from .instrumentation import RequestObserver
+from .rate_limiter import RateLimiter
+from .zamzar_client import ZamzarClient
+from .zamzar_client_factory import ZamzarClientFactory
+
+
+class ZamzarClientRegistry:
+    """
+    Hands out a ZamzarClient per API key (e.g., one per customer of a multi-tenant service), creating each client on
+    first use and then reusing it, so that looking up the client for a request is a dictionary access.
+
+    Every client shares the connection pool of a single ZamzarClientFactory. Given a catalogue (or an API key with which
+    to retrieve one), every client also shares a single FormatsCatalogue, since the formats supported by the Zamzar API
+    do not depend on the API key; the catalogue is retrieved with its own client, never with that of a tenant.
+    Otherwise, each client retrieves its own catalogue.
+
+    Each client keeps its own credit ledgers and (optionally) its own rate limiter, since those are per-account. The
+    least recently used clients are evicted once more than max_clients are registered; an evicted client holds no
+    connections, so is simply recreated if used again. Note that its credit ledgers and rate limiter are recreated too,
+    so start empty: the remaining credits are unknown (and so a CreditGovernor admits jobs) until the next response
+    reports them, and the rate limiter no longer remembers recent requests or Retry-After penalties. Set max_clients to
+    at least the number of active tenants where that state matters.
+
+    Example usage:
+
+        ```python
+        from zamzar.facade import ZamzarClientRegistry
+
+        registry = ZamzarClientRegistry(max_clients=500, catalogue_api_key="YOUR_API_KEY_GOES_HERE")
+
+        def handle(request):
+            zamzar = registry.get(request.customer.zamzar_api_key)
+            return zamzar.convert(request.path, "pdf")
+        ```
+    """
+
+    def __init__(
+            self,
+            factory: Optional[ZamzarClientFactory] = None,
+            max_clients: int = 256,
+            catalogue: Optional[FormatsCatalogue] = None,
+            observers: Optional[List[RequestObserver]] = None,
+            rate_limiter_factory: Optional[Callable[[], RateLimiter]] = None,
+            catalogue_api_key: Optional[str] = None,
+    ):
+        """
+        :param factory: the factory with which to create clients (defaults to a factory for the PRODUCTION environment)
+        :param max_clients: the maximum number of clients to retain, after which the least recently used are evicted
+        :param catalogue: the formats catalogue to share between clients (default: see catalogue_api_key)
+        :param observers: observers to notify of every HTTP request made by any of the clients (e.g., a
+        HistogramCollector)
+        :param rate_limiter_factory: an optional callable that creates a RateLimiter for each new client
+        :param catalogue_api_key: if no catalogue is given, the API key with which to retrieve a catalogue to share
+        between clients (default: none, in which case each client retrieves its own catalogue)
+        """
+        if max_clients < 1:
+            raise ValueError("max_clients must be at least 1")
+
+        self.factory = factory or ZamzarClientFactory()
+        self.max_clients = max_clients
+        self.observers: List[RequestObserver] = list(observers or [])
+        if catalogue is None and catalogue_api_key is not None:
+            catalogue = FormatsCatalogue(self.__create_client(catalogue_api_key))
+        self.catalogue = catalogue
+        self.rate_limiter_factory = rate_limiter_factory
+        self.__clients: OrderedDict[str, ZamzarClient] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, api_key: str) -> ZamzarClient:
+        """Returns the client for the given API key, creating it if necessary."""
+        with self.__lock:
+            client = self.__clients.get(api_key)
+            if client is not None:
+                self.__clients.move_to_end(api_key)
+                return client
+
+            client = self.__create(api_key)
+            self.__clients[api_key] = client
+            while len(self.__clients) > self.max_clients:
+                self.__clients.popitem(last=False)
+            return client
+
+    def evict(self, api_key: str) -> Optional[ZamzarClient]:
+        """
+        Removes (and returns) the client for the given API key, if any (e.g., when a customer's key is revoked). The
+        client's credit ledgers and rate limiter are discarded with it.
+        """
+        with self.__lock:
+            return self.__clients.pop(api_key, None)
+
+    def clear(self):
+        """Removes every client (the shared connection pool and formats catalogue are retained)."""
+        with self.__lock:
+            self.__clients.clear()
+
+    def __contains__(self, api_key: str) -> bool:
+        with self.__lock:
+            return api_key in self.__clients
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__clients)
+
+    def __create(self, api_key: str) -> ZamzarClient:
+        rate_limiter = self.rate_limiter_factory() if self.rate_limiter_factory else None
+        client = self.__create_client(api_key, rate_limiter)
+        if self.catalogue is not None:
+            client.catalogue = self.catalogue
+        return client
+
+    def __create_client(self, api_key: str, rate_limiter: Optional[RateLimiter] = None) -> ZamzarClient:
+        # Observers are shared via the (mutable) list, so that observers added later apply to every client
+        client = self.factory.create(api_key, rate_limiter=rate_limiter)
+        client.pool_manager.observers = self.observers
+        return client
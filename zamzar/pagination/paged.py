@@ -24,6 +24,10 @@ class Paged(Generic[ITEM]):
     def items(self) -> List[ITEM]:
         return self._items
 
+    @property
+    def paging(self) -> Union[PagingNumeric, PagingString]:
+        return self._paging
+
     def next_page(self):
         return self._lister.list(anchor=after(self._paging.last), limit=self._paging.limit)
 
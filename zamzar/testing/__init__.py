@@ -0,0 +1,4 @@
+# flake8: noqa
+
+# import the mock server into the testing package
+from zamzar.testing.mock_server import MockZamzarServer
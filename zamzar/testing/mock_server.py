@@ -0,0 +1,669 @@
+"""
+An in-process mock of the Zamzar API, for tests and benchmarks that cannot (or should not) reach the real API.
+
+Run it as a standalone process with `python -m zamzar.testing.mock_server --port 8080`, or start it from Python:
+
+    ```python
+    from zamzar import ZamzarClient
+    from zamzar.testing import MockZamzarServer
+
+    with MockZamzarServer(conversion_latency=0.5) as server:
+        zamzar = ZamzarClient("any-api-key", host=server.url)
+        zamzar.convert("example.docx", "pdf").store("/tmp/")
+    ```
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import math
+import random
+import re
+import threading
+import time
+import zipfile
+from email.message import EmailMessage
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from urllib.parse import parse_qs, urlparse
+
+CREATED_AT = "2024-01-01T14:15:22Z"
+DEFAULT_PAGE_SIZE = 50
+FORMATS = sorted({"docx", "jpg", "mp3", "pdf", "png", "txt", "zip"} | {f"fmt{i:03d}" for i in range(120)})
+
+Resource = Dict[str, Any]
+
+
+class MockZamzarServer:
+    """
+    A pure-Python HTTP server that implements the resources of the Zamzar API (/account, /files, /files/{id}/content,
+    /formats, /imports and /jobs), pre-populated with the same fixtures as the zamzar-mock Docker image (e.g., file 1,
+    succeeding job 1, multi-output job 2, failing job 3, succeeding import 1, failing import 2).
+
+    Every response carries credit headers, and each job created deducts its credit cost from the relevant balance. The
+    behaviour of the server can be tuned to exercise a client under load:
+    - conversion_latency: the minimum time (in seconds) for which a new job is converting
+    - conversion_polls: the number of times a new job must be retrieved before it completes
+    - failure_rate: the fraction of new jobs that fail
+    - error_rate: the fraction of requests that are rejected with a (transient) 503 Service Unavailable
+    - rate_limit: the maximum sustained requests per second, beyond which requests are rejected with a 429 Too Many
+      Requests (and a Retry-After header)
+    - supports_ranges: whether file content can be retrieved in byte ranges (via a Range header)
+
+    Like zamzar-mock, the server also provides endpoints to reset its state (POST /__admin/scenarios/reset) and to
+    delete a job or import outright (POST /v1/jobs/{id}/destroy).
+    """
+
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            conversion_latency: float = 0.0,
+            conversion_polls: int = 2,
+            failure_rate: float = 0.0,
+            error_rate: float = 0.0,
+            rate_limit: Optional[float] = None,
+            supports_ranges: bool = True,
+            credits: int = 100,
+            test_credits: int = 50,
+            seed: Optional[int] = None,
+    ):
+        """
+        :param host: the interface on which to listen (default: 127.0.0.1)
+        :param port: the port on which to listen (default: 0, any free port; see `url`)
+        :param conversion_latency: the minimum time (in seconds) for which a new job is converting (default: 0)
+        :param conversion_polls: the number of times a new job must be retrieved before it completes (default: 2)
+        :param failure_rate: the fraction (0-1) of new jobs that fail (default: 0)
+        :param error_rate: the fraction (0-1) of requests that are rejected with a 503 (default: 0)
+        :param rate_limit: the maximum sustained requests per second (default: None, unlimited)
+        :param supports_ranges: whether file content can be retrieved in byte ranges (default: True)
+        :param credits: the initial balance of production credits (default: 100)
+        :param test_credits: the initial balance of sandbox (test) credits (default: 50)
+        :param seed: an optional seed for the injection of failures and errors, for reproducible runs
+        """
+        self.conversion_latency = conversion_latency
+        self.conversion_polls = conversion_polls
+        self.failure_rate = failure_rate
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.supports_ranges = supports_ranges
+        self.credits = credits
+        self.test_credits = test_credits
+        self.random = random.Random(seed)
+        self.lock = threading.RLock()
+        self.state = _MockState(self)
+        self.__tokens = rate_limit or 0.0
+        self.__refilled_at = time.monotonic()
+        self.__httpd = _MockHTTPServer((host, port), self)
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """The URL of the mock API (pass this as the host of a ZamzarClient)."""
+        host, port = self.__httpd.server_address[:2]
+        return f"http://{host!s}:{port}/v1"
+
+    def start(self) -> MockZamzarServer:
+        """Starts serving requests on a background thread."""
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__httpd.serve_forever, name="zamzar-mock", daemon=True)
+            self.__thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving requests, and closes the listening socket."""
+        if self.__thread is not None:
+            self.__httpd.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.__httpd.server_close()
+
+    def serve_forever(self):
+        """Serves requests on the calling thread until interrupted."""
+        self.__httpd.serve_forever()
+
+    def reset(self):
+        """Restores the fixtures (and the credit balances) to their initial state."""
+        with self.lock:
+            self.state = _MockState(self)
+
+    def __enter__(self) -> MockZamzarServer:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _admit(self) -> Optional[float]:
+        """Returns None if a request is admitted by the rate limit, else the number of seconds to wait."""
+        if not self.rate_limit:
+            return None
+        with self.lock:
+            now = time.monotonic()
+            self.__tokens = min(self.rate_limit, self.__tokens + (now - self.__refilled_at) * self.rate_limit)
+            self.__refilled_at = now
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+                return None
+            return (1 - self.__tokens) / self.rate_limit
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Accept bursts of connections (e.g., from benchmarks) without dropping any
+    request_queue_size = 128
+
+    def __init__(self, address: Tuple[str, int], mock: MockZamzarServer):
+        super().__init__(address, _MockHandler)
+        self.mock = mock
+
+
+class _MockState:
+    """The resources held by the mock server, which are replaced wholesale on reset."""
+
+    def __init__(self, server: MockZamzarServer):
+        self.server = server
+        self.credits = server.credits
+        self.test_credits = server.test_credits
+        self.files: Dict[int, Resource] = {}
+        self.content: Dict[int, bytes] = {}
+        self.jobs: Dict[int, Resource] = {}
+        self.imports: Dict[int, Resource] = {}
+        self.next_id = 100
+
+        for file_id in range(1, 8):
+            self.add_file(f"file{file_id}.txt", f"Content of file {file_id}\n".encode("utf-8"), file_id)
+
+        # Job 1 succeeds once it has been polled; job 2 has multiple outputs (and an export); job 3 has failed
+        self.add_file("converted.txt", b"Converted content\n", 20)
+        self.add_job(1, "txt", 1, target=20)
+        for index, name in enumerate(["a.png", "b.png", "c.png"], start=1):
+            self.add_file(name, _png(index), 20 + index)
+        self.add_file("converted.zip", _zip({"a.png": _png(1), "b.png": _png(2), "c.png": _png(3)}), 24)
+        self.add_file("source2.pdf", b"%PDF-1.4\n", 30)
+        self.add_job(2, "png", 30, status="successful", targets=[21, 22, 23, 24], export_url="s3://bucket/path")
+        self.add_file("source3.pdf", b"%PDF-1.4\n", 31)
+        self.add_job(3, "txt", 31, status="failed", failure={"code": 1, "message": "The conversion failed"})
+        for job_id in range(4, 8):
+            self.add_job(job_id, "txt", 1, status="successful", targets=[20])
+
+        # Import 1 succeeds once it has been polled; import 2 has failed
+        self.add_file("imported.txt", b"Imported content\n", 40)
+        self.add_import(1, "s3://bucket/imported.txt", target=40)
+        self.add_import(
+            2, "s3://bucket/missing.txt", status="failed", failure={"code": 2, "message": "The import failed"}
+        )
+        for import_id in range(3, 6):
+            self.add_import(import_id, "s3://bucket/imported.txt", status="successful", target=40)
+
+    def allocate_id(self) -> int:
+        self.next_id += 1
+        return self.next_id
+
+    def add_file(self, name: str, content: bytes, file_id: Optional[int] = None) -> Resource:
+        file_id = file_id if file_id is not None else self.allocate_id()
+        file = {
+            "id": file_id,
+            "key": "mock",
+            "name": name,
+            "size": len(content),
+            "format": name.rsplit(".", 1)[-1],
+            "created_at": CREATED_AT,
+        }
+        self.files[file_id] = file
+        self.content[file_id] = content
+        return file
+
+    def add_job(
+            self,
+            job_id: int,
+            target_format: str,
+            source: int,
+            status: str = "converting",
+            target: Optional[int] = None,
+            targets: Optional[List[int]] = None,
+            export_url: Optional[str] = None,
+            failure: Optional[Resource] = None,
+            sandbox: bool = True,
+    ) -> Resource:
+        job: Resource = {
+            "id": job_id,
+            "key": "mock",
+            "status": status,
+            "sandbox": sandbox,
+            "created_at": CREATED_AT,
+            "source_file": self.files.get(source),
+            "target_files": [self.files[file_id] for file_id in targets or []],
+            "target_format": target_format,
+            "credit_cost": 1,
+            "_target": target,
+            "_polls": 0,
+            "_started": time.monotonic(),
+        }
+        if status != "converting":
+            job["finished_at"] = CREATED_AT
+        if export_url:
+            job["export_url"] = export_url
+            if status == "successful":
+                job["exports"] = [{"id": 1, "url": f"{export_url}/a.png", "status": "successful"}]
+        if failure:
+            job["failure"] = failure
+        self.jobs[job_id] = job
+        return job
+
+    def add_import(
+            self,
+            import_id: int,
+            url: str,
+            status: str = "downloading",
+            target: Optional[int] = None,
+            failure: Optional[Resource] = None
+    ) -> Resource:
+        imported: Resource = {"id": import_id, "url": url, "status": status, "created_at": CREATED_AT, "_polls": 0}
+        if status == "successful" and target is not None:
+            imported["file"] = self.files[target]
+            imported["finished_at"] = CREATED_AT
+        else:
+            imported["_target"] = target
+        if failure:
+            imported["failure"] = failure
+        self.imports[import_id] = imported
+        return imported
+
+    def progress_job(self, job: Resource):
+        if job["status"] not in ("initialising", "converting"):
+            return
+        job["_polls"] += 1
+        elapsed = time.monotonic() - job["_started"]
+        if job["_polls"] < self.server.conversion_polls or elapsed < self.server.conversion_latency:
+            job["status"] = "converting"
+            return
+
+        job["finished_at"] = CREATED_AT
+        if job.get("_fails"):
+            job["status"] = "failed"
+            job["failure"] = {"code": 1, "message": "The conversion failed (injected by the mock server)"}
+            return
+        job["status"] = "successful"
+        job["target_files"] = [self.files[job["_target"]]] if job["_target"] in self.files else []
+        if job.get("export_url"):
+            job["exports"] = [{"id": 1, "url": job["export_url"], "status": "successful"}]
+
+    def progress_import(self, imported: Resource):
+        if imported["status"] not in ("initialising", "downloading"):
+            return
+        imported["_polls"] += 1
+        if imported["_polls"] >= self.server.conversion_polls:
+            imported["status"] = "successful"
+            imported["finished_at"] = CREATED_AT
+            imported["file"] = self.files.get(imported["_target"])
+
+    def charge(self, job: Resource):
+        if job["sandbox"]:
+            self.test_credits = max(0, self.test_credits - job["credit_cost"])
+        else:
+            self.credits = max(0, self.credits - job["credit_cost"])
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "ZamzarMock/1.0"
+    # Buffer each response (the buffer is flushed once the response is complete) and send it without delay
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    server: _MockHTTPServer
+    # The (parsed) body of the request, and the content of the response
+    form: Dict[str, Any]
+    content: bytes
+
+    @property
+    def mock(self) -> MockZamzarServer:
+        return self.server.mock
+
+    def log_message(self, format, *args):
+        pass
+
+    def handle_request(self):
+        self.form, self.content = {}, b""
+        self.respond()
+        # The headers of the response are buffered by the routes, and (like its content) only sent here, having released
+        # the lock, so that a slow client holds up no other requests
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(self.content)
+
+    def respond(self):
+        parsed = urlparse(self.path)
+        path = parsed.path[3:] if parsed.path.startswith("/v1") else parsed.path
+        query = {name: values[0] for name, values in parse_qs(parsed.query).items()}
+
+        if path == "/__admin/scenarios/reset":
+            self.read_body()
+            self.mock.reset()
+            return self.send_json(200, {})
+
+        wait = self.mock._admit()
+        if wait is not None:
+            self.read_body()
+            return self.send_errors(429, "Too many requests", {"Retry-After": str(max(1, math.ceil(wait)))})
+        if self.mock.error_rate and self.mock.random.random() < self.mock.error_rate:
+            self.read_body()
+            return self.send_errors(503, "Service unavailable (injected by the mock server)")
+
+        for method, pattern, route in _ROUTES:
+            match = re.fullmatch(pattern, path)
+            if match and self.command in method:
+                self.form = self.read_form()
+                with self.mock.lock:
+                    return route(self, self.mock.state, query, *match.groups())
+        self.read_body()
+        return self.send_errors(404, "Not found")
+
+    do_DELETE = do_GET = do_HEAD = do_POST = do_PUT = handle_request
+
+    # Routes
+
+    def get_welcome(self, state: _MockState, query):
+        return self.send_json(200, {"message": "Zamzar API v1 (mock)"})
+
+    def get_account(self, state: _MockState, query):
+        plan = {"name": "Mock", "price_per_month": 0, "conversions_per_month": 100, "maximum_file_size": 1048576}
+        return self.send_json(
+            200,
+            {"credits_remaining": state.credits, "test_credits_remaining": state.test_credits, "plan": plan},
+        )
+
+    def list_formats(self, state: _MockState, query):
+        formats = [_format(name) for name in FORMATS]
+        return self.send_json(200, _page(formats, "name", query))
+
+    def get_format(self, state: _MockState, query, name: str):
+        if name not in FORMATS:
+            return self.send_errors(404, "Format not found")
+        return self.send_json(200, _format(name))
+
+    def list_files(self, state: _MockState, query):
+        # Only list the files that zamzar-mock lists (i.e., not the outputs of the precanned jobs and imports)
+        files = [file for file_id, file in state.files.items() if file_id < 20 or file_id > 100]
+        return self.send_json(200, _page(files, "id", query))
+
+    def upload_file(self, state: _MockState, query):
+        form = self.form
+        if not isinstance(form.get("content"), tuple):
+            return self.send_errors(422, "The content of the file is required")
+        filename, content = form["content"]
+        return self.send_json(201, state.add_file(form.get("name") or filename, content))
+
+    def get_file(self, state: _MockState, query, file_id: str):
+        file = state.files.get(int(file_id))
+        return self.send_json(200, file) if file else self.send_errors(404, "File not found")
+
+    def delete_file(self, state: _MockState, query, file_id: str):
+        file = state.files.pop(int(file_id), None)
+        return self.send_json(200, file) if file else self.send_errors(404, "File not found")
+
+    def get_file_content(self, state: _MockState, query, file_id: str):
+        file = state.files.get(int(file_id))
+        if not file:
+            return self.send_errors(404, "File not found")
+        return self.send_content(state.content[file["id"]], file["name"])
+
+    def list_jobs(self, state: _MockState, query):
+        return self.send_json(200, _page([_visible(job) for job in state.jobs.values()], "id", query))
+
+    def list_successful_jobs(self, state: _MockState, query):
+        jobs = [_visible(job) for job in state.jobs.values() if job["status"] == "successful"]
+        return self.send_json(200, _page(jobs, "id", query))
+
+    def create_job(self, state: _MockState, query):
+        form = self.form
+        target_format = form.get("target_format")
+        if not target_format or target_format not in FORMATS:
+            return self.send_errors(422, "The target format is not supported")
+
+        source = form.get("source_file")
+        if isinstance(source, tuple):
+            source = state.add_file(source[0], source[1])["id"]
+        elif isinstance(source, str) and source.isdigit():
+            source = int(source)
+        elif isinstance(source, str):
+            source = state.add_file(source.rsplit("/", 1)[-1] or "source", b"Imported content\n")["id"]
+        if source not in state.files:
+            return self.send_errors(422, "The source file does not exist")
+
+        target = state.add_file(f"converted.{target_format}", b"Converted content\n")
+        job = state.add_job(state.allocate_id(), target_format, source, "initialising", target["id"],
+                            export_url=form.get("export_url"))
+        job["_fails"] = self.mock.random.random() < self.mock.failure_rate
+        if form.get("options"):
+            job["options"] = json.loads(form["options"])
+        state.charge(job)
+        return self.send_json(201, _visible(job))
+
+    def get_job(self, state: _MockState, query, job_id: str):
+        job = state.jobs.get(int(job_id))
+        if not job:
+            return self.send_errors(404, "Job not found")
+        state.progress_job(job)
+        return self.send_json(200, _visible(job))
+
+    def cancel_job(self, state: _MockState, query, job_id: str):
+        job = state.jobs.get(int(job_id))
+        if not job:
+            return self.send_errors(404, "Job not found")
+        job["status"] = "cancelled"
+        return self.send_json(200, _visible(job))
+
+    def list_imports(self, state: _MockState, query):
+        return self.send_json(200, _page([_visible(imported) for imported in state.imports.values()], "id", query))
+
+    def start_import(self, state: _MockState, query):
+        form = self.form
+        url = form.get("url", "")
+        filename = form.get("filename") or urlparse(url).path.rsplit("/", 1)[-1]
+        # Like zamzar-mock, the name of a file at a URL containing "unknown" cannot be determined from the URL
+        if not url or not filename or ("unknown" in url and not form.get("filename")):
+            return self.send_errors(422, "The name of the file to import cannot be determined; specify a filename")
+        target = state.add_file(filename, b"Imported content\n")
+        imported = state.add_import(state.allocate_id(), url, "initialising", target["id"])
+        return self.send_json(201, _visible(imported))
+
+    def get_import(self, state: _MockState, query, import_id: str):
+        imported = state.imports.get(int(import_id))
+        if not imported:
+            return self.send_errors(404, "Import not found")
+        state.progress_import(imported)
+        return self.send_json(200, _visible(imported))
+
+    def destroy(self, state: _MockState, query, resource: str, resource_id: str):
+        resources = {"files": state.files, "imports": state.imports, "jobs": state.jobs}[resource]
+        if resources.pop(int(resource_id), None) is None:
+            return self.send_errors(404, "Not found")
+        return self.send_json(200, {})
+
+    # Requests and responses
+
+    def read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while size := int(self.rfile.readline().split(b";")[0].strip(), 16):
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            self.rfile.readline()
+            return b"".join(chunks)
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def read_form(self) -> Dict[str, Any]:
+        body = self.read_body()
+        content_type = self.headers.get("Content-Type", "")
+        if not content_type.startswith("multipart/form-data"):
+            return {name: values[0] for name, values in parse_qs(body.decode("utf-8")).items()}
+
+        # The default policy parses into an EmailMessage (whose parts can be iterated), though typeshed types a Message
+        message = cast(EmailMessage, BytesParser(policy=default_policy).parsebytes(
+            b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+        ))
+        form: Dict[str, Any] = {}
+        for part in message.iter_parts():
+            name = str(part.get_param("name", header="content-disposition"))
+            content = part.get_payload(decode=True)
+            assert isinstance(content, bytes)
+            filename = part.get_filename()
+            form[name] = (filename, content) if filename is not None else content.decode("utf-8")
+        return form
+
+    def send_json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None):
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.send_credit_headers()
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.content = content
+
+    def send_errors(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        self.send_json(status, {"errors": [{"code": status, "message": message}]}, headers)
+
+    def send_credit_headers(self):
+        state = self.mock.state
+        self.send_header("Zamzar-Credits-Remaining", str(state.credits))
+        self.send_header("Zamzar-Test-Credits-Remaining", str(state.test_credits))
+
+    def send_content(self, content: bytes, name: str):
+        status, start, end = 200, 0, len(content) - 1
+        requested = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if requested and self.mock.supports_ranges:
+            start = int(requested.group(1))
+            end = min(int(requested.group(2) or end), end)
+            if start >= len(content):
+                return self.send_unsatisfiable_range(len(content))
+            status = 206
+
+        chunk = content[start:end + 1]
+        self.send_response(status)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(chunk)))
+        self.send_header("Content-Disposition", f'attachment; filename="{name}"')
+        if self.mock.supports_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(content)}")
+        self.send_credit_headers()
+        self.content = chunk
+
+    def send_unsatisfiable_range(self, length: int):
+        self.send_response(416)
+        self.send_header("Content-Range", f"bytes */{length}")
+        self.send_header("Content-Length", "0")
+        self.send_credit_headers()
+
+
+_ROUTES: List[Tuple[Tuple[str, ...], str, Callable[..., None]]] = [
+    (("GET", "HEAD"), r"/?", _MockHandler.get_welcome),
+    (("GET",), r"/account", _MockHandler.get_account),
+    (("GET",), r"/formats", _MockHandler.list_formats),
+    (("GET",), r"/formats/([^/]+)", _MockHandler.get_format),
+    (("GET",), r"/files", _MockHandler.list_files),
+    (("POST",), r"/files", _MockHandler.upload_file),
+    (("GET",), r"/files/(\d+)", _MockHandler.get_file),
+    (("DELETE",), r"/files/(\d+)", _MockHandler.delete_file),
+    (("GET", "HEAD"), r"/files/(\d+)/content", _MockHandler.get_file_content),
+    (("GET",), r"/jobs", _MockHandler.list_jobs),
+    (("POST",), r"/jobs", _MockHandler.create_job),
+    (("GET",), r"/jobs/successful", _MockHandler.list_successful_jobs),
+    (("GET",), r"/jobs/(\d+)", _MockHandler.get_job),
+    (("DELETE",), r"/jobs/(\d+)", _MockHandler.cancel_job),
+    (("GET",), r"/imports", _MockHandler.list_imports),
+    (("POST",), r"/imports", _MockHandler.start_import),
+    (("GET",), r"/imports/(\d+)", _MockHandler.get_import),
+    (("POST",), r"/(files|imports|jobs)/(\d+)/destroy", _MockHandler.destroy),
+]
+
+
+def _page(items: List[Resource], key: str, query: Dict[str, str]) -> Resource:
+    """Returns a page of items, in the order and with the paging metadata of the Zamzar API."""
+    numeric = key == "id"
+    # Numeric IDs are listed most recent (i.e., highest) first, and names alphabetically
+    items = sorted(items, key=lambda item: -item[key] if numeric else item[key])
+    limit = int(query.get("limit", DEFAULT_PAGE_SIZE))
+
+    def position(value: str) -> Any:
+        return -int(value) if numeric else value
+
+    def order(item: Resource) -> Any:
+        return -item[key] if numeric else item[key]
+
+    if "after" in query:
+        selected = [item for item in items if order(item) > position(query["after"])][:limit]
+    elif "before" in query:
+        selected = [item for item in items if order(item) < position(query["before"])][-limit:]
+    else:
+        selected = items[:limit]
+
+    paging: Resource = {"total_count": len(items), "limit": limit}
+    if selected:
+        paging["first"] = selected[0][key]
+        paging["last"] = selected[-1][key]
+    return {"data": selected, "paging": paging}
+
+
+def _format(name: str) -> Resource:
+    return {"name": name, "targets": [{"name": "pdf", "credit_cost": 1}, {"name": "txt", "credit_cost": 2}]}
+
+
+def _visible(resource: Resource) -> Resource:
+    """Returns the resource without the fields that the mock server uses internally."""
+    return {name: value for name, value in resource.items() if not name.startswith("_")}
+
+
+def _png(seed: int) -> bytes:
+    return b"\x89PNG\r\n\x1a\n" + bytes([seed]) * 64
+
+
+def _zip(files: Dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs a mock of the Zamzar API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--conversion-latency", type=float, default=0.0, help="minimum seconds for which jobs convert")
+    parser.add_argument("--conversion-polls", type=int, default=2, help="polls before a job completes")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of jobs that fail")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests rejected with a 503")
+    parser.add_argument("--rate-limit", type=float, default=None, help="maximum sustained requests per second")
+    parser.add_argument("--no-ranges", action="store_true", help="ignore Range headers when serving content")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = MockZamzarServer(
+        host=args.host,
+        port=args.port,
+        conversion_latency=args.conversion_latency,
+        conversion_polls=args.conversion_polls,
+        failure_rate=args.failure_rate,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        supports_ranges=not args.no_ranges,
+        seed=args.seed,
+    )
+    print(f"Serving a mock of the Zamzar API at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Pytest fixtures for testing code that uses the Zamzar API against an in-process mock server.
+
+Enable them with `pytest_plugins = ["zamzar.testing.pytest_plugin"]` in a top-level conftest.py (or by importing the
+fixtures into any conftest.py).
+"""
+from typing import Iterator
+
+import pytest
+
+from zamzar import ZamzarClient
+from zamzar.testing.mock_server import MockZamzarServer
+
+
+@pytest.fixture(scope="session")
+def zamzar_mock_server() -> Iterator[MockZamzarServer]:
+    """A mock of the Zamzar API, shared by every test in the session (reset it with `zamzar_mock`)."""
+    with MockZamzarServer() as server:
+        yield server
+
+
+@pytest.fixture
+def zamzar_mock(zamzar_mock_server: MockZamzarServer) -> MockZamzarServer:
+    """The mock of the Zamzar API, reset to its initial state for the current test."""
+    zamzar_mock_server.reset()
+    return zamzar_mock_server
+
+
+@pytest.fixture
+def zamzar_mock_client(zamzar_mock: MockZamzarServer) -> ZamzarClient:
+    """A ZamzarClient which makes its requests to the mock of the Zamzar API."""
+    return ZamzarClient("mock-api-key", host=zamzar_mock.url)